@@ -0,0 +1,17 @@
+# Gunicorn settings for production: gunicorn -c gunicorn_conf.py main:app
+import multiprocessing
+import os
+
+# UvicornWorker (from the uvicorn-worker package; uvicorn.workers is deprecated) picks uvloop and httptools
+# automatically when they are installed (uvicorn[standard])
+worker_class = "uvicorn_worker.UvicornWorker"
+# Workers are async, so one per core is enough; the AI calls are I/O bound
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+bind = os.getenv("BIND", "0.0.0.0:8000")
+backlog = 2048
+# Longer than the usual 60s load balancer idle timeout so the proxy never reuses a connection we just closed
+keepalive = 75
+# For async workers this is a heartbeat timeout, not a request limit: the worker is only restarted if its event
+# loop stays blocked this long. Slow AI calls are bounded by OPENAI_TIMEOUT and OPENAI_MAX_RETRIES instead
+timeout = 120
+graceful_timeout = 30
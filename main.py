@@ -1,148 +1,710 @@
 #I am Quadri Lasisi, The backend engineer of the project ReclaimMe and this is the main.py
 import os
-import json
+import asyncio
+import collections
+import logging
+import logging.handlers
+import queue
 import io
-from fastapi import FastAPI, HTTPException, Body
-from pydantic import BaseModel, Field
-from openai import AsyncOpenAI
+import hashlib
+import re
+import functools
+import time
+import types
+from contextlib import asynccontextmanager
+from pathlib import Path
+import numpy as np
+import orjson
+import jiter
+from cachetools import TTLCache
+from fastapi import FastAPI, HTTPException, Body, Request, Response, status
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+from openai import AsyncOpenAI, DefaultAioHttpClient, Timeout
 from dotenv import load_dotenv
-from fastapi.responses import StreamingResponse
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.datastructures import Headers
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.middleware.gzip import DEFAULT_EXCLUDED_CONTENT_TYPES
 
 load_dotenv()
 
+# Logging goes through a queue and is written by a listener thread, so a slow stdout never blocks the event loop
+logger = logging.getLogger(__name__)
+logger.setLevel(os.getenv("LOG_LEVEL", "INFO"))
+logger.propagate = False
+log_queue = queue.SimpleQueue()
+logger.addHandler(logging.handlers.QueueHandler(log_queue))
+log_handler = logging.StreamHandler()
+log_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+log_listener = logging.handlers.QueueListener(log_queue, log_handler, respect_handler_level=True)
+
+# Per-worker resources are created on startup, never at import, so forked workers (gunicorn --preload) don't share them
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global client, openai_semaphore
+    log_listener.start()
+    loop = asyncio.get_running_loop()
+    logger.info("Worker %s running on %s.%s", os.getpid(), type(loop).__module__, type(loop).__name__)
+    check_prompt_files()
+    # One shared client on the aiohttp transport, which holds up far better than the default httpx one under concurrent requests
+    client = AsyncOpenAI(api_key=api_key, http_client=DefaultAioHttpClient(), timeout=OPENAI_TIMEOUT, max_retries=OPENAI_MAX_RETRIES)
+    openai_semaphore = asyncio.Semaphore(OPENAI_CONCURRENCY)
+    if OPENAI_WARMUP:
+        await warm_up_openai()
+    yield
+    await client.close()
+    log_listener.stop()
+
 # Starting FastAPI app........
 app = FastAPI(
     title="ReclaimMe API - Scam Assistance",
     description="Generates highly detailed and tailored documents, and provides support for various scam types to assist victims in Nigeria using a single endpoint.",
-    version="2.2.2" # Incremented version for full prompt population
+    version="2.2.2", # Incremented version for full prompt population
+    lifespan=lifespan
 )
 
-origins = [
-    "http://localhost",
-    "http://localhost:3000",
-    "http://localhost:8080",
-    "http://127.0.0.1",
-    "http://127.0.0.1:5500",
-    "null",
-    "https://reclaim-me.vercel.app" 
-]
+# Reject oversized bodies before they are read and parsed; a full report is a few KB, so this only stops abuse....
+MAX_REQUEST_BODY_BYTES = int(os.getenv("MAX_REQUEST_BODY_BYTES", "65536"))
+
+class RequestBodyLimitMiddleware:
+    def __init__(self, app, max_body_bytes: int):
+        self.app = app
+        self.max_body_bytes = max_body_bytes
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        detail = f"Request body exceeds {self.max_body_bytes} bytes."
+        content_length = Headers(scope=scope).get("content-length")
+        if content_length is not None and content_length.isdigit() and int(content_length) > self.max_body_bytes:
+            await JSONResponse({"detail": detail}, status_code=status.HTTP_413_CONTENT_TOO_LARGE)(scope, receive, send)
+            return
+
+        # Chunked bodies have no Content-Length, so count them as they arrive; FastAPI re-raises
+        # an HTTPException from the body read, so it reaches the client as a normal 413
+        received = 0
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_bytes:
+                    raise HTTPException(status_code=status.HTTP_413_CONTENT_TOO_LARGE, detail=detail)
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+app.add_middleware(RequestBodyLimitMiddleware, max_body_bytes=MAX_REQUEST_BODY_BYTES)
+
+# Local dev (localhost / 127.0.0.1 on any port, and "null" from file:// pages) is matched by one precompiled regex....
+origins = frozenset({
+    "https://reclaim-me.vercel.app",
+})
+local_origin_regex = r"^(https?://localhost(:\d+)?|https?://127\.0\.0\.1(:\d+)?|null)$"
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
+    allow_origin_regex=local_origin_regex,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# The four documents are several KB of repetitive text, so gzip them; the NDJSON stream is left alone
+# because compressing it would hold deltas back in the compressor instead of flushing them.....
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=4096,
+    compresslevel=5,
+    exclude_content_types=DEFAULT_EXCLUDED_CONTENT_TYPES + ("application/x-ndjson",),
+)
+
 # Getting the OpenAI key....
 api_key = os.getenv("OPENAI_API_KEY")
 if not api_key:
     raise RuntimeError("OPENAI_API_KEY environment variable not set. Please create a .env file.")
-client = AsyncOpenAI(api_key=api_key)
+client: AsyncOpenAI = None # Created per worker in lifespan()
+# Fail fast on a dead connection, but leave room for a full fallback-model draft; the SDK default read timeout is 10 minutes....
+OPENAI_TIMEOUT = Timeout(float(os.getenv("OPENAI_TIMEOUT", "90")), connect=float(os.getenv("OPENAI_CONNECT_TIMEOUT", "5")))
+OPENAI_MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", "2"))
+# Opt-in: open the pooled connection to OpenAI at startup so the first victim doesn't pay the TCP/TLS handshake....
+OPENAI_WARMUP = os.getenv("OPENAI_WARMUP", "false").lower() == "true"
+
+async def warm_up_openai() -> None:
+    try:
+        # A models listing is free and needs no prompt, unlike a dummy completion per scam type
+        await client.with_options(timeout=OPENAI_TIMEOUT.connect * 2, max_retries=0).models.list()
+        logger.info("OpenAI connection warmed up.")
+    except Exception as e:
+        # Never block startup on this; the first real request just opens the connection itself
+        logger.warning("OpenAI warm-up failed, continuing without it: %s", e)
 
 # --- Existing Pydantic Models ---
 class Beneficiary(BaseModel):
-    name: str = Field(..., example="Scammer X", description="Name of the beneficiary")
-    bank: str = Field(..., example="FakeBank Plc", description="Bank name")
-    account: str = Field(..., example="0123456789", description="Account number")
+    model_config = ConfigDict(defer_build=True)
+
+    name: str = Field(..., max_length=200, example="Scammer X", description="Name of the beneficiary")
+    bank: str = Field(..., max_length=200, example="FakeBank Plc", description="Bank name")
+    account: str = Field(..., max_length=50, example="0123456789", description="Account number")
 
 class ScamReportData(BaseModel):
-    name: str = Field(..., example="Amina Bello", description="Victim's full name.")
-    phone: str = Field(..., example="+2348012345678", description="Victim's phone number.")
-    email: str = Field(..., example="amina.bello@example.com", description="Victim's email address.")
-    address: str = Field(..., example="123 Adetokunbo Ademola Crescent, Victoria Island, Lagos", description="Victim's residential address.")
-    scamType: str = Field(..., description="The specific type of scam selected by the user from a predefined list")
-    dateTime: str = Field(..., example="19/05/2025", description="Date and time of the incident or discovery.")
-    description: str = Field(..., example="A detailed narrative of what happened", description="Victim's detailed description of the scam.")
+    name: str = Field(..., max_length=200, example="Amina Bello", description="Victim's full name.")
+    phone: str = Field(..., max_length=50, example="+2348012345678", description="Victim's phone number.")
+    email: str = Field(..., max_length=320, example="amina.bello@example.com", description="Victim's email address.")
+    address: str = Field(..., max_length=500, example="123 Adetokunbo Ademola Crescent, Victoria Island, Lagos", description="Victim's residential address.")
+    scamType: str = Field(..., max_length=100, description="The specific type of scam selected by the user from a predefined list")
+    dateTime: str = Field(..., max_length=100, example="19/05/2025", description="Date and time of the incident or discovery.")
+    description: str = Field(..., max_length=20000, example="A detailed narrative of what happened", description="Victim's detailed description of the scam.")
     amount: float = Field(None, example=50000.00, description="Amount of money lost, if applicable.")
-    currency: str = Field(None, example="NGN", description="Currency of the amount lost")
-    paymentMethod: str = Field(None, example="Bank Transfer to Zenith Bank", description="Method used for payment, if applicable.")
+    currency: str = Field(None, max_length=10, example="NGN", description="Currency of the amount lost")
+    paymentMethod: str = Field(None, max_length=200, example="Bank Transfer to Zenith Bank", description="Method used for payment, if applicable.")
     beneficiary: Beneficiary = Field(None, description="Beneficiary information if available")
 
 class GeneratedDocuments(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     consoling_message: str = Field(..., description="A supportive and consoling message for the victim, to be displayed first.")
     police_report_draft: str = Field(..., description="Draft text for a police report.")
     bank_complaint_email: str = Field(..., description="Draft text for an email to the victim's bank. Can be 'Not Applicable'.")
     next_steps_checklist: str = Field(..., description="A checklist of recommended next actions for the victim.")
     
-# Global variable to store the loaded 
-
+# Exact-match cache of generated documents, keyed by a hash of the system prompt + report data.....
+# Entries expire after DOCUMENT_CACHE_TTL seconds so victims' details aren't held in memory indefinitely.
+DOCUMENT_CACHE_SIZE = int(os.getenv("DOCUMENT_CACHE_SIZE", "512"))
+DOCUMENT_CACHE_TTL = float(os.getenv("DOCUMENT_CACHE_TTL", "3600"))
+document_cache: "TTLCache[str, GeneratedDocuments]" = TTLCache(maxsize=DOCUMENT_CACHE_SIZE, ttl=DOCUMENT_CACHE_TTL)
+
+def make_document_cache_key(system_prompt: str, report_json: str) -> str:
+    return hashlib.blake2b((system_prompt + report_json).encode()).hexdigest()
+
+# The ETag names the input (prompt + report), not the output: drafts are sampled at temperature 0.6, so a
+# regenerated set differs byte-wise once the cached one expires. Hence weak, and only honoured while the
+# documents it was issued for are still in document_cache....
+def make_document_etag(cache_key: str) -> str:
+    return f'W/"{cache_key[:32]}"'
+
+# Reports carry personal details, so only the victim's own browser may keep a copy....
+DOCUMENT_CACHE_CONTROL = os.getenv("DOCUMENT_CACHE_CONTROL", "private, max-age=300")
+
+def document_cache_headers(etag: str) -> dict[str, str]:
+    return {"ETag": etag, "Cache-Control": DOCUMENT_CACHE_CONTROL}
+
+# If-None-Match uses weak comparison, so W/ prefixes are ignored on both sides
+def etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    etag = etag.removeprefix("W/")
+    return if_none_match.strip() == "*" or etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+
+# RFC 9110 says a failed If-None-Match on a POST should get 412, but these POSTs are really reads of the
+# documents for a report, so a client that already holds them gets 304 like a GET would. Only answered when
+# documents for this report were actually produced and are still cached; otherwise the request is generated as usual.
+def holds_cached_documents(request: Request, cache_key: str, etag: str) -> bool:
+    return cache_key in document_cache and etag_matches(request, etag)
+
+# Semantic cache for near-duplicate reports (opt-in, since it reuses documents written for another victim).....
+# Descriptions are embedded and compared by cosine similarity within the same scam type; on a hit the
+# cached documents are rewritten with the new victim's personal details instead of calling GPT-4o again.
+# Only the personal details are swapped: the narrative the model wrote from the other victim's description
+# is reused unchanged, which is why this stays off by default.
+# Entries hold full reports, so they follow document_cache's limits: at most SEMANTIC_CACHE_SIZE in total,
+# each dropped DOCUMENT_CACHE_TTL seconds after it was stored.
+SEMANTIC_CACHE_ENABLED = os.getenv("SEMANTIC_CACHE_ENABLED", "false").lower() == "true"
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.95"))
+SEMANTIC_CACHE_SIZE = int(os.getenv("SEMANTIC_CACHE_SIZE", str(DOCUMENT_CACHE_SIZE)))
+EMBEDDING_MODEL = os.getenv("OPENAI_EMBEDDING_MODEL", "text-embedding-3-small")
+
+# Matrix of L2-normalised embeddings (one row per entry), and the matching (stored_at, report_data, documents)
+# entries, oldest first
+semantic_vectors: np.ndarray = None
+semantic_entries: list[tuple[float, ScamReportData, GeneratedDocuments]] = []
+
+# Fields that are substituted into cached documents on a hit
+PERSONAL_DETAIL_FIELDS = ("name", "phone", "email", "address", "dateTime")
+# Financial details can't be reliably rewritten in free text, so a hit requires them to match exactly
+FINANCIAL_DETAIL_FIELDS = {"amount", "currency", "paymentMethod", "beneficiary"}
+
+async def embed_description(description: str) -> np.ndarray:
+    # Counts against the same per-process limit as the chat completions
+    async with openai_semaphore:
+        response = await client.embeddings.create(model=EMBEDDING_MODEL, input=description)
+    vector = np.asarray(response.data[0].embedding, dtype=np.float32)
+    return vector / np.linalg.norm(vector)
+
+def expire_semantic_entries() -> None:
+    global semantic_vectors, semantic_entries
+    # Entries are appended in time order, so the expired ones are always at the front
+    expires_before = time.monotonic() - DOCUMENT_CACHE_TTL
+    expired = 0
+    while expired < len(semantic_entries) and semantic_entries[expired][0] <= expires_before:
+        expired += 1
+    if expired:
+        semantic_vectors = semantic_vectors[expired:]
+        semantic_entries = semantic_entries[expired:]
+
+def find_semantic_match(report_data: ScamReportData, vector: np.ndarray):
+    expire_semantic_entries()
+    if not semantic_entries:
+        return None
+    scores = semantic_vectors @ vector
+    same_type = np.fromiter((entry[1].scamType == report_data.scamType for entry in semantic_entries), dtype=bool, count=len(semantic_entries))
+    scores[~same_type] = -1.0
+    best = int(np.argmax(scores))
+    if scores[best] < SEMANTIC_CACHE_THRESHOLD:
+        return None
+    _, cached_report, cached_documents = semantic_entries[best]
+    if cached_report.model_dump(include=FINANCIAL_DETAIL_FIELDS) != report_data.model_dump(include=FINANCIAL_DETAIL_FIELDS):
+        return None
+    return cached_report, cached_documents
+
+def store_semantic_match(report_data: ScamReportData, vector: np.ndarray, documents: GeneratedDocuments) -> None:
+    global semantic_vectors, semantic_entries
+    expire_semantic_entries()
+    if semantic_vectors is None:
+        semantic_vectors = np.empty((0, vector.shape[0]), dtype=np.float32)
+    semantic_vectors = np.vstack([semantic_vectors, vector])[-SEMANTIC_CACHE_SIZE:]
+    semantic_entries = (semantic_entries + [(time.monotonic(), report_data, documents)])[-SEMANTIC_CACHE_SIZE:]
+
+# Values shorter than this (e.g. a two-letter name) would match inside ordinary words of the legal text
+PERSONALIZE_MIN_VALUE_LENGTH = int(os.getenv("PERSONALIZE_MIN_VALUE_LENGTH", "4"))
+# Name/address/email words at least this long are looked for after substitution, since the model rarely
+# repeats a detail verbatim ("Dear Amina", "AMINA BELLO", "Ms Bello")
+PERSONAL_TOKEN_MIN_LENGTH = 3
+MONTH_NAMES = ("January", "February", "March", "April", "May", "June", "July", "August", "September", "October", "November", "December")
+DAY_FIRST_DATE = re.compile(r"\b(\d{1,2})[/.-](\d{1,2})[/.-](\d{4})\b")
+ISO_DATE = re.compile(r"\b(\d{4})-(\d{1,2})-(\d{1,2})\b")
+
+def parse_incident_date(value: str):
+    """(day, month, year) from the first numeric date in value, read day-first as in Nigeria; None if there isn't one."""
+    if match := ISO_DATE.search(value):
+        year, month, day = map(int, match.groups())
+    elif match := DAY_FIRST_DATE.search(value):
+        day, month, year = map(int, match.groups())
+    else:
+        return None
+    return (day, month, year) if 1 <= day <= 31 and 1 <= month <= 12 else None
+
+def incident_date_patterns(day: int, month: int, year: int) -> list[str]:
+    month_name = MONTH_NAMES[month - 1]
+    month_word = rf"{month_name[:3]}[a-z]*\.?"
+    day_word = rf"0?{day}(?:st|nd|rd|th)?"
+    return [
+        rf"\b{day_word}\s+(?:of\s+)?{month_word}\b", # 19th May 2025, 19 of May
+        rf"\b{month_word}\s+{day_word}\b", # May 19, 2025
+        rf"\b0?{day}[/.-]0?{month}[/.-]{year}\b",
+        rf"\b{year}-0?{month}-0?{day}\b",
+    ]
 
+def leftover_personal_details(fields: dict, cached_report: ScamReportData, report_data: ScamReportData) -> list[str]:
+    """Pieces of the cached victim's details that still appear anywhere in the documents (case-insensitive)."""
+    text = "\n".join(fields.values())
+    changed = [name for name in PERSONAL_DETAIL_FIELDS if getattr(cached_report, name) and getattr(cached_report, name) != getattr(report_data, name)]
+    # Words the new victim's own details contain are expected in the documents (e.g. both live in Lagos)
+    new_words = {word.lower() for name in PERSONAL_DETAIL_FIELDS for word in re.findall(r"\w+", getattr(report_data, name) or "")}
+    patterns = []
+    words = set()
+    for name in changed:
+        old_value = getattr(cached_report, name)
+        patterns.append(re.escape(old_value))
+        if name in ("name", "address"):
+            words.update(re.findall(r"\w+", old_value))
+        elif name == "email":
+            local_part = old_value.split("@")[0]
+            words.update(re.findall(r"\w+", local_part))
+            if len(local_part) >= PERSONAL_TOKEN_MIN_LENGTH:
+                patterns.append(re.escape(local_part))
+        elif name == "dateTime":
+            old_date = parse_incident_date(old_value)
+            if old_date and old_date != parse_incident_date(report_data.dateTime or ""):
+                patterns.extend(incident_date_patterns(*old_date))
+    patterns.extend(rf"(?<!\w){re.escape(word)}(?!\w)" for word in words if len(word) >= PERSONAL_TOKEN_MIN_LENGTH and word.lower() not in new_words)
+    leftovers = [match.group() for pattern in patterns for match in [re.search(pattern, text, re.IGNORECASE)] if match]
+    if "phone" in changed:
+        # Compare digits only, and only the trailing 10 so "+234 801 ..." and "0801..." both count
+        old_digits = re.sub(r"\D", "", cached_report.phone)[-10:]
+        if len(old_digits) >= 7 and old_digits in re.sub(r"[\s().+-]", "", text):
+            leftovers.append(cached_report.phone)
+    return leftovers
+
+def personalize_cached_documents(documents: GeneratedDocuments, cached_report: ScamReportData, report_data: ScamReportData):
+    """Returns the documents rewritten for report_data, or None if the old victim's details can't be swapped out safely."""
+    replacements = {}
+    for field_name in PERSONAL_DETAIL_FIELDS:
+        old_value = getattr(cached_report, field_name)
+        new_value = getattr(report_data, field_name)
+        if not old_value or old_value == new_value:
+            continue
+        if len(old_value) < PERSONALIZE_MIN_VALUE_LENGTH or replacements.get(old_value, new_value) != new_value:
+            return None
+        replacements[old_value] = new_value
+    if not replacements:
+        return documents
+    # One pass over whole-word matches, longest value first, so a replacement is never rewritten by a later field
+    pattern = re.compile(r"(?<!\w)(?:" + "|".join(map(re.escape, sorted(replacements, key=len, reverse=True))) + r")(?!\w)")
+    fields = {key: pattern.sub(lambda match: replacements[match.group()], text) for key, text in documents.model_dump().items()}
+    # The previous victim's details must never reach someone else, so anything the substitution missed is a cache miss
+    leftovers = leftover_personal_details(fields, cached_report, report_data)
+    if leftovers:
+        logger.info("Semantic cache hit still mentions %s detail(s) of the cached report, generating afresh", len(leftovers))
+        return None
+    # The fields come from documents that were already validated, so skip re-validation here
+    return GeneratedDocuments.model_construct(**fields)
 
 # Begin Document Generation....
+# The user prompt is a module-level template filled with str.format_map, instead of an f-string rebuilt on every call
+# Static instructions first and victim details last, so the cacheable prefix runs past the system prompt into the user message....
+USER_PROMPT_TEMPLATE = """
+    Ensure your response is a valid JSON object adhering to the structure specified in your system instructions.
+    The content should be empathetic, professional, actionable, and highly relevant to a victim in Nigeria.
+    If a bank email is not applicable for this specific scam type as per your system instructions, the value for "bank_complaint_email" should be "Not Applicable for this scam type."
+
+    Please generate a consoling message first, followed by the tailored documents (police report draft, bank complaint email, next steps checklist)
+    based on the detailed system instructions you have received, and the victim-provided details below.
+
+    A user in Nigeria has been a victim of a {scam_type}.
+    - Victim's Name: {name}
+    - Victim's Phone Number: {phone}
+    - Victim's Email Address: {email}
+    - Victim's Residential Address: {address}
+    - Date and Time of Incident/Discovery: {dateTime}
+    - Detailed Description of the Incident: {description}
+    - Amount Lost (if applicable): {amount}
+    - Payment Method Used (if applicable): {paymentMethod}
+    - Currency (if applicable): {currency}
+    - Beneficiary Details (if applicable): {beneficiary}
+    """
+
+def build_user_prompt(report_data: ScamReportData, specific_scam_type_for_user_message: str) -> str:
+    # One flat mapping built in a single pass over the model, then one format_map call; empty fields read as "Not specified"....
+    prompt_fields = {key: value or "Not specified" for key, value in report_data}
+    if report_data.amount:
+        # Two decimals, so the amount reads as money (50000.00, not 50000.0) and the drafts quote it that way
+        prompt_fields["amount"] = f"{report_data.amount:.2f}"
+    beneficiary = report_data.beneficiary
+    if beneficiary:
+        prompt_fields["beneficiary"] = f"Name: {beneficiary.name}, Bank: {beneficiary.bank}, Account: {beneficiary.account}"
+    prompt_fields["scam_type"] = specific_scam_type_for_user_message
+    return USER_PROMPT_TEMPLATE.format_map(prompt_fields)
+
+# Model tiers: drafts go to the cheaper, faster model first and only fall back to the larger one when its output isn't usable.....
+PRIMARY_MODEL = os.getenv("OPENAI_PRIMARY_MODEL", "gpt-4o-mini")
+FALLBACK_MODEL = os.getenv("OPENAI_FALLBACK_MODEL", "gpt-4o")
+# A primary-model checklist shorter than this is treated as a failed draft and regenerated with the fallback model
+MIN_CHECKLIST_LENGTH = int(os.getenv("MIN_CHECKLIST_LENGTH", "200"))
+# Scam types where the primary model keeps failing skip straight to the fallback model. Only the last
+# PRIMARY_MODEL_MIN_ATTEMPTS primary drafts count, and every PRIMARY_MODEL_PROBE_INTERVAL-th request still tries
+# the primary model, so a type recovers once the primary model starts doing well again.
+PRIMARY_MODEL_MIN_SUCCESS_RATE = float(os.getenv("PRIMARY_MODEL_MIN_SUCCESS_RATE", "0.5"))
+PRIMARY_MODEL_MIN_ATTEMPTS = int(os.getenv("PRIMARY_MODEL_MIN_ATTEMPTS", "20"))
+PRIMARY_MODEL_PROBE_INTERVAL = int(os.getenv("PRIMARY_MODEL_PROBE_INTERVAL", "10"))
+# Keyed by prompt name rather than the client's scamType, so there are at most len(PROMPT_MAPPING) entries; per process
+primary_model_results: dict[str, collections.deque] = {} # prompt name -> recent primary draft results (True = usable)
+primary_model_skips: dict[str, int] = {} # prompt name -> requests sent straight to the fallback since the last probe
+
+def model_stats_key(scam_type: str) -> str:
+    return PROMPT_MAPPING.get(scam_type, DEFAULT_PROMPT_NAME)
+
+def models_for_scam_type(scam_type: str) -> list[str]:
+    if PRIMARY_MODEL == FALLBACK_MODEL:
+        return [FALLBACK_MODEL]
+    key = model_stats_key(scam_type)
+    results = primary_model_results.get(key)
+    if results is not None and len(results) >= PRIMARY_MODEL_MIN_ATTEMPTS and sum(results) / len(results) < PRIMARY_MODEL_MIN_SUCCESS_RATE:
+        skips = primary_model_skips.get(key, 0) + 1
+        if skips < PRIMARY_MODEL_PROBE_INTERVAL:
+            primary_model_skips[key] = skips
+            return [FALLBACK_MODEL]
+        primary_model_skips[key] = 0 # Probe the primary model on this request
+    return [PRIMARY_MODEL, FALLBACK_MODEL]
+
+def record_primary_model_result(scam_type: str, succeeded: bool) -> None:
+    key = model_stats_key(scam_type)
+    results = primary_model_results.get(key)
+    if results is None:
+        results = primary_model_results[key] = collections.deque(maxlen=PRIMARY_MODEL_MIN_ATTEMPTS)
+    results.append(succeeded)
+
+# Completion token caps for the buffered endpoint. MAX_TOKENS_BY_TYPE holds optional per-scam-type caps,
+# e.g. OPENAI_MAX_TOKENS_BY_TYPE='{"Phishing Scam": 1800, "Romance Scam": 2400}'; other types use the default.
+# A draft cut off by its cap is redone once with the ceiling so it never comes back as truncated JSON.
+MAX_TOKENS_CEILING = 4090
+MAX_TOKENS_DEFAULT = int(os.getenv("OPENAI_MAX_TOKENS", "2200"))
+MAX_TOKENS_BY_TYPE: dict[str, int] = orjson.loads(os.getenv("OPENAI_MAX_TOKENS_BY_TYPE", "{}"))
+
+def max_tokens_for_scam_type(scam_type: str) -> int:
+    return MAX_TOKENS_BY_TYPE.get(scam_type, MAX_TOKENS_DEFAULT)
+
+@functools.cache
+def documents_response_format() -> dict:
+    # Structured Outputs: OpenAI decodes against this schema, so every document key is always present and nothing
+    # else is generated. Built once on first use....
+    schema = {**GeneratedDocuments.model_json_schema(), "additionalProperties": False}
+    return {"type": "json_schema", "json_schema": {"name": "GeneratedDocuments", "schema": schema, "strict": True}}
+
+def build_chat_request(system_prompt_template: str, report_data: ScamReportData, specific_scam_type_for_user_message: str, model: str, max_tokens: int) -> dict:
+    # The system prompt goes first and is sent byte-for-byte as the module constant, never formatted with
+    # request data, so OpenAI's automatic prefix cache can reuse it. Victim details only ever go in the user message....
+    return dict(
+        model=model,
+        response_format=documents_response_format(),
+        messages=[
+            {"role": "system", "content": system_prompt_template},
+            {"role": "user", "content": build_user_prompt(report_data, specific_scam_type_for_user_message)}
+        ],
+        temperature=0.6,
+        max_tokens=max_tokens
+    )
+
+def log_token_usage(usage, model: str):
+    if usage is None:
+        return
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached_tokens = getattr(details, "cached_tokens", 0) or 0
+    logger.debug("%s used %s prompt tokens (%s cached from prefix) and %s completion tokens", model, usage.prompt_tokens, cached_tokens, usage.completion_tokens)
+
+def parse_ai_documents(ai_response_content: str) -> GeneratedDocuments:
+    # Parse and validate in one pass with pydantic-core; required fields are enforced by GeneratedDocuments itself
+    try:
+        return GeneratedDocuments.model_validate_json(ai_response_content)
+    except ValidationError as e:
+        errors = e.errors(include_input=False)
+        if any(error["type"] == "json_invalid" for error in errors):
+            logger.error("AI response was not valid JSON: %s. Raw response from AI: '%s'", e, ai_response_content)
+            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="AI response format error. The AI did not return valid JSON.")
+        invalid_fields = [".".join(str(part) for part in error["loc"]) for error in errors]
+        logger.error("AI response failed validation for fields: %s. Errors: %s", invalid_fields, errors)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"AI response did not contain all required document fields. Missing or invalid: {', '.join(invalid_fields)}")
+
+async def lookup_cached_documents(cache_key: str, report_data: ScamReportData):
+    """Returns (documents, description_vector); documents is None on a cache miss."""
+    # Identical resubmissions are served from the cache instead of calling the AI again
+    cached_documents = document_cache.get(cache_key)
+    if cached_documents is not None:
+        return cached_documents, None
+
+    description_vector = None
+    if SEMANTIC_CACHE_ENABLED:
+        try:
+            description_vector = await embed_description(report_data.description)
+        except Exception as e:
+            # The semantic cache is an optimisation, never a reason to fail the request
+            logger.warning("Embedding for semantic cache failed, skipping it: %s", e)
+        else:
+            match = find_semantic_match(report_data, description_vector)
+            if match is not None:
+                cached_report, cached_documents = match
+                documents = personalize_cached_documents(cached_documents, cached_report, report_data)
+                if documents is not None:
+                    document_cache[cache_key] = documents
+                    return documents, description_vector
+    return None, description_vector
+
+def store_generated_documents(cache_key: str, report_data: ScamReportData, description_vector, documents: GeneratedDocuments) -> None:
+    document_cache[cache_key] = documents
+    if description_vector is not None:
+        store_semantic_match(report_data, description_vector, documents)
+
+# Outbound OpenAI calls (chat completions, streams and embeddings) are bounded per process, and identical concurrent submissions share one upstream call.....
+OPENAI_CONCURRENCY = int(os.getenv("OPENAI_CONCURRENCY", "32"))
+openai_semaphore: asyncio.Semaphore = None # Created per worker in lifespan()
+documents_in_flight: dict[str, asyncio.Future] = {}
+# Unexpected failures are logged with their traceback; the client only gets this fixed message, never the raw exception text....
+UNEXPECTED_GENERATION_ERROR_DETAIL = "An unexpected error occurred while generating documents via AI."
+
 async def invoke_ai_document_generation(
     system_prompt_template: str, # Renamed to indicate it's a template
     report_data: ScamReportData,
+    specific_scam_type_for_user_message: str,
+    cache_key: str = None
+) -> GeneratedDocuments:
+    cache_key = cache_key or make_document_cache_key(system_prompt_template, report_data.model_dump_json())
+    while (in_flight := documents_in_flight.get(cache_key)) is not None:
+        try:
+            return await asyncio.shield(in_flight)
+        except asyncio.CancelledError:
+            # Only our own cancellation propagates; if the leader's client disconnected, take over the generation
+            if not in_flight.cancelled() or asyncio.current_task().cancelling():
+                raise
+
+    future = asyncio.get_running_loop().create_future()
+    documents_in_flight[cache_key] = future
+    try:
+        documents = await generate_documents(cache_key, system_prompt_template, report_data, specific_scam_type_for_user_message)
+        future.set_result(documents)
+        return documents
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        future.exception() # Mark as retrieved so a request with no followers doesn't log a warning
+        raise
+    finally:
+        documents_in_flight.pop(cache_key, None)
+
+async def request_completion(chat_request: dict):
+    async with openai_semaphore:
+        response = await client.chat.completions.create(**chat_request)
+    log_token_usage(response.usage, chat_request["model"])
+    return response
+
+async def generate_documents(
+    cache_key: str,
+    system_prompt_template: str,
+    report_data: ScamReportData,
     specific_scam_type_for_user_message: str
 ) -> GeneratedDocuments:
-    user_prompt_content = f"""
-    A user in Nigeria has been a victim of a {specific_scam_type_for_user_message}.
-    Please generate a consoling message first, followed by the tailored documents (police report draft, bank complaint email, next steps checklist)
-    and suggested legal aids based on the detailed system instructions and legal aid list you have received, and the following victim-provided details:
-    - Victim's Name: {report_data.name}
-    - Victim's Phone Number: {report_data.phone}
-    - Victim's Email Address: {report_data.email}
-    - Victim's Residential Address: {report_data.address}
-    - Date and Time of Incident/Discovery: {report_data.dateTime}
-    - Detailed Description of the Incident: {report_data.description}
-    - Amount Lost (if applicable): {report_data.amount if report_data.amount else "Not specified"}
-    - Payment Method Used (if applicable): {report_data.paymentMethod if report_data.paymentMethod else "Not specified"}
-    - Currency (if applicable): {report_data.currency if report_data.currency else "Not specified"}
-    - Beneficiary Details (if applicable): {
-        f"Name: {report_data.beneficiary.name}, Bank: {report_data.beneficiary.bank}, Account: {report_data.beneficiary.account}"
-        if report_data.beneficiary else "Not specified"
-    }
-
-    Ensure your response is a valid JSON object adhering to the structure specified in your system instructions, including the 'suggested_legal_aids' field.
-    The content should be empathetic, professional, actionable, and highly relevant to a victim in Nigeria.
-    If a bank email is not applicable for this specific scam type as per your system instructions, the value for "bank_complaint_email" should be "Not Applicable for this scam type."
-    If no legal aids from the provided list are deemed relevant, 'suggested_legal_aids' should be an empty list.
-    """
+    cached_documents, description_vector = await lookup_cached_documents(cache_key, report_data)
+    if cached_documents is not None:
+        return cached_documents
 
     ai_response_content = ""
     try:
-        response = await client.chat.completions.create(
-            model="gpt-4o", # Or your preferred OpenAI model
-            response_format={"type": "json_object"},
-            messages=[
-                {"role": "system", "content": final_system_prompt}, # Use the finalized prompt
-                {"role": "user", "content": user_prompt_content}
-            ],
-            temperature=0.6,
-            max_tokens=4090 # Adjust if needed, especially with longer prompts
-        )
-        ai_response_content = response.choices[0].message.content
-        documents_json = json.loads(ai_response_content)
-
-        # Check for all required keys, including suggested_legal_aids as defined in your Pydantic model.
-        # The Pydantic model GeneratedDocuments will handle validation of the structure of suggested_legal_aids.
-        required_keys = [
-            "consoling_message",
-            "police_report_draft",
-            "bank_complaint_email",
-            "next_steps_checklist",
-        ]
-        if not all(key in documents_json for key in required_keys):
-            missing_keys = [key for key in required_keys if key not in documents_json]
-            print(f"AI response missing required keys: {missing_keys}. Received: {documents_json.keys()}")
-            # Consider if 'suggested_legal_aids' being missing is a critical error or if it can be an empty list by default
-            # The prompt instructs AI to return empty list, so it should be present.
-            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"AI response did not contain all required document fields. Missing: {', '.join(missing_keys)}")
-
-        # Pydantic model `GeneratedDocuments` will parse and validate `suggested_legal_aids`
-        return GeneratedDocuments(**documents_json)
-
-    except json.JSONDecodeError as e:
-        print(f"AI response was not valid JSON: {e}. Raw response from AI: '{ai_response_content}'")
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="AI response format error. The AI did not return valid JSON.")
+        models = models_for_scam_type(specific_scam_type_for_user_message)
+        max_tokens = max_tokens_for_scam_type(specific_scam_type_for_user_message)
+        for attempt, model in enumerate(models):
+            is_last_attempt = attempt == len(models) - 1
+            response = await request_completion(
+                build_chat_request(system_prompt_template, report_data, specific_scam_type_for_user_message, model, max_tokens)
+            )
+            if response.choices[0].finish_reason == "length" and max_tokens < MAX_TOKENS_CEILING:
+                logger.info("%s draft for '%s' hit max_tokens=%s, redoing it with %s", model, specific_scam_type_for_user_message, max_tokens, MAX_TOKENS_CEILING)
+                max_tokens = MAX_TOKENS_CEILING
+                response = await request_completion(
+                    build_chat_request(system_prompt_template, report_data, specific_scam_type_for_user_message, model, max_tokens)
+                )
+            # A refusal comes back with no content; treat it like any other unusable draft
+            ai_response_content = response.choices[0].message.content or ""
+            try:
+                documents = parse_ai_documents(ai_response_content)
+            except HTTPException:
+                if is_last_attempt:
+                    raise
+                documents = None
+            usable = documents is not None and (is_last_attempt or len(documents.next_steps_checklist) >= MIN_CHECKLIST_LENGTH)
+            if model == PRIMARY_MODEL and not is_last_attempt:
+                record_primary_model_result(specific_scam_type_for_user_message, usable)
+            if not usable:
+                logger.info("%s draft for '%s' was not usable, retrying with %s", model, specific_scam_type_for_user_message, models[attempt + 1])
+                continue
+            store_generated_documents(cache_key, report_data, description_vector, documents)
+            return documents
+
     except HTTPException as http_exc:
         raise http_exc
     except Exception as e:
-        print(f"Error during AI document generation: {str(e)}")
+        logger.exception("Error during AI document generation")
         if ai_response_content:
-            print(f"Problematic AI response content was: '{ai_response_content}'")
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"An unexpected error occurred while generating documents via AI: {str(e)}")
+            logger.error("Problematic AI response content was: '%s'", ai_response_content)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=UNEXPECTED_GENERATION_ERROR_DETAIL) from e
+
+# Streaming variant: forwards the AI output as NDJSON while it is generated so the client sees text within the first second.
+# Records are {"type": "delta", "content": ...} while generating, plus {"type": "field", "name": ..., "content": ...}
+# as soon as each document is fully written (consoling_message first), then one {"type": "documents", "documents": {...}}
+# once the full response has been validated, or {"type": "error", "detail": ...} if anything fails.
+def ndjson_record(record: dict) -> bytes:
+    return orjson.dumps(record) + b"\n"
+
+# Same records as Server-Sent Events, for clients that read the POST stream with an SSE parser (e.g. fetch-event-source)....
+def sse_record(record: dict) -> bytes:
+    return b"event: " + record["type"].encode() + b"\ndata: " + orjson.dumps(record) + b"\n\n"
+
+STREAM_RECORD_ENCODERS = {
+    "application/x-ndjson": ndjson_record,
+    "text/event-stream": sse_record,
+}
+
+UNEXPECTED_GENERATION_ERROR_RECORD = {"type": "error", "detail": UNEXPECTED_GENERATION_ERROR_DETAIL}
+
+# Deltas are coalesced before flushing: the first batch is tiny for a fast first byte, later ones grow up to the max size.
+# A batch is also flushed once STREAM_FLUSH_INTERVAL seconds have passed since the last flush.
+STREAM_MIN_BATCH_SIZE = int(os.getenv("STREAM_MIN_BATCH_SIZE", "1"))
+STREAM_MAX_BATCH_SIZE = int(os.getenv("STREAM_MAX_BATCH_SIZE", "50"))
+STREAM_BATCH_GROWTH_FACTOR = float(os.getenv("STREAM_BATCH_GROWTH_FACTOR", "2"))
+STREAM_FLUSH_INTERVAL = float(os.getenv("STREAM_FLUSH_INTERVAL", "0.025"))
+
+DOCUMENT_FIELDS = tuple(GeneratedDocuments.model_fields)
+
+def completed_document_fields(partial_content: str) -> dict:
+    # jiter's partial mode drops a string that is still being written, so every value returned here is final
+    try:
+        parsed = jiter.from_json(partial_content.encode(), partial_mode="on")
+    except ValueError:
+        return {}
+    return parsed if isinstance(parsed, dict) else {}
+
+async def stream_ai_deltas(chat_request: dict):
+    # The upstream connection stays busy for the whole stream, so hold the semaphore until it ends
+    async with openai_semaphore:
+        stream = await client.chat.completions.create(**chat_request, stream=True, stream_options={"include_usage": True})
+        async for chunk in stream:
+            if chunk.usage is not None:
+                log_token_usage(chunk.usage, chat_request["model"])
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+async def stream_ai_document_generation(
+    system_prompt_template: str,
+    report_data: ScamReportData,
+    specific_scam_type_for_user_message: str,
+    cache_key: str = None,
+    cached_documents: GeneratedDocuments = None,
+    encode_record=ndjson_record
+):
+    cache_key = cache_key or make_document_cache_key(system_prompt_template, report_data.model_dump_json())
+    description_vector = None
+    if cached_documents is None:
+        cached_documents, description_vector = await lookup_cached_documents(cache_key, report_data)
+    if cached_documents is not None:
+        # Same field-then-documents sequence as a fresh stream, so clients rendering from field records behave the same
+        for name in DOCUMENT_FIELDS:
+            yield encode_record({"type": "field", "name": name, "content": getattr(cached_documents, name)})
+        yield encode_record({"type": "documents", "documents": cached_documents.model_dump()})
+        return
+
+    content_parts = []
+    emitted_fields = set()
+    batch = []
+    batch_size = STREAM_MIN_BATCH_SIZE
+    last_flush = time.monotonic()
+    try:
+        # A streamed response can't be retried once the client has seen it, so go straight to the stronger model
+        # and the token ceiling; a lower cap would end a long draft as truncated JSON with no way to redo it
+        chat_request = build_chat_request(
+            system_prompt_template, report_data, specific_scam_type_for_user_message,
+            FALLBACK_MODEL, MAX_TOKENS_CEILING
+        )
+        async for delta in stream_ai_deltas(chat_request):
+            content_parts.append(delta)
+            batch.append(delta)
+            now = time.monotonic()
+            if len(batch) >= batch_size or now - last_flush >= STREAM_FLUSH_INTERVAL:
+                yield encode_record({"type": "delta", "content": "".join(batch)})
+                batch.clear()
+                last_flush = now
+                batch_size = min(STREAM_MAX_BATCH_SIZE, int(batch_size * STREAM_BATCH_GROWTH_FACTOR) or 1)
+                for name, value in completed_document_fields("".join(content_parts)).items():
+                    if name in DOCUMENT_FIELDS and name not in emitted_fields:
+                        emitted_fields.add(name)
+                        yield encode_record({"type": "field", "name": name, "content": value})
+        if batch:
+            yield encode_record({"type": "delta", "content": "".join(batch)})
+
+        documents = parse_ai_documents("".join(content_parts))
+        store_generated_documents(cache_key, report_data, description_vector, documents)
+        for name in DOCUMENT_FIELDS:
+            if name not in emitted_fields:
+                yield encode_record({"type": "field", "name": name, "content": getattr(documents, name)})
+        yield encode_record({"type": "documents", "documents": documents.model_dump()})
+
+    except HTTPException as http_exc:
+        yield encode_record({"type": "error", "detail": http_exc.detail})
+    except Exception:
+        logger.exception("Error during streamed AI document generation")
+        yield encode_record(UNEXPECTED_GENERATION_ERROR_RECORD)
 
 
 # System Prompts for the AI.....
@@ -158,7 +720,7 @@ LEGAL_AND_REPORTING_ORGANIZATIONS = {
     {
       "name": "Nigeria Police Force (NPF)",
       "reporting_link": "https://www.npf.gov.ng/",
-      "contact_email": null,
+      "contact_email": None,
       "services": ["Investigation of crimes (including fraud/cybercrime)", "Arrest and prosecution"],
       "notes": "Report scams to local police stations or specialized units like the Special Fraud Unit (SFU). The main website can help locate contacts. Some state commands might have specific online portals for certain complaints."
     },
@@ -232,35 +794,35 @@ LEGAL_AND_REPORTING_ORGANIZATIONS = {
     {
       "name": "INTERPOL",
       "reporting_link": "https://www.interpol.int/What-you-can-do/If-you-need-help",
-      "contact_email": null,
+      "contact_email": None,
       "services": ["Facilitates cross-border police cooperation"],
       "notes": "Individuals report to their national police, who then liaise with INTERPOL for international cases."
     },
     {
       "name": "Federal Bureau of Investigation (FBI) - Internet Crime Complaint Center (IC3) (USA)",
       "reporting_link": "https://www.ic3.gov/",
-      "contact_email": null,
+      "contact_email": None,
       "services": ["Collects and analyzes reports of cyber-enabled crime with a U.S. nexus"],
       "notes": "File a complaint if the scam has a U.S. connection (victim, perpetrator, or infrastructure)."
     },
     {
       "name": "Action Fraud (UK)",
       "reporting_link": "https://www.actionfraud.police.uk/",
-      "contact_email": null,
+      "contact_email": None,
       "services": ["UK's national reporting centre for fraud and cybercrime"],
       "notes": "Report if the scam has a UK connection. For scam websites, also see NCSC UK."
     },
     {
       "name": "Federal Trade Commission (FTC) (USA)",
       "reporting_link": "https://reportfraud.ftc.gov/",
-      "contact_email": null,
+      "contact_email": None,
       "services": ["Collects reports on scams, fraud, and bad business practices with a U.S. nexus"],
       "notes": "U.S. consumer protection agency."
     },
     {
       "name": "econsumer.gov (ICPEN - International Consumer Protection and Enforcement Network)",
       "reporting_link": "https://www.econsumer.gov/",
-      "contact_email": null,
+      "contact_email": None,
       "services": ["Portal for reporting international scams and disputes with foreign companies"],
       "notes": "Complaints are shared with consumer protection agencies in ICPEN member countries."
     },
@@ -280,1193 +842,122 @@ LEGAL_AND_REPORTING_ORGANIZATIONS = {
     }
   ]
 }
-BASE_SYSTEM_PROMPT_STRUCTURE = """
-You are ReclaimMe, an AI assistant meticulously designed to support victims of scams in Nigeria. Your primary mission is to provide empathetic guidance and generate crucial documents and actionable suggestions. You must strictly adhere to the output format and all instructions provided.
-
-Your response MUST be a single, valid JSON object with the following exact keys, in the specified order:
-
-{
-    "consoling_message": "A brief, empathetic, and supportive message tailored to acknowledge the victim's difficult situation and reassure them. (String, 2-4 sentences)",
-    "police_report_draft": "A detailed, professionally toned, and actionable draft for a police report, incorporating all relevant victim-provided details and specific elements pertinent to the scam type. (String)",
-    "bank_complaint_email": "A precisely drafted email for the victim to send to their bank. This should be 'Not Applicable for this scam type.' if financial institutions are not directly involved or if no direct action can be taken via the bank for the specific scam. (String)",
-    "next_steps_checklist": "A comprehensive, highly practical, and actionable checklist of recommended next steps for the victim, specific to the scam type and Nigerian context. Include guidance on how and where to report, and official links if stable and known. (String with formatted list items)",
-    "suggested_legal_aids": [
-        {
-            "name": "Full name of the suggested legal aid organization. (String)",
-            "reporting_link": "The direct reporting link or official website of the organization. (String, Optional)",
-            "contact_email": "The contact email address, if available. (String, Optional)",
-            "services": [
-                "A list of key services this organization offers that are most relevant to the victim's specific scam situation. (Array of Strings)"
-            ],
-            "notes": "A concise explanation of why this organization is relevant for this particular scam type and victim, and any important considerations for contacting them. (String)"
-        }
-        // Include 0 to 3 suggested organizations. If none are relevant from the provided list, this array can be empty.
-    ]
-}
-
-**DETAILED INSTRUCTIONS FOR EACH SECTION:**
-
-**1. Consoling Message (consoling_message):**
-    - Start with this.
-    - Express genuine empathy and understanding for the victim's experience.
-    - Acknowledge the difficulty of their situation and validate their courage in seeking help.
-    - Reassure them that taking action is a positive and important step.
-    - Keep the message concise (approximately 2-4 sentences) and supportive.
-    - Now, go through the type of scam, and suggest Legal bodies and support groups that can help the person on that particular type of scam, keep this around 5-7 sentences as well
-    
-**2. Document Generation (police_report_draft, bank_complaint_email, next_steps_checklist):**
-    - **Tone and Language:** Maintain an empathetic, clear, professional, and respectful tone throughout all generated documents. The language must be accessible to an average Nigerian user but formal enough for official submissions to Nigerian authorities (e.g., Nigerian Police Force - NPF, Economic and Financial Crimes Commission - EFCC, bank fraud departments, Federal Competition and Consumer Protection Commission - FCCPC, etc.).
-    - **Specificity:** Tailor the content of each document meticulously to the *specific scam type* indicated by the user.
-    - **Victim's Details Integration:** Seamlessly and accurately incorporate all relevant details provided by the victim (e.g., name, contact information, date of incident, description of the scam, amount lost, payment method, beneficiary details if any) into the appropriate sections of the documents.
-    - **Placeholders:** Where specific details are unknown to ReclaimMe but necessary for the victim to complete the document (e.g., a specific scammer's phone number not provided, or the exact internal department of a bank), use clear placeholders like "[Specify Detail Here if Known, e.g., Scammer's WhatsApp Number]" or "[Consult Bank for Exact Department Name, e.g., Fraud Desk or Customer Care]".
-    - **Nigerian Context:**
-        - Reference relevant Nigerian laws if generally known and applicable (e.g., Cybercrimes (Prohibition, Prevention, etc.) Act, 2015 – use judiciously).
-        - Refer to specific Nigerian agencies, authorities, and common procedural steps within Nigeria.
-        - For the `next_steps_checklist`, ensure it is highly practical. Guide the user on *how* and *where* to report specific aspects of the scam, including official and stable website links for Nigerian government/agency portals where appropriate and commonly known.
-    - **Bank Complaint Email (bank_complaint_email):**
-        - If a bank email is not applicable for the reported scam type (e.g., no financial transaction through a bank, or the bank cannot assist with the specific issue), the value for this key MUST be the string: "Not Applicable for this scam type."
-        - Otherwise, draft a clear, formal, and actionable email detailing the issue, relevant transaction details, and desired actions from the bank.
-**(End of Legal Aid List)**
-
----
-**Final Check:** Before concluding, ensure the entire output is a single, valid JSON object adhering to the structure and all instructions defined above. The content must be empathetic, professional, actionable, and highly relevant to a victim in Nigeria.
-"""
-# User prompts for the AI, based on the scams
-
-PHISHING_SCAM_SYSTEM_PROMPT_DETAILS = """
-This user was a victim of a 'Phishing Scam'.
-
-**Police Report Draft Specifics for Phishing:**
-- **How Phishing Occurred:** Detail the method (e.g., deceptive email, SMS (smishing), voice call (vishing), fake website, malicious ad). Name the impersonated entity (e.g., '[Fake Bank Name, e.g., Zenith Bank]', '[Fake Service, e.g., Netflix]', '[Fake Government Agency, e.g., NPF]'). Include the sender's email/phone, and the exact fake website URL if known. Provide exact wording of the phishing message if possible.
-- **Information Compromised:** Be exhaustive. Examples: online banking username/password, ATM card number, expiry date, CVV, OTPs (One-Time Passwords) received and shared, email account credentials (and if 2FA was bypassed), social media logins, National Identification Number (NIN), Bank Verification Number (BVN), answers to security questions, driver's license details, passport information.
-- **Resulting Unauthorized Actions:** List all unauthorized transactions (dates, times, amounts, beneficiaries including account numbers and bank names, transaction IDs/references). Mention any unauthorized changes to account settings (e.g., changed contact details, added new beneficiaries), emails sent from their compromised account, or new accounts/services opened in their name.
-- **Device Information (if relevant):** Was a specific computer or phone used when the phishing occurred? Was any software downloaded or installed as part of the scam (e.g., remote access tool, malware)?
-- **Evidence Available:** Note if screenshots of the phishing message/website, call logs, or transaction records are available. Advise the user to prepare these for the police.
-
-**Bank Complaint Email Draft Specifics for Phishing:**
-- **Urgency:** Emphasize the immediate need for action to prevent further losses. Use a clear subject line like "URGENT: Phishing Attack & Unauthorized Transactions - Account [Your Account Number]".
-- **Account Details:** Full account name as it appears on bank records, account number(s) affected, and any associated card numbers.
-- **Compromise Method:** Clearly state "My account credentials/card details were compromised through a sophisticated phishing attack on [Date] where I was tricked into providing sensitive details on a fake [Bank Name/Service Name] website which mimicked your official portal / via a deceptive phone call claiming to be from your fraud department."
-- **Unauthorized Transactions:** Itemize each fraudulent transaction meticulously: date, exact time (if known from alerts), amount, currency, beneficiary name, beneficiary account number, beneficiary bank, and any transaction reference numbers.
-- **Requests to Bank:**
-    1. "I request the IMMEDIATE BLOCKING of my card(s) [List Card Numbers, e.g., last 4 digits if full not known] and/or a temporary freeze on my account [Account Number] to prevent any further unauthorized access or transactions."
-    2. "I formally DISPUTE all the listed unauthorized transactions and request initiation of the process for recovery/chargeback as per Central Bank of Nigeria (CBN) guidelines and your bank's fraud policy."
-    3. "Please conduct a FULL security review of my account, including recent login activity, changes to contact details or beneficiaries, and advise on necessary steps such as a complete password reset for online/mobile banking, PIN changes, and new card issuance."
-    4. "Kindly provide me with your bank's official fraud report forms or reference number for this complaint."
-    5. "Please confirm if any other suspicious activity or attempted transactions are noted on my account since [Date of compromise]."
-    6. "Advise if I should report this BVN or NIN compromise to any specific financial industry body."
-- **If no financial loss yet, but credentials compromised:** Focus on immediate account freeze/credential reset, enhanced security advice (including checking for linked devices/sessions), and placing the account on high alert for monitoring.
-
-**Next Steps Checklist Specifics for Phishing:**
-1.  **Contact Bank(s) Immediately (Phone & Email):** Call the bank's official 24/7 fraud reporting line. Follow up immediately with the drafted email to have a written record. Get a reference number for your complaint.
-2.  **Change ALL Relevant Passwords:** For the compromised account(s) AND ALL OTHER online accounts, especially financial, email, and social media, particularly if you reuse passwords. Create strong, unique passwords (12+ characters, mix of cases, numbers, symbols) for each account. Use a reputable password manager to help generate and store them.
-3.  **Enable/Verify Two-Factor Authentication (2FA):** On ALL critical accounts. Prefer app-based authenticators (Google Authenticator, Authy, Microsoft Authenticator) over SMS-based 2FA if possible, as SMS can be intercepted.
-4.  **Scan ALL Devices:** Run comprehensive antivirus and anti-malware scans on all computers, smartphones, and tablets used to access the compromised accounts or that might have been exposed to malicious links/software.
-5.  **Report Phishing Attack Itself:**
-    * To the impersonated company (e.g., your bank has an official fraud/phishing reporting email; for services like Netflix, check their help section for abuse reporting).
-    * To the Nigerian Communications Commission (NCC) for malicious SMS or calls, if they have a specific reporting channel (e.g., DND service for unsolicited messages, or specific scam reporting lines).
-    * To ngCERT (Nigerian Computer Emergency Response Team) via their official website (cert.gov.ng) if they have a public reporting mechanism for phishing websites or incidents.
-    * Forward phishing emails with full headers to `reportphishing@apwg.org` (Anti-Phishing Working Group, an international consortium).
-6.  **File Police Report:** Take the drafted report and all evidence (screenshots, bank statements showing fraud) to your nearest Nigerian Police Force (NPF) station. Insist on getting an official police report extract or case number.
-7.  **Monitor Accounts & Credit Closely:** For several months, regularly check all bank statements, online banking activity, and credit reports (if you use services from Nigerian credit bureaus like CRC Credit Bureau, CR Services (CreditRegistry), XDS Credit Bureau) for any new suspicious activity or accounts opened in your name.
-8.  **Inform Identity Management Agencies:** If your National Identification Number (NIN) was compromised, report this to the National Identity Management Commission (NIMC) and inquire about protective measures. If your Bank Verification Number (BVN) was part of the compromised data, inform your primary bank and the CBN (through its consumer protection channels) about the potential misuse.
-9.  **Review Account Recovery Settings:** Ensure your registered email address and phone number for account recovery on all important services are secure, up-to-date, and themselves protected with strong passwords and 2FA.
-10. **Educate Yourself & Others:** Learn to identify phishing red flags: urgent/threatening tone, generic greetings (Dear Customer), poor grammar/spelling, requests for sensitive information, mismatched sender email addresses (check the domain carefully), links that don't go to the official domain (hover over links before clicking). Never click links or download attachments from unsolicited or suspicious emails/messages. Always type website URLs directly into your browser or use trusted bookmarks. Verify any unusual requests for sensitive information via a separate, trusted communication channel (e.g., call the bank using the number on their official website or back of your card).
-11. **Check for Data Breaches:** Use services like "Have I Been Pwned?" (haveibeenpwned.com) to see if your email address has been involved in known data breaches, which could make you a target for phishing.
-"""
-
-ROMANCE_SCAM_SYSTEM_PROMPT_DETAILS = """
-This user was a victim of a 'Romance Scam'. Approach with extra empathy and sensitivity.
-
-**Police Report Draft Specifics for Romance Scam:**
-- **Scammer's Persona & Platform:** Full name(s) used by the scammer, claimed age, nationality, current location, profession (often something that allows for isolation or travel like military, oil rig worker, international doctor). Name of the dating site, app (e.g., Tinder, Badoo, PlentyOfFish), or social media platform (Facebook, Instagram, LinkedIn) where initial contact was made. Date of first contact and approximate duration of the "relationship."
-- **Grooming Process & Manipulation Tactics:** Describe how trust was built (e.g., intense daily communication, love bombing, sharing fabricated personal stories of hardship or wealth, future plans like marriage or joint ventures, sending small initial "gifts" if any). Note any specific manipulation tactics (e.g., isolating victim from friends/family, creating a sense of dependency).
-- **Reasons Given for Money Requests:** Itemize each distinct request for money or valuable items. For each, include: the specific fabricated story/emergency (e.g., medical bills for self or family member, visa/travel expenses to meet the victim, business investment that "went wrong," customs fees for a supposed valuable gift stuck in transit, legal trouble, school fees for "children"). Note the date of each request and the amount requested.
-- **Payments Made & Financial Details:** For each payment made: exact date, amount, currency (NGN, USD, EUR, etc.), payment method (bank transfer, cryptocurrency - specify type like BTC, ETH, USDT, gift cards - specify type like Amazon, Google Play, Steam, iTunes, wire transfer like Western Union/MoneyGram). Crucially, include all known beneficiary details: full name on account, bank name, account number, sort code/SWIFT if international; crypto wallet addresses; recipient name and location for gift cards/wire transfers; any intermediary accounts or money mules mentioned.
-- **Evidence Available:** Clearly state the types of evidence the victim has (e.g., screenshots of the scammer's profile(s) – even if now deleted, the victim might have saved them; complete chat logs from all platforms – WhatsApp, Hangouts, platform DMs; all email correspondence; any photos or videos sent by the scammer – advise victim to use reverse image search tools like TinEye or Google Images on these as they are often stolen; all payment receipts, bank transaction confirmations, crypto transaction IDs/hashes).
-- **Emotional and Psychological Impact:** Briefly note the emotional distress, feelings of betrayal, and psychological manipulation involved. This helps authorities understand the nature of the crime.
-- **Attempts to Meet/Video Call:** Note if the scammer consistently avoided video calls or in-person meetings, using various excuses.
-
-**Bank Complaint Email Draft Specifics for Romance Scam:**
-- **Subject Line:** "URGENT: Report of Fraudulent Transactions - Romance Scam Victim - Account [Your Account Number]"
-- **Context:** "I am writing with deep distress to report a series of financial transactions made from my account under severe emotional manipulation and fraudulent misrepresentation by an individual I met online, whom I now understand to be a romance scammer. This occurred between [Start Date] and [End Date]."
-- **Transaction Details:** Meticulously list each bank transaction related to the scam: date, exact amount, currency, beneficiary name, beneficiary account number, beneficiary bank.
-- **Nature of Fraud:** "These payments were induced by sophisticated emotional grooming and entirely false pretenses, including fabricated emergencies such as [mention one or two key examples of fake stories used, e.g., 'urgent medical bills,' 'stranded overseas needing travel funds']. I was led to believe I was in a genuine romantic relationship."
-- **Request to Bank:**
-    1. "I request an urgent investigation into these fraudulent transactions."
-    2. "Please advise on any possible steps for fund recall or placing restrictions on the beneficiary accounts. I understand that recovery of funds in such scams can be extremely challenging, but I wish to exhaust all official banking channels."
-    3. "Could you provide any information on the beneficiary accounts that might assist law enforcement?"
-    4. "Please flag my account for heightened security monitoring due to this incident."
-- **If crypto/gift cards were bought via bank card for the scammer:** "Additionally, I made purchases of [Cryptocurrency/Gift Cards] on [Dates] using my card [Card Number] which were then transferred to the scammer under the same fraudulent inducement. While I initiated these purchases, it was part of the larger deception." State clearly if direct bank recovery for these is "Not Applicable" but the context is important for the bank to understand the full scope if they were used to fund the scam.
-
-**Next Steps Checklist Specifics for Romance Scam:**
-1.  **Cease ALL Contact & Block:** Immediately stop all communication with the scammer. Block them on all dating sites, social media platforms, email addresses, and phone numbers. Do not respond to any further attempts at contact, even if they try to apologize, threaten, or offer to "return" money (it's usually a trick for more).
-2.  **Preserve ALL Evidence:** Do NOT delete any messages, profiles, or records. Save everything: screenshots of their profile(s) (even if now deleted, check your archives or if you sent them to anyone), all chat messages (WhatsApp, platform DMs, SMS), emails, voicemails. Save any photos or videos they sent (perform a reverse image search on these using Google Images or TinEye – they are often stolen from innocent people). Keep meticulous records of all payment receipts, bank transaction details, crypto transaction IDs/hashes, gift card codes sent. Organize this evidence chronologically.
-3.  **Report to the Platform(s):** Report the scammer's profile(s) to the administrators of the dating site(s), social media platform(s), or app(s) where you met and communicated. Provide as much detail and evidence as possible. This helps them remove the scammer and protect others.
-4.  **Contact Your Bank(s) & Financial Institutions:** As per the drafted email, report any fraudulent bank transfers or card transactions. If you sent wire transfers (Western Union, MoneyGram), report the fraud to them immediately, though recovery is very rare.
-5.  **Report to Law Enforcement:** File a detailed police report with the Nigerian Police Force (NPF). Due to the often significant financial loss and potential international elements (even if the scammer claims to be local but uses international money mules), also file a comprehensive report with the Economic and Financial Crimes Commission (EFCC). Provide them with all your organized evidence.
-6.  **Report Crypto & Gift Card Fraud:**
-    * If cryptocurrency was sent, report the scammer's wallet addresses to the cryptocurrency exchange you used (if applicable for withdrawal) and to blockchain tracking services like Whale Alert or Chainabuse, or look into reporting to the Internet Crime Complaint Center (IC3.gov) if US elements are suspected.
-    * If gift cards were used, contact the issuing company (e.g., Amazon, Google, Apple, Steam) customer service immediately. Provide the gift card numbers and explain they were obtained through fraud. Recovery is very difficult, but rapid reporting is the only slim chance.
-7.  **Seek Emotional & Psychological Support:** This is extremely important. Romance scams inflict deep emotional trauma, shame, and feelings of betrayal. Talk to trusted friends, family members who will be supportive (not judgmental), or seek professional help from a therapist, counselor, or psychologist. There are also online support groups for victims of romance scams (e.g., on SCARS - Society of Citizens Against Relationship Scams). You are not to blame for being a victim of sophisticated manipulation.
-8.  **Beware of Recovery Scams:** After being scammed, you might be contacted by individuals or fake "agencies" claiming they can recover your lost money for an upfront fee. These are ALWAYS scams. Do NOT pay anyone to recover your money. Only official law enforcement can potentially recover assets, and they don't charge fees for it.
-9.  **Secure Your Personal Information & Accounts:** Change passwords on all your online accounts, especially email and social media, if you ever shared any personal details or suspect the scammer might have tried to access your accounts. Enable 2FA. Review your privacy settings on all social media.
-10. **Educate Yourself & Be Cautious Online:** Learn about the common red flags of romance scams: profiles that seem too perfect, quick declarations of love, resistance to video calls or meeting in person (always with excuses), elaborate stories of personal tragedy or sudden wealth followed by crises requiring your financial help, requests to move communication off the dating platform quickly, requests for money using untraceable methods.
-11. **Financial Assessment & Planning:** If the financial loss was significant, assess your situation. Consider speaking with a legitimate financial advisor or credit counselor for guidance on managing the financial impact.
-12. **Consider Reporting to Your Country's Consulate/Embassy:** If the scammer claimed to be from a specific foreign country and you have details, you *could* inform that country's embassy or consulate in Nigeria, though their ability to act is often limited.
-"""
-
-ONLINE_MARKETPLACE_SCAM_SYSTEM_PROMPT_DETAILS = """
-This user was a victim of an 'Online Marketplace Scam' on a platform like Jiji, OLX, Konga Marketplace, or Facebook Marketplace.
-
-**Police Report Draft Specifics for Online Marketplace Scam:**
-- **Platform & Seller/Buyer Details:** Specific platform (Jiji.ng, Facebook Marketplace, Instagram Shop, etc.), seller's/buyer's profile name, username, contact number (WhatsApp, phone), shop name (if any), direct link to their profile and the specific item listing if still available or if screenshots were taken. Note if they had reviews (and if those reviews now seem suspicious or fake).
-- **Item Details:** Full and detailed description of the item advertised (if victim was buyer) or item sold (if victim was seller). Include make, model, size, color, condition advertised (new, used, refurbished), and any specific features or promises made about the item. Include original ad text or screenshots if possible.
-- **Transaction Timeline & Communication:** Date of first contact, summary of key negotiation points (price, delivery method, payment terms), agreed final price. Mode of communication (platform's chat, WhatsApp, phone calls).
-- **The Scam Itself – Detailed Account:**
-    - *If Victim was Buyer:* Explain how payment was made (bank transfer, POS at a supposed pickup point, online payment gateway, fake payment app link provided by seller). Provide full beneficiary account name, account number, and bank name. Date and time of payment. What happened immediately after payment (e.g., seller blocked victim, seller became unresponsive, seller sent fake/invalid tracking information, seller shipped a completely different, low-value, or counterfeit item, item never arrived by agreed date). If a wrong/fake item was received, describe it in detail and how it differs from what was advertised.
-    - *If Victim was Seller:* Explain how the buyer "paid" or claimed to pay (e.g., presented a fake SMS credit alert, sent a doctored bank transfer screenshot, used a stolen credit card for an online payment that was later reversed, issued a bounced cheque for a local pickup, initiated a fraudulent chargeback claim after receiving the item saying it wasn't delivered or was defective). Value of goods lost. Buyer's delivery address if goods were shipped, or pickup details if local.
-- **Communication Records:** Confirm availability of chat logs (e.g., WhatsApp, Facebook Messenger, Jiji chat), emails, call logs with the scammer.
-- **Attempts to Resolve:** Detail any communication with the seller/buyer after the scam was discovered, and their response (e.g., excuses, threats, blocking, or complete silence). Any attempts to use the platform's dispute resolution if available.
-
-**Bank Complaint Email Draft Specifics for Online Marketplace Scam:**
-- **If Victim was Buyer who Paid a Fraudulent Seller:**
-    - Subject: "URGENT: Fraudulent Transaction - Non-Delivery/Fake Goods from Online Marketplace Seller - Account [Your Account Number]"
-    - "I am writing to report a fraudulent transaction for goods purportedly purchased on [Platform Name, e.g., Jiji.ng] from a seller identified as [Seller's Profile Name/Shop Name] on [Date]. The item, a [Item Description], was paid for via [Bank Transfer/Card Payment to POS/Online Gateway] but was [never delivered / found to be counterfeit / significantly not as described]."
-    - Transaction details: Date, time, amount, your account debited, beneficiary account name, number, and bank (for transfers), or merchant details on POS/gateway transaction.
-    - Request: "I request an immediate investigation into this fraudulent transaction. Please advise on the possibility of fund recall from the beneficiary account and/or initiate a chargeback if a debit/credit card was used. The seller is now [unreachable / has provided a fake item / has refused a refund]. I have reported this to [Platform Name] and the Police."
-- **If Victim was Seller Scammed by Fake Payment (e.g., Fake Alert):**
-    - To your own bank: "Subject: Confirmation of Non-Receipt of Funds & Reporting of Fake Payment Alert - Account [Your Account Number]"
-    - "I am writing to confirm that no funds were credited to my account [Your Account Number] for a transaction on [Date] where a buyer, [Buyer's Name/Details if known], claimed to have paid [Amount] for [Item Sold]. The buyer presented what I now understand to be a fake payment confirmation (e.g., SMS alert/screenshot). Based on this deception, I released goods valued at [Value]. Please formally confirm the non-receipt of this specific credit and provide any advice on reporting the buyer's details if they were inadvertently captured or if this is a known fraud pattern."
-    - This email is mainly for official confirmation and awareness, as direct recovery of goods by the bank is unlikely.
-
-**Next Steps Checklist Specifics for Online Marketplace Scam:**
-1.  **Report to Marketplace Platform:** IMMEDIATELY report the fraudulent user (seller or buyer) and the specific listing/transaction to the administrators of Jiji, Facebook Marketplace, Instagram, OLX, Konga, etc. Use their official reporting tools/customer support channels. Provide all evidence you have (listing ID, profile links, chat screenshots, payment proofs or fake proofs). They might ban the user, assist law enforcement, or in rare cases, offer some form of buyer/seller protection if their policies cover it.
-2.  **Gather and Organize ALL Evidence:** Systematically save screenshots of the original advertisement, the seller's/buyer's profile (including any visible ID or verification badges), ALL chat history (don't delete anything!), payment confirmations (or fake payment proofs), photos/videos of any wrong or counterfeit item received, any shipping labels or tracking information (even if fake).
-3.  **Contact Your Bank (if applicable):** As per the drafted email. If you are a seller who received a fake alert, get official confirmation of non-payment from your bank.
-4.  **File a Detailed Police Report:** With the Nigerian Police Force (NPF). Provide all your organized evidence. This is crucial for any potential investigation or if required by your bank or the platform. Get a police report extract. Consider reporting to the EFCC if the fraud is substantial or involves complex online elements.
-5.  **Inform Courier Service (if an item was shipped but payment was fraudulent/recalled):** If you were a seller who shipped an item and then discovered the payment was fake or was fraudulently reversed (e.g., chargeback on a stolen card), contact the courier company immediately with the tracking number to see if the delivery can be stopped or the item recalled. This is often difficult but worth an immediate try.
-6.  **Leave Reviews/Warnings (If Possible & Safe):** If the platform allows reviews or comments, leave a factual, unemotional review about the scammer to warn other potential victims. You can also share your experience (anonymously if preferred, and without revealing sensitive personal details) in relevant online forums or social media groups dedicated to exposing scammers in Nigeria.
-7.  **For Future Online Marketplace Transactions:**
-    * *As a Buyer:*
-        * Prefer platforms with robust buyer protection or escrow services.
-        * For high-value items, if meeting in person, choose safe, public, well-lit locations, and consider going with a friend. Inspect goods thoroughly before paying.
-        * Be very wary of deals that seem too good to be true or sellers who pressure you for quick payment, especially to personal bank accounts or via untraceable methods.
-        * Check seller profiles carefully: look at join date, number of listings, quality of reviews (be alert for many generic, similar-sounding positive reviews which could be fake). Ask questions.
-        * If possible, use payment methods that offer some form of dispute resolution (like credit cards, though direct bank transfers are common in Nigeria and offer little recourse).
-    * *As a Seller:*
-        * ALWAYS confirm that funds have cleared and are reflected in your *actual bank account balance* (check your official bank app, internet banking, or get a statement) before shipping goods or handing them over. Do NOT rely solely on SMS alerts, email confirmations, or screenshots provided by the buyer, as these are easily faked.
-        * For in-person exchanges, consider cash payment (verify notes for high values) or an instant bank transfer that you confirm on your *own* banking app/device before releasing the item.
-        * Be wary of buyers who tell complex stories about payment, use third-party payers, or request urgent shipping before you can confirm payment.
-        * Document everything: your item, communication, shipping details.
-8.  **Report to Consumer Protection Agencies:** If the scam involved a seemingly registered business operating on the marketplace platform that is unresponsive or clearly fraudulent, report them to the Federal Competition and Consumer Protection Commission (FCCPC).
-9.  **Consider Legal Advice:** For significant losses, especially if the scammer is identifiable and located within Nigeria, you might consult a lawyer about options like a civil suit or other legal recovery methods, though this can be costly and time-consuming.
-"""
-
-INVESTMENT_CRYPTO_SCAM_SYSTEM_PROMPT_DETAILS = """
-This user was a victim of an 'Investment or Cryptocurrency Scam' (e.g., fake trading platforms, Forex scams, Ponzi/pyramid schemes, fake 'ROI' businesses, pig butchering scams involving crypto).
-
-**Police Report Draft Specifics for Investment/Crypto Scam:**
-- **Scam Entity Details:** Full name of the fake investment platform, company, group, or individual(s) promoting the scheme. Include all known website URLs, social media page links (Facebook, Instagram, Telegram, WhatsApp groups), and any claimed physical addresses (often fake or virtual offices).
-- **Investment Offer:** Detailed description of the investment: type (e.g., crypto "arbitrage" or "liquidity mining," Forex trading, "fixed" high-yield ROI on deposits, shares in a non-existent company, agricultural investment). Specific promised returns (e.g., "30% monthly ROI," "double your money in 7 days"), minimum investment, and how the investment was solicited (e.g., social media ad, YouTube influencer, WhatsApp/Telegram group, direct message from a "friend" whose account was hacked, or a "pig butchering" style romance/friendship buildup leading to investment).
-- **Payment Trail:** Meticulously list all investments/payments made:
-    * Dates, times, exact amounts, and currencies (e.g., NGN, USD, specific Crypto like BTC, ETH, USDT, BNB).
-    * For bank transfers: Your bank, your account number, beneficiary account name, beneficiary account number, beneficiary bank name, transaction references.
-    * For crypto transfers: The cryptocurrency used, amount, the originating wallet/exchange address (yours), the destination wallet address (scammer's), transaction ID/hash (very important), and the blockchain network (e.g., Bitcoin, Ethereum ERC-20, TRON TRC-20, BSC BEP-20).
-    * For payments via payment gateways or third-party apps: Name of gateway, transaction ID.
-- **How Scam Unfolded:** Explain the process: initial investment, any small "profits" paid out initially (a common tactic to build trust), subsequent larger investments, when withdrawal attempts started failing, excuses given by scammers (e.g., "need to pay tax," "withdrawal fee," "account upgrade needed," "market volatility"), and when the platform/promoters disappeared or blocked communication.
-- **Promoters/Agents:** If any specific individuals in Nigeria acted as local promoters, agents, or facilitated local fund collection (e.g., provided personal bank accounts to receive NGN deposits for "conversion" to crypto), provide their names, phone numbers, and bank details.
-- **Evidence:** Mention availability of screenshots of the platform/website, advertisements, all communications (emails, chats on WhatsApp/Telegram), transaction records (bank statements, crypto transaction history from exchanges/wallets including hashes), any "contracts" or investment plans provided.
-
-**Bank Complaint Email Draft Specifics for Investment/Crypto Scam:**
-- **If payments were made via bank transfer from the victim's account directly to bank accounts in Nigeria controlled by the scammers or their local agents:**
-    - Subject: "URGENT: Report of Fraudulent Investment Scheme Transactions - Account [Your Account Number]"
-    - "I am writing to report a series of payments made from my account to what I have now identified as a fraudulent investment scheme operating under the name [Scam Platform/Company Name]. I was deceived by promises of [e.g., high, guaranteed returns]."
-    - Clearly list all such bank transactions: dates, amounts, your account debited, beneficiary account names, beneficiary account numbers, and recipient bank names, transaction references.
-    - "These payments were made between [Start Date] and [End Date]. The scheme has since proven to be a scam [e.g., I am unable to withdraw funds, the platform is inaccessible, promoters have disappeared]."
-    - Request: "I urgently request your bank to investigate these fraudulent transactions. Please take all possible actions to place a lien on the beneficiary accounts, trace the funds, and advise on any avenues for fund recall or recovery. I am reporting this to the NPF and EFCC."
-- **If cryptocurrency was the primary mode of investment (i.e., victim sent crypto from their personal wallet to the scammer's wallet):**
-    - The bank email is likely "Not Applicable for direct recovery of crypto assets already sent from my personal wallet to an external scammer's wallet."
-    - However, if the victim used their bank card or bank account to *purchase* the cryptocurrency from a legitimate exchange *specifically and immediately* for the purpose of this fraudulent investment, and can demonstrate the direct link, timing, and fraudulent inducement: "I wish to report that on [Dates], I used my bank card/account [Card/Account Details] to purchase cryptocurrency from [Exchange Name] totaling [Amount]. This purchase was made under fraudulent inducement to invest in a scheme called [Scam Platform Name], which immediately turned out to be a scam. While I understand the crypto transfer itself is external, I am reporting the fraudulent context of these bank-facilitated purchases." (Chargebacks are very difficult here but reporting provides context).
-
-**Next Steps Checklist Specifics for Investment/Crypto Scam:**
-1.  **Cease All Investment & Contact:** Immediately stop sending any more money to the scammers or platform, for any reason (e.g., "withdrawal fees," "taxes," "account verification" – these are all further scam tactics). Stop all communication.
-2.  **Gather and Secure ALL Evidence:** Systematically collect and save:
-    * Screenshots/PDFs of the scam website/platform (especially your account dashboard showing "balance" or transaction history, if still accessible).
-    * All advertisements, promotional materials, whitepapers, or investment plans.
-    * Complete records of all communications (emails, WhatsApp/Telegram chats – export them, social media messages).
-    * Full transaction records: bank statements highlighting payments, cryptocurrency transaction IDs (hashes) for every transfer, screenshots from your crypto wallet or exchange showing the transfers, details of scammer's crypto wallet addresses.
-3.  **Report to Law Enforcement:**
-    * File a detailed report with the Nigerian Police Force (NPF), providing all evidence.
-    * File a comprehensive report with the Economic and Financial Crimes Commission (EFCC), as these scams often involve significant financial fraud and may have elements of money laundering or cybercrime. (EFCC website: efccnigeria.org)
-4.  **Report to Financial & Investment Regulators:**
-    * If the scam involved a purported company or financial instrument that falsely claimed registration or legitimacy, report to the Securities and Exchange Commission (SEC) Nigeria. (SEC website: sec.gov.ng)
-    * Report to the Central Bank of Nigeria (CBN) via its consumer protection department, especially if Nigerian bank accounts were heavily used by the scammers.
-5.  **Contact Your Bank:** As per the drafted email, for any direct bank transfers made.
-6.  **Report Crypto Wallets/Exchanges:**
-    * If crypto was transferred, report the scammer's wallet addresses to major cryptocurrency exchanges (like Binance, Coinbase, etc.) even if you didn't use them directly, as scammers often move funds through them. They have fraud departments and may flag addresses.
-    * Use platforms like Chainabuse or report to blockchain analytics firms if they have public channels, providing scammer addresses and transaction hashes.
-7.  **Warn Others:** Share information about the scam (platform name, tactics used) in online communities, social media groups (e.g., crypto forums, anti-scam groups in Nigeria), or among friends/family to prevent others from falling victim. Be factual and avoid making libelous statements.
-8.  **Beware of Recovery Scams:** You will likely be targeted by "recovery agents" or "blockchain experts" who claim they can get your lost crypto or money back for an upfront fee. These are overwhelmingly scams themselves. Do NOT pay anyone for recovery services.
-9.  **Secure Your Accounts:** Change passwords for any accounts (especially crypto exchanges, email) that might have been linked to the scam or if you used common passwords. Enable 2FA.
-10. **Understand Crypto Risks:** Recognize that cryptocurrency investments are highly volatile and prone to scams. Be extremely skeptical of promises of guaranteed high returns. Only invest what you can afford to lose, and use reputable, well-known exchanges and platforms. Do thorough due diligence (DYOR - Do Your Own Research).
-11. **Seek Legal Counsel:** If the losses are very substantial, consult a lawyer specializing in financial fraud or cybercrime in Nigeria to understand any potential legal avenues, though recovery is often very difficult and costly.
-"""
-
-JOB_OFFER_SCAM_SYSTEM_PROMPT_DETAILS = """
-This user was a victim of a 'Fake Job Offer Scam'.
-
-**Police Report Draft Specifics for Job Offer Scam:**
-- **Fake Company & Recruiter Details:** Name of the fake company, individuals involved (e.g., "recruiter's name," "HR manager's title," "interviewer's name"). Include any website URLs (often poorly made or cloned), official-looking but fake email addresses (check domain carefully), LinkedIn profiles (may be fake or impersonating real people), and phone numbers used.
-- **Job Offer Details:** Position/title offered, promised salary and benefits (often unrealistically high), location (e.g., "remote work," "overseas placement with visa assistance," "prestigious local company"). Include a copy of any fake offer letter or employment contract if received.
-- **Recruitment Process:** How the "job" was advertised or how initial contact was made (e.g., unsolicited email/LinkedIn message, ad on a legitimate job board like Jobberman/Indeed where fake ads can slip through, WhatsApp/Telegram group). Describe the "interview" process (often very brief, unprofessional, or non-existent, or done entirely via chat).
-- **Fees Paid by Victim:** Itemize every fee paid: purpose (e.g., "application processing fee," "mandatory training materials," "visa application fee," "work equipment deposit," "background check fee," "travel arrangement fee"), dates of payment, exact amounts, payment methods (bank transfer, mobile money, payment to an agent), and all beneficiary details (account name, number, bank, agent's name/number).
-- **Personal Information Compromised:** List all Personal Identifiable Information (PII) submitted, even if no money was paid (e.g., full CV, National Identification Number - NIN, Bank Verification Number - BVN, copies of passport, driver's license, academic certificates, bank account details for "salary deposit," date of birth, home address, mother's maiden name). This is crucial for identity theft risk assessment.
-- **Discovery of Scam:** How the victim realized it was a scam (e.g., company became unreachable after payment, "training" was useless, visa never materialized, research revealed company doesn't exist or isn't hiring for that role, contact at real company denied knowledge of offer).
-
-**Bank Complaint Email Draft Specifics for Job Offer Scam:**
-- **If Victim Paid Fees:**
-    - Subject: "URGENT: Fraudulent Transactions - Fake Job Offer Scam - Account [Your Account Number]"
-    - "I am writing to report payments made from my account for fees related to a fraudulent job offer from a purported company named '[Fake Company Name]'. I was deceived into believing this was a legitimate employment opportunity."
-    - Provide full transaction details for each payment: dates, amounts, your account, beneficiary names, account numbers, and banks.
-    - "The job offer has since been identified as a scam, and the 'employer' is [unreachable/has provided no legitimate services/goods]."
-    - Request: "I request an immediate investigation into these fraudulent transactions, any possible fund recall, and restrictions placed on the beneficiary accounts. I am also reporting this to the NPF/EFCC."
-- **If Victim Only Provided Bank Account Details (for "salary") but No Money Paid by Victim:**
-    - Subject: "Notification of Compromised Bank Account Details - Fake Job Offer Scam - Account [Your Account Number]"
-    - "I am writing to inform you that my bank account details ([Your Account Number]) were shared on [Date] with individuals perpetrating a fake job offer scam under the guise of '[Fake Company Name]', supposedly for salary deposit purposes. No funds were debited by me for this scam, but I am concerned about potential unauthorized access or misuse of my account details."
-    - Request: "Please place my account on heightened alert for any suspicious activity. Advise on any recommended security measures (e.g., changing online banking passwords) and confirm no unauthorized debits or activity have occurred."
-
-**Next Steps Checklist Specifics for Job Offer Scam:**
-1.  **Cease ALL Communication:** Immediately stop all contact with the "employer," "recruiter," or any associated individuals. Do not send any more money or personal information. Block their numbers and email addresses.
-2.  **Gather and Organize ALL Evidence:** Collect copies of the job advertisement, all email correspondence, chat messages (WhatsApp, Telegram, LinkedIn DMs), payment receipts/proofs, any "offer letters," "employment contracts," "visa application forms," or "training material" links received (these are likely fake but are evidence). Take screenshots of websites or profiles if they are still active.
-3.  **Contact Your Bank Immediately:**
-    * If payments were made, as per the drafted email, to report fraud and request investigation/recall.
-    * If only bank details were shared, still inform your bank to monitor your account for suspicious activity.
-4.  **File a Detailed Police Report:** With the Nigerian Police Force (NPF). Detail all financial losses and the full extent of personal information compromised (potential identity theft). Get a police report extract.
-5.  **Report to EFCC:** If significant money was lost or if extensive PII (especially NIN/BVN, passport copies) was compromised, making identity theft a high risk, report to the Economic and Financial Crimes Commission (EFCC).
-6.  **Report to Job Platforms/Websites:** Report the fake job posting to the platform where it was found (e.g., LinkedIn, Indeed, Jobberman, specific company career pages if it was a cloned/fake site). This helps them remove the ad and potentially ban the scammer.
-7.  **Protect Against Identity Theft (If PII was Compromised):**
-    * Monitor your bank accounts and any credit activity (if applicable through Nigerian credit bureaus) very closely for any unauthorized transactions or new accounts opened in your name.
-    * If your NIN or BVN was shared, be extra vigilant. While direct blocking is complex, report the compromise to your bank (for BVN) and NIMC (for NIN) and inquire about any protective flags or advice.
-    * Change passwords on critical online accounts if you suspect any link or if common information was shared.
-8.  **Be Cautious of Future Job Offers:**
-    * Legitimate employers DO NOT ask for fees (for application, training, equipment, visa, etc.) to secure a job. Any request for upfront payment is a major red flag.
-    * Be wary of unsolicited job offers, especially those with unrealistically high salaries for minimal experience, or those that conduct interviews solely via chat or very brief phone calls.
-    * Verify the legitimacy of a company and the job offer through independent research: Check the company's official website (look for a careers page with the same opening), search for the company on LinkedIn and look for real employees, look for news articles or official registrations (e.g., CAC registration in Nigeria). Call the company's official phone number (from their verified website, not the job ad) to confirm the vacancy and recruiter.
-9.  **Inform Your Network:** Warn friends, family, and professional contacts about this type of scam, especially if the scam used a referral approach or impersonated a well-known company.
-10. **Scan Devices:** If you downloaded any files or clicked links from the "employer," scan your computer/phone for malware.
-"""
-
-TECH_SUPPORT_SCAM_SYSTEM_PROMPT_DETAILS = """
-This user was a victim of a 'Tech Support Scam'.
-
-**Police Report Draft Specifics for Tech Support Scam:**
-- **Initiation of Scam:** How did it start? (e.g., alarming pop-up on computer screen with a warning and phone number – quote the warning; unsolicited phone call – note number if possible; fake security alert email – note sender and content). Date and time.
-- **Impersonated Company:** Name of the well-known company the scammers claimed to be from (e.g., Microsoft, Apple, HP, Dell, a local ISP like MTN/Glo, or a generic "Windows Support," "Computer Repair Centre"). Any names or "technician IDs" given.
-- **Claimed Problem & "Solution":** Details of the fabricated "problem" with the computer/device (e.g., "virus detected," "hacked account," "license expired," "suspicious network activity") and the "solution" or "service" they offered (e.g., "virus removal," "security software installation," "account unblocking," "system optimization").
-- **Remote Access:** Was remote access granted to the computer/device? If yes, specify the software used if known (e.g., TeamViewer, AnyDesk, LogMeIn, GoToAssist, Supremo, or a custom tool they had you download from a specific link). Describe what they did while having remote access (e.g., showed fake error messages, ran fake scans, pretended to fix things, accessed personal files).
-- **Payment Details:** Amount paid for the fake services/software. Currency. Payment method (credit/debit card – provide last 4 digits and bank; bank transfer – beneficiary name, account, bank; gift cards – type like Google Play, Apple, Steam, Amazon, and amounts/codes if recalled; cryptocurrency). Date of payment.
-- **Information/Software Compromise:** Any software the scammers installed on the device (name it if known). Any personal or financial information they might have accessed, viewed, or explicitly asked for during the session (e.g., passwords, bank details, ID information).
-
-**Bank Complaint Email Draft Specifics for Tech Support Scam:**
-- **If Payment via Bank Card/Transfer:**
-    - Subject: "URGENT: Fraudulent Transaction - Tech Support Scam - Account [Your Account Number] / Card [Last 4 Digits]"
-    - "I am writing to report a fraudulent payment made on [Date] for purported tech support services from scammers impersonating [Impersonated Company Name, e.g., Microsoft]. I was deceived by [e.g., a fake pop-up alert, an unsolicited call] into believing my computer had serious issues."
-    - "The scammers [e.g., gained remote access to my computer using [Software Name if known], convinced me to pay for unnecessary/fake services]."
-    - Transaction details: Date, time, amount, currency, merchant name on statement (often obscure or a third-party processor), or beneficiary account details for a bank transfer.
-    - Request: "I request an immediate investigation into this fraudulent transaction. Please initiate a chargeback for this card payment / investigate this fraudulent bank transfer for potential recall. I also request that my card [Card Number] be [monitored/blocked and reissued] due to potential compromise of details during the remote session. Please advise on securing my bank accounts, as online banking may have been accessed from the compromised computer."
-- **If Payment via Gift Cards:**
-    - Bank email is "Not Applicable for direct recovery of gift card value via the bank." The focus should be on reporting to the gift card issuer. The email could mention to the bank that the computer used for online banking was compromised, requesting security advice.
-
-**Next Steps Checklist Specifics for Tech Support Scam:**
-1.  **Disconnect & Isolate:** IMMEDIATELY disconnect the affected computer/device from the internet and any network to prevent further unauthorized access or data theft. Do not turn it off initially if you suspect malware that erases on shutdown, but disconnect it.
-2.  **Contact Financial Institutions:**
-    * If paid by credit/debit card or bank transfer: Contact your bank RIGHT AWAY (as per drafted email) to report fraudulent charges, request chargebacks/disputes, and block/reissue cards.
-    * If paid with gift cards: Contact the issuing company of the gift card(s) immediately (e.g., Google Play Support, Apple Support). Provide the gift card numbers, purchase receipts (if you have them), and explain they were used in a scam. Recovery is very difficult and rare, but prompt reporting is the only chance.
-3.  **Secure Your Computer/Device:**
-    * Run multiple, full scans with reputable and updated antivirus and anti-malware software (e.g., Malwarebytes, Windows Defender, reputable paid AV).
-    * Uninstall any programs the scammers asked you to install or any remote access software they used (TeamViewer, AnyDesk, etc.). Check your installed programs list carefully.
-    * Consider changing your computer's login password.
-    * If you are not tech-savvy or the problem seems persistent, take the device to a trusted, local, professional computer technician for a thorough inspection, malware removal, and system cleanup. Inform them it was a tech support scam.
-4.  **Change ALL Passwords:** From a DIFFERENT, known-secure device, change passwords for ALL important online accounts: email, banking, social media, cloud storage, shopping sites, etc., especially any accounts accessed from the compromised computer after the scam. Use strong, unique passwords for each and a password manager.
-5.  **Enable Two-Factor Authentication (2FA):** For all critical accounts.
-6.  **File Police Report:** With the Nigerian Police Force (NPF). Provide details of the scam, payment, and any scammer information.
-7.  **Report the Scam:**
-    * To the actual company that was impersonated (e.g., Microsoft has a dedicated "Report a Tech Support Scam" page: microsoft.com/reportascam). Apple and others have similar reporting channels.
-    * To the Federal Trade Commission (FTC) in the US (reportfraud.ftc.gov) as many of these scams originate internationally or use US-based infrastructure. This helps broader tracking.
-    * To the Nigerian Communications Commission (NCC) if local phone numbers were used by scammers.
-    * To the Federal Competition and Consumer Protection Commission (FCCPC).
-8.  **Review Bank/Card Statements:** Meticulously monitor all your financial statements for several months for any further unauthorized charges or suspicious activity.
-9.  **Restore from Backup (If Available):** If you have a clean backup of your system from before the scam, and if the technician advises it, you might consider restoring your system.
-10. **Be Aware of Follow-Up Scams:** Scammers sometimes call back, pretending to be from the same company offering a "refund" (another trick to get more info/money) or from a different "security" company. Hang up.
-11. **Educate Yourself:** Legitimate tech companies like Microsoft or Apple will NOT call you unsolicited to tell you your computer has a problem. They don't display pop-ups with phone numbers asking you to call them about viruses. Real error messages from your OS or AV software do not ask you to call a specific phone number.
-"""
-
-FAKE_LOAN_GRANT_SCAM_SYSTEM_PROMPT_DETAILS = """
-This user was a victim of a 'Fake Loan or Grant Scam'.
-
-**Police Report Draft Specifics for Fake Loan/Grant Scam:**
-- **Scammer Entity Details:** Name of the fake loan company, grant organization, government agency impersonated (e.g., "CBN Empowerment Fund," "Federal Government SME Grant"), or individual offering the funds. Include any website URLs (often look official but are fake), social media pages (Facebook, WhatsApp groups), phone numbers, and email addresses used.
-- **Offer Details:** How the loan/grant offer was communicated (e.g., unsolicited SMS, WhatsApp broadcast, Facebook/Instagram ad, fake news article, call from "agent"). Details of the promised loan/grant: amount offered, purported interest rates (if a loan, often unrealistically low), repayment terms, eligibility criteria mentioned, and the stated purpose (e.g., "COVID-19 relief grant," "business support fund," "educational grant," "personal loan with no credit check").
-- **Upfront Fees Paid:** Itemize ALL upfront fees paid by the victim. For each fee, specify:
-    * The reason given by scammers for the fee (e.g., "application processing fee," "insurance fee," "collateral verification fee," "legal documentation charges," "CBN approval/transfer fee," "account opening fee," "security deposit").
-    * Date of payment.
-    * Exact amount and currency.
-    * Payment method (bank transfer, mobile money like Opay/Palmpay, airtime, payment to a specific agent).
-    * ALL beneficiary details (account name, account number, bank name, agent's name and phone number).
-- **Personal/Financial Information Compromised:** List all sensitive information provided to the scammers (e.g., full name, address, phone, email, National Identification Number - NIN, Bank Verification Number - BVN, bank account details, copies of ID documents like driver's license or passport, business registration documents if applicable).
-- **False Promises & Deception:** Describe any false promises made (e.g., "guaranteed approval," "funds disbursed in 24 hours after fee payment"), and how the victim realized it was a scam (e.g., continuous demands for more fees, no loan/grant received after paying, scammers became unreachable, website disappeared).
-- **Any "Official" Documents Received:** If the scammers provided any fake "approval letters," "loan agreements," or "CBN certificates," mention these and advise the user to keep them as evidence.
-
-**Bank Complaint Email Draft Specifics for Fake Loan/Grant Scam:**
-- **If Upfront Fees Paid via Bank Transfer or Card:**
-    - Subject: "URGENT: Fraudulent Transactions - Fake Loan/Grant Scheme - Account [Your Account Number]"
-    - "I am writing to report payments made from my account for various upfront fees related to a fraudulent loan/grant offer from an entity calling itself '[Fake Loan/Grant Company Name]'. I was deceived by promises of financial assistance that never materialized."
-    - Provide full transaction details for each fee payment: dates, amounts, your account, beneficiary names, account numbers, and recipient banks.
-    - "This scheme has been identified as a scam designed solely to extort these advance fees. No loan or grant has been provided, and the 'lender/provider' is now [unreachable/demanding more fees]."
-    - Request: "I request an immediate investigation into these fraudulent transactions. Please take all possible actions to trace these funds, place restrictions on the beneficiary accounts, and advise on any possibilities for fund recall. I am reporting this matter to the NPF and EFCC."
-- **If Only Bank Details Shared (for "disbursement") but No Fees Paid by Victim:**
-    - Subject: "Notification of Compromised Bank Account Details - Fake Loan/Grant Offer - Account [Your Account Number]"
-    - "I wish to inform you that my bank account details ([Your Account Number]) were shared on [Date] with individuals/entities perpetrating a fake loan/grant offer under the name '[Fake Company Name]', supposedly for the disbursement of funds. While I did not pay any fees, I am concerned about the potential misuse of my account details."
-    - Request: "Please place my account on heightened alert for any suspicious or unauthorized activity. Kindly advise on any recommended security measures I should take."
-
-**Next Steps Checklist Specifics for Fake Loan/Grant Scam:**
-1.  **Cease ALL Communication & Payments:** Immediately stop all contact with the scammers. Do NOT send any more money for any reason ("final processing fee," "release fee," etc.) – these are all part of the scam to get more money. Block their numbers and email addresses.
-2.  **Gather and Organize ALL Evidence:** Collect copies of any advertisements, all messages (SMS, WhatsApp, email, social media DMs), payment receipts/proofs for every fee paid, any "approval letters," "loan agreements," or "official-looking" (but fake) documents received. Take screenshots of websites or social media pages if they are still active.
-3.  **Contact Your Bank Immediately:** If payments were made via your bank, use the drafted email to report the fraudulent transactions and request action. If only bank details were shared, still inform your bank to monitor your account.
-4.  **File Detailed Reports with Law Enforcement:**
-    * Nigerian Police Force (NPF): File a comprehensive report detailing the entire scam, the fees paid, and all scammer details. Get a police report extract.
-    * Economic and Financial Crimes Commission (EFCC): Especially if significant money was lost or if it appears to be an organized operation, report to the EFCC.
-5.  **Report to Regulatory & Consumer Bodies:**
-    * Central Bank of Nigeria (CBN): Report the fraudulent entity, especially if they impersonated CBN or claimed CBN approval, via CBN's consumer protection channels or fraud reporting lines.
-    * Federal Competition and Consumer Protection Commission (FCCPC): Report the deceptive practices, especially if it was an online lender. Check the FCCPC's list of approved digital money lenders and report unlisted/fraudulent ones.
-    * If the scam involved impersonation of a known government agency or program, report to that agency's official channels as well.
-6.  **Report Scam Adverts/Profiles:** Report the scam advertisement, social media profile, website, or phone number to the platform where it was found (e.g., Facebook, Google, Instagram, mobile network provider for scam SMS).
-7.  **Protect Against Identity Theft (If PII was Shared):** If NIN, BVN, or copies of ID documents were compromised, be extremely vigilant. Monitor your bank accounts. Report the compromise to your bank (for BVN) and NIMC (for NIN) and ask for advice.
-8.  **Understand Legitimate Lending/Grant Processes in Nigeria:**
-    * Legitimate lenders (banks, registered microfinance institutions, licensed digital lenders) typically DO NOT ask for significant upfront fees to be paid into personal bank accounts before loan approval and disbursement. Any fees are usually clearly stated and often deducted from the loan principal.
-    * Official government grants are announced through official government channels and websites, not usually via unsolicited SMS or WhatsApp messages from unknown numbers. Application processes are typically formal and do not require paying fees to random agents.
-9.  **Warn Others:** Share your experience (anonymously if preferred) in your community, social networks, or online forums to alert others to this specific scam tactic and entity name.
-"""
-
-SOCIAL_MEDIA_IMPERSONATION_SCAM_SYSTEM_PROMPT_DETAILS = """
-This user was a victim of a 'Social Media Impersonation Scam'.
-
-**Police Report Draft Specifics for Social Media Impersonation:**
-- **Impersonated Person:** Full name of the person impersonated, their relationship to the victim (friend, family, colleague, public figure). Their actual social media profile link/username if known.
-- **Impersonator's Fake Profile:** The social media platform (Facebook, Instagram, WhatsApp, Twitter/X, LinkedIn, TikTok). The fake profile's username/handle, display name, link (if still active or archived). Describe the profile picture (often stolen from the real person or a generic image). Note any mutual friends/followers if it was a cloned account.
-- **Method of Contact & Deception:** How the impersonator initiated contact (e.g., friend request, direct message, comment). The narrative used to deceive (e.g., "my old account was hacked, this is my new one," "I'm in trouble and need urgent help," "I have a great investment/giveaway for you").
-- **Request Made:** Specifics of what the impersonator asked for:
-    * Money: Amount, currency, reason given (medical emergency, stranded, legal fees, urgent bill, investment opportunity, giveaway entry fee).
-    * Gift Cards: Type (Amazon, Steam, Google Play), amount, how codes were to be sent.
-    * Personal Information: Logins/passwords to other accounts, bank details, NIN/BVN, photos/videos.
-    * Actions: Clicking a link (describe the link/website if possible), downloading a file, participating in a fake poll/survey.
-- **Loss Sustained:** Amount of money sent (date, payment method - bank transfer, mobile money, gift card codes; beneficiary details - account name/number/bank, phone number for mobile money, where gift card codes were sent). Value of any information or account access lost.
-- **Discovery of Scam:** How the victim realized it was an impersonator (e.g., contacted the real person, noticed inconsistencies, request seemed out of character).
-- **Evidence:** Mention availability of screenshots of the fake profile, all chat conversations, payment proofs.
-
-**Bank Complaint Email Draft Specifics for Social Media Impersonation:**
-- **If Money Sent via Bank:**
-    - Subject: "URGENT: Fraudulent Transaction - Social Media Impersonation Scam - Account [Your Account Number]"
-    - "I am writing to report a payment made from my account on [Date] due to a sophisticated social media impersonation scam. An individual impersonating my [Relationship, e.g., 'friend, [Friend's Name]'] on [Platform, e.g., 'Facebook'] contacted me claiming [Brief reason, e.g., 'to be in an emergency'] and deceitfully induced me to transfer funds."
-    - Transaction details: Date, time, amount, your account, beneficiary name, account number, bank.
-    - Request: "I request an immediate investigation into this fraudulent transaction, any possible fund recall, and restrictions on the beneficiary account. I have reported the impersonation to [Platform] and the NPF."
-- **If Banking Credentials Compromised:**
-    - Subject: "URGENT: Potential Account Compromise via Social Media Impersonation Scam - Account [Your Account Number]"
-    - "I am writing to report that I may have inadvertently disclosed sensitive banking information / clicked a malicious link / downloaded malware due to a social media impersonation scam on [Date], where an individual posing as [Impersonated Person] on [Platform] tricked me. I am concerned my account [Your Account Number] may be at risk."
-    - Request: "Please advise on immediate security measures, monitor my account for suspicious activity, and assist with password/PIN changes or card blocking if necessary."
-- **If No Direct Bank Involvement:** State "Not Applicable if no bank transactions or direct compromise of bank credentials occurred."
-
-**Next Steps Checklist Specifics for Social Media Impersonation:**
-1.  **Report Impersonating Profile:** IMMEDIATELY report the fake profile to the respective social media platform (Facebook, Instagram, WhatsApp, Twitter/X, etc.). Use their specific "report impersonation" or "report fake account" option. Provide the link to the fake profile and the real person's profile if possible.
-2.  **Inform the Real Person:** Contact the person who was impersonated (through a known, trusted channel, NOT via the suspicious account) and inform them their identity is being misused. They should also report the fake profile and warn their own contacts/followers.
-3.  **Contact Bank (If Applicable):** As per drafted email, if money was sent or bank details compromised.
-4.  **File Police Report:** With NPF. Provide all evidence (screenshots of fake profile, chats, transaction details).
-5.  **Preserve ALL Evidence:** Screenshots of the fake profile (URL too), all chat messages (export them if possible), payment confirmations, any links or files sent by the scammer (do not open suspicious files).
-6.  **Secure Your Social Media Account(s):**
-    * Change your password for that platform and any others using similar passwords.
-    * Enable Two-Factor Authentication (2FA).
-    * Review your privacy settings (who can see your posts, friend list, contact info). Make your friend list private if possible to make it harder for scammers to target your contacts.
-    * Review active sessions and logged-in devices; log out any unrecognized ones.
-    * Check for any unauthorized apps or third-party connections to your social media account.
-7.  **Warn Your Contacts:** If the impersonator might have contacted your friends/followers, post a warning on your real profile about the impersonation attempt.
-8.  **Verify Urgent Requests:** In the future, if a friend or family member contacts you on social media with an urgent request for money or sensitive information, ALWAYS verify it through a different communication channel (e.g., call their known phone number, ask a question only they would know the answer to). Be very suspicious of sudden changes in language, tone, or unusual requests.
-9.  **Scan Devices:** If you clicked any links or downloaded files from the impersonator, scan your device for malware.
-10. **If Your OWN Account Was Hacked and Used for Impersonation:** Regain control (reset password, enable 2FA), notify the platform, post a warning to your contacts, and follow steps for compromised accounts.
-"""
-
-SUBSCRIPTION_TRAP_SCAM_SYSTEM_PROMPT_DETAILS = """
-This user was a victim of a 'Subscription Trap' (e.g., misleading "free trial" that automatically converts to expensive recurring charges, or difficult-to-cancel subscriptions with hidden terms).
-
-**Police Report Draft Specifics for Subscription Trap:**
-- **Company/Website/App Details:** Full name of the company, website URL, or app name offering the subscription or "free trial." Any contact information provided by them (email, phone - often unresponsive).
-- **Product/Service:** Specific product or service involved (e.g., skincare products, weight loss supplements, streaming service, software, online game, "exclusive content" access).
-- **Initial Offer & Sign-up:** Date of signing up for the "trial" or initial purchase. What was explicitly advertised (e.g., "risk-free 7-day trial," "just pay N500 for shipping," "cancel anytime"). How payment details were provided (card number, PayPal, etc.).
-- **Misleading Terms/Hidden Conditions:** Describe the deceptive aspects: Were recurring charges not clearly disclosed? Was the cancellation process overly complicated, hidden, or non-functional? Were terms and conditions difficult to find or understand?
-- **Unauthorized Charges:** List ALL unauthorized or unexpected recurring charges debited from the victim's bank card or account. For each charge: date, exact amount, currency, and the merchant descriptor as it appears on the bank statement (this is key for the bank).
-- **Cancellation Attempts:** Document all attempts made by the victim to cancel the subscription: dates of contact, methods used (email, phone call, online form), names of any company representatives spoken to, and the company's response (e.g., refusal to cancel, claims of non-receipt of cancellation, continuous charges despite cancellation confirmation, no response at all).
-- **Evidence:** Mention availability of screenshots of the original ad/offer, website terms (if captured), email confirmations, communication attempts with the company, bank statements showing charges.
-
-**Bank Complaint Email Draft Specifics for Subscription Trap:**
-- **Subject:** "URGENT: Unauthorized Recurring Charges & Subscription Trap - [Company Name] - Card Ending [Last 4 Digits]"
-- **Opening:** "I am writing to report a series of unauthorized recurring charges debited from my [Card Type, e.g., Visa Debit] card ending in [Last 4 Digits], account number [Your Account Number], by a company named '[Company Name]' ([Website/App if known]). This appears to be a subscription trap stemming from a misleading offer on [Date of initial sign-up]."
-- **Details of Deception:** Briefly explain the misleading offer (e.g., "advertised as a free trial," "cancellation terms were not clear").
-- **List of Unauthorized Transactions:** Provide a clear, itemized list of all disputed charges: Date, Merchant Descriptor (as on statement), Amount.
-- **Cancellation Efforts:** "I have made multiple attempts to cancel this subscription and stop these charges directly with the merchant on [Dates of attempts] via [Methods, e.g., email, their website form], but [describe outcome, e.g., they have failed to stop billing, they are unresponsive, the cancellation process is impossible]." (Attach proof of cancellation attempts if possible).
-- **Request to Bank:**
-    1. "I request an IMMEDIATE CANCELLATION of any recurring payment authority (Continuous Payment Authority - CPA) linked from my card/account to this merchant, '[Company Name]'."
-    2. "I formally DISPUTE all the listed unauthorized transactions and request chargebacks for these amounts."
-    3. "Please advise if my current card needs to be blocked and reissued to prevent further charges from this merchant."
-    4. "Kindly provide a reference number for this dispute."
-
-**Next Steps Checklist Specifics for Subscription Trap:**
-1.  **Contact Your Bank IMMEDIATELY:** This is the most critical step. Call them to report the unauthorized charges and request they block future payments to that merchant. Follow up with the drafted email and any evidence they require.
-2.  **Formally Attempt to Cancel (Again, with Proof):** Even if you've tried, send one more formal cancellation request to the company via email (so you have a timestamped record). Clearly state you are cancelling and demand they stop billing. Keep a copy.
-3.  **Gather ALL Evidence:** Screenshots of the original offer/advertisement, the company's website (especially any terms and conditions, privacy policy, cancellation policy – use Wayback Machine if the site changes), all email correspondence with the company, your bank statements highlighting the charges, proof of cancellation attempts.
-4.  **Check for Merchant Contact Details:** Look thoroughly on their website for contact emails, phone numbers, or physical addresses. Sometimes these are buried in the T&Cs or privacy policy.
-5.  **Report to Consumer Protection:** File a detailed complaint with the Federal Competition and Consumer Protection Commission (FCCPC) in Nigeria (fccpc.gov.ng). Provide all your evidence. They handle deceptive business practices.
-6.  **Report to Card Network (Visa/Mastercard via your bank):** Your bank will typically handle this as part of the chargeback process, but you can mention you believe it's a violation of card network rules regarding recurring billing and clear consent.
-7.  **File Police Report (If Fraud is Clear):** If the company is entirely fictitious, made overtly fraudulent claims, or if the charges are substantial and clearly unauthorized despite cancellation, a police report can support your case with the bank and other agencies.
-8.  **Leave Online Reviews:** Share your experience factually on review sites (Trustpilot, Google Reviews, etc.) and social media to warn others about the company's practices.
-9.  **Future Prevention:**
-    * Always read the fine print (terms and conditions) BEFORE signing up for "free trials" or subscriptions that require payment details. Look specifically for how to cancel, when billing starts, and the full price.
-    * Use virtual credit cards or cards with low limits for online trials if possible.
-    * Set calendar reminders to cancel trials *before* they convert to paid subscriptions.
-    * Regularly check your bank and card statements for any unfamiliar or unauthorized recurring charges. Address them immediately.
-    * Be wary of "negative option" billing where you are charged unless you explicitly opt out after a trial.
-"""
-
-FAKE_CHARITY_SCAM_SYSTEM_PROMPT_DETAILS = """
-This user was a victim of a 'Fake Charity Scam', donating money to a cause or organization that was non-existent or fraudulent.
-
-**Police Report Draft Specifics for Fake Charity Scam:**
-- **Scammer Entity Details:** Name of the fake charity, organization, foundation, or individual/group soliciting donations. Include any website URLs (often look convincing but are fake), social media pages (Facebook, Instagram, X/Twitter, GoFundMe-style pages), phone numbers, and email addresses used.
-- **Solicitation Method & Platform:** How the donation was solicited (e.g., direct message on social media, email appeal, fake crowdfunding page on a legitimate platform, a dedicated fake charity website, in-person appeal by fake representatives – if so, describe them).
-- **Purported Cause:** The specific cause for which the donation was being collected (e.g., "urgent medical treatment for [Fake Patient Name/Story]," "disaster relief for [Specific Event, but fake collection effort]," "support for a non-existent orphanage/school/animal shelter named [Fake Org Name]," "funding for [Fake Research/Project]").
-- **Donation Details:** Amount donated by the victim, date(s) of donation, currency, payment method (bank transfer, online payment gateway like Paystack/Flutterwave if used by scammer, credit/debit card directly on a fake site, cash if in-person), and all beneficiary details (account name, account number, bank name; payment processor ID; name of crowdfunding campaign creator).
-- **Reasons for Suspecting Fraud:** How the victim realized it was a scam (e.g., the organization is unverifiable through official registries like CAC, no evidence of the claimed charitable work, website/social media profile disappeared after receiving donations, high-pressure or overly emotional tactics used, inconsistencies in their story, reports from other victims).
-- **Evidence:** Mention availability of screenshots of the appeal (website, social media post, messages), donation page, payment confirmations/receipts, any communication with the scammers.
-
-**Bank Complaint Email Draft Specifics for Fake Charity Scam:**
-- **If Donation Made via Bank Transfer, Card, or Online Gateway Linked to Bank:**
-    - Subject: "Report of Fraudulent Transaction - Donation to Fake Charity Scheme - Account [Your Account Number]"
-    - "I am writing to report a payment made from my account on [Date] which I now believe was a donation to a fraudulent charity or a deceptive fundraising appeal operating under the name/cause of '[Fake Charity/Cause Name]'."
-    - "I was induced to donate [Amount] via [Payment Method] to [Beneficiary Details] based on [briefly describe the false claim, e.g., 'an urgent appeal for a child's medical treatment that appears to be fabricated']."
-    - Transaction details: Date, amount, your account, beneficiary name/account/bank, or merchant/platform details.
-    - Request: "I request that your bank investigate this transaction as potentially fraudulent. While I understand recovery of donated funds can be difficult, I wish to report this to prevent further misuse of the financial system by these scammers and inquire about any possible actions or flagging of the recipient account."
-- **If Cash Donation (In-Person):** State "Not Applicable as donation was made in cash."
-
-**Next Steps Checklist Specifics for Fake Charity Scam:**
-1.  **Stop Further Donations:** Do not send any more money to this entity or individual, even if they contact you with further pleas or stories.
-2.  **Gather ALL Evidence:** Collect screenshots of the fake charity's website, social media pages, crowdfunding campaign page, all appeal messages (emails, DMs), any photos or stories they used, and proof of your donation(s) (bank transaction record, payment gateway receipt).
-3.  **Report to Crowdfunding Platform (If Applicable):** If the donation was made through a legitimate platform like GoFundMe, Indiegogo, or a local Nigerian crowdfunding site, report the fraudulent campaign directly to the platform's trust and safety team. They may investigate and remove the campaign, and sometimes offer refunds if their policies allow.
-4.  **Contact Your Bank/Payment Provider:** As per the drafted email, if your bank account or card was used.
-5.  **File a Police Report:** With the Nigerian Police Force (NPF). Provide all details and evidence. If the scam is widespread or involves significant amounts, also consider reporting to the EFCC.
-6.  **Verify Charity Legitimacy (For Future Donations):**
-    * **Check Registration:** In Nigeria, legitimate NGOs and charities are often registered with the Corporate Affairs Commission (CAC) as "Incorporated Trustees." You can attempt to search the CAC database or ask the charity for their registration details.
-    * **Look for Transparency:** Reputable charities usually have a clear mission, details of their programs, a board of directors, and often publish annual reports or financial statements on their official website.
-    * **Official Website & Contact:** Verify they have a professional, working website with clear contact information (physical address, official phone number, official email domain – not just Gmail/Yahoo).
-    * **Payment Methods:** Be cautious if a "charity" only accepts donations to personal bank accounts, via untraceable methods, or uses high-pressure tactics for immediate payment. Legitimate organizations usually have official bank accounts in the charity's name or secure online donation portals.
-    * **Research Online:** Search for news articles, reviews, or any negative reports about the charity.
-7.  **Report to Advertising Platforms:** If the fake charity was advertised via Google Ads, Facebook Ads, etc., report the fraudulent ad to the respective platform.
-8.  **Warn Others:** Share information about the fake charity (name, website, tactics) in your social networks or relevant online forums to prevent others from being victimized.
-9.  **Be Wary of Emotional Appeals:** Scammers often use highly emotional stories and images to pressure people into donating quickly without thinking. Take your time to verify before giving.
-"""
-
-DELIVERY_LOGISTICS_SCAM_SYSTEM_PROMPT_DETAILS = """
-This user was a victim of a 'Delivery/Logistics Scam'.
-
-**Police Report Draft Specifics for Delivery/Logistics Scam:**
-- **Scam Communication:** Full details of the fake communication: type (SMS, email, WhatsApp, phone call), sender's phone number or email address, date and time received. Exact wording of the message if possible.
-- **Impersonated Company:** Name of the courier, postal, or logistics company the scammers impersonated (e.g., DHL, FedEx, UPS, NIPOST, EMS, or a generic "International Parcel Service," "Customs Clearance Dept").
-- **Fake Package Details:** Any details given about the supposed package (e.g., "your package from [Fake Sender/Country]," "consignment number [Fake Tracking Number]").
-- **Purported Issue & Fee:** The specific reason given for needing payment (e.g., "pending customs clearance fees," "import duties unpaid," "incorrect delivery address requiring re-shipment fee," "package insurance fee," "quarantine inspection fee").
-- **Payment Demanded & Made:** Amount paid by the victim for the fake fee, currency. Date of payment. Payment method (often direct bank transfer to a personal account, mobile money, or through a dubious payment link). Full beneficiary details (account name, number, bank; recipient phone for mobile money; website of payment link).
-- **False Promises:** Any promises made upon payment (e.g., "package will be released immediately," "delivery within 24 hours").
-- **Discovery of Scam:** How victim realized it was a scam (e.g., no package arrived, tracking number was fake/invalid on official courier site, courier company denied knowledge of such fees or package).
-- **Evidence:** Mention availability of screenshots of the scam message, payment proof, details of any fake website/link.
-
-**Bank Complaint Email Draft Specifics for Delivery/Logistics Scam:**
-- **If Fake Fee Paid via Bank Transfer/Card/Online Gateway:**
-    - Subject: "URGENT: Fraudulent Transaction - Fake Delivery/Customs Fee Scam - Account [Your Account Number]"
-    - "I am writing to report a payment made from my account on [Date] for what I now understand to be a fraudulent fee related to a fake package delivery or customs charge. I was contacted by scammers impersonating [Impersonated Courier/Entity Name]."
-    - "I was deceived into paying [Amount] via [Payment Method] to [Beneficiary Details] for a purported [Reason for fee, e.g., 'customs clearance fee'] for a package that appears to be non-existent."
-    - Transaction details: Date, amount, your account, beneficiary name/account/bank, or payment link details.
-    - Request: "I request an immediate investigation into this fraudulent transaction. Please advise on possibilities for fund recall or dispute, and place restrictions on the beneficiary account if possible. I am reporting this to the NPF."
-
-**Next Steps Checklist Specifics for Delivery/Logistics Scam:**
-1.  **Do NOT Click/Call/Pay More:** If you receive such a message, do not click on any links, call any numbers provided in the message, or make any payments.
-2.  **Verify Independently:** If you are actually expecting a package, ALWAYS verify its status and any associated fees *directly* on the official website of the legitimate courier company (e.g., dhl.com, fedex.com, nipost.gov.ng) using the official tracking number provided by the *sender or seller*, NOT from an unsolicited message. You can also call the courier's official customer service number (found on their official website).
-3.  **Legitimate Fees:** Legitimate customs duties or courier fees are typically paid through official, secure channels, directly to the courier company or a designated customs broker, often with official invoices or notifications. They are rarely demanded via urgent SMS with links to pay into personal bank accounts or via mobile money to unknown individuals.
-4.  **Gather ALL Evidence:** Screenshots of the scam message (SMS, email, WhatsApp), payment proof if any fee was paid, details of any fraudulent website or payment link visited, any phone numbers or email addresses used by the scammers.
-5.  **Contact Your Bank (If Payment Made):** As per the drafted email, to report the fraud.
-6.  **File Police Report:** With the Nigerian Police Force (NPF). Provide all evidence.
-7.  **Report to Courier Company:** Report the impersonation attempt to the actual courier company whose name was used. They often have fraud prevention departments and can issue public warnings.
-8.  **Report Scam Numbers/Emails:**
-    * To your mobile network provider for scam SMS/calls (they may have a reporting mechanism).
-    * Report phishing emails to the email service provider (e.g., Gmail's "Report phishing" option).
-9.  **Be Wary of Urgency:** Scammers create a false sense of urgency (e.g., "your package will be returned if fee not paid in 2 hours"). Legitimate processes usually allow more time.
-10. **Check Sender Details:** For emails, carefully examine the sender's email address; it often looks similar to an official one but has slight misspellings or uses a generic domain (like @gmail.com instead of @dhl.com). For SMS, be wary of messages from regular mobile numbers claiming to be large companies.
-"""
-
-ONLINE_COURSE_CERTIFICATION_SCAM_SYSTEM_PROMPT_DETAILS = """
-This user was a victim of a 'Fake Online Course or Certification Scam'.
-
-**Police Report Draft Specifics for Online Course/Certification Scam:**
-- **Scammer Entity Details:** Name of the fake educational platform, institution, or individual offering the course/certification. Include website URL(s), social media pages, and any contact details used (email, phone).
-- **Course/Certification Details:** Full title of the advertised course or certification. Subject matter. Promised duration. Specific skills or knowledge to be taught. Any purported accreditation, affiliations with known universities/bodies, or recognition claimed (e.g., "Globally recognized certificate from [Fake UK University]," "Accredited by [Non-existent Nigerian Accreditation Body]," "Guaranteed job placement with [Company Names] after completion").
-- **Payment Information:** Total amount paid for the course/certification. Breakdown of fees if applicable (e.g., enrollment fee, material fee, exam fee, certificate fee). Date(s) of payment. Payment method (bank transfer, online payment gateway like Paystack/Flutterwave, credit/debit card directly on a fake site). Full beneficiary details (account name, account number, bank name; payment processor ID; company name on card statement).
-- **Deception & Non-Delivery:** How the course/certification was found to be fake, substandard, or unaccredited:
-    * Course content was plagiarized, extremely poor quality, or non-existent.
-    * Platform disappeared after payment or access was revoked.
-    * Certificate issued is not recognized by employers, professional bodies, or educational institutions.
-    * Promised job placements, internships, or career benefits never materialized.
-    * Instructors were unqualified or non-existent.
-    * Accreditation claims were found to be false upon verification.
-- **False Promises:** List any specific false promises made regarding job prospects, skill acquisition, the value/recognition of the certification, or refund policies.
-- **Evidence:** Mention availability of screenshots of the course advertisement, website pages (especially claims about accreditation, content, and guarantees), all email/chat communications with the providers, payment confirmations, any "course materials" or "certificates" received (as proof of what was delivered vs. promised).
-
-**Bank Complaint Email Draft Specifics for Online Course/Certification Scam:**
-- **If Fees Paid via Bank Transfer, Card, or Online Gateway:**
-    - Subject: "URGENT: Fraudulent Transaction - Fake Online Course/Certification - Account [Your Account Number]"
-    - "I am writing to report payment(s) made from my account for an online course/certification from '[Fake Platform/Institution Name]' ([Website URL if known]) which has proven to be fraudulent and misrepresented."
-    - "I enrolled on [Date] based on claims of [e.g., 'accredited certification leading to employment'], but the [e.g., 'course content is non-existent/plagiarized,' 'accreditation is false,' 'platform is now inaccessible']."
-    - Transaction details: Date(s), amount(s), your account, beneficiary/platform name, or merchant details on card statement.
-    - Request: "I request an immediate investigation into these fraudulent transaction(s). Please advise on the possibility of disputing these charges/initiating a chargeback (if paid by card) as services were not rendered as described and constitute a scam. I am also reporting this to the NPF and FCCPC."
-
-**Next Steps Checklist Specifics for Online Course/Certification Scam:**
-1.  **Stop Further Payments:** If it was a recurring subscription for a fake course, ensure no further payments can be made (contact bank to block if necessary).
-2.  **Gather ALL Evidence:** Systematically collect screenshots of the course advertisement, the platform's website (especially pages making claims about accreditation, course content, instructors, and guarantees – use Wayback Machine to capture pages if they might be taken down). Save all email/chat communications with the providers, payment confirmations, any access credentials, any "course materials" (even if poor quality), and any "certificates" received (as proof of what was delivered versus what was promised).
-3.  **Contact Your Bank/Payment Provider:** As per the drafted email, to report the fraudulent transactions and request disputes/chargebacks.
-4.  **File a Police Report:** With the Nigerian Police Force (NPF). Provide all details of the financial loss and deceptive practices.
-5.  **Report to Consumer Protection Agencies:**
-    * File a detailed complaint with the Federal Competition and Consumer Protection Commission (FCCPC) in Nigeria (fccpc.gov.ng) for deceptive practices and non-delivery of services as advertised.
-    * If the course claimed educational accreditation, report the fraudulent claim to the supposed accrediting body (e.g., if they falsely claimed affiliation with a real Nigerian university, inform that university's registrar). Report to the National Board for Technical Education (NBTE) or National Universities Commission (NUC) if they claimed accreditation that falls under their purview.
-6.  **Leave Online Reviews (Factually):** Share your experience on independent review websites, educational forums, and social media to warn other potential students about the scam platform/course. Be factual and stick to your experience.
-7.  **Verify Future Courses Thoroughly:**
-    * **Accreditation:** Independently verify any claims of accreditation directly with the accrediting bodies. For Nigerian institutions, check with NUC for universities and NBTE for polytechnics/monotechnics. For professional certifications, check with the relevant Nigerian or international professional body.
-    * **Provider Reputation:** Research the course provider thoroughly. Look for independent reviews (not just testimonials on their own site), search for news articles, check their physical address (if any) and contact details. See how long they've been operating.
-    * **Instructor Credentials:** If instructors are listed, try to verify their qualifications and professional background.
-    * **Realistic Promises:** Be very wary of courses guaranteeing jobs, extremely high salaries, or "instant success."
-    * **Compare:** Look at similar courses from reputable, well-known institutions to gauge if the claims and fees are reasonable.
-    * **Refund Policy:** Understand the refund policy clearly *before* paying.
-8.  **Report to Advertising Platforms:** If you found the course through an ad (Google, Facebook, Instagram), report the fraudulent ad to that platform.
-"""
-
-ATM_CARD_SKIMMING_SCAM_SYSTEM_PROMPT_DETAILS = """
-This user was a victim of 'ATM Card Skimming'.
-
-**Police Report Draft Specifics for ATM Skimming:**
-- **Compromised ATM Location:** Bank name that owns the ATM, specific branch address (if applicable), or precise location of the standalone ATM (e.g., 'GTBank ATM at Shoprite, Ikeja City Mall,' 'First Bank ATM, Allen Avenue, opposite Mr. Biggs'). Any ATM identifier number if visible.
-- **Date/Time of Suspicious Use:** Date and approximate time the victim last used their card at that specific ATM, or the date range they believe the skimming occurred if multiple uses.
-- **Unauthorized Transactions:** A detailed list of ALL unauthorized withdrawals or transactions that followed the suspected skimming. For each:
-    * Date and exact time (from bank statement/alert).
-    * Amount and currency.
-    * Location of withdrawal/transaction (e.g., 'ATM at [Different Bank/Location],' 'POS purchase at [Merchant Name, City]').
-    * Transaction type (ATM withdrawal, POS purchase, online payment).
-- **Suspicion Details:** A statement that the victim believes their card details (card number, PIN) were stolen by a skimming device (a device attached to the card slot) and/or a hidden camera (to capture PIN entry) at the specified ATM. Mention if they noticed anything unusual about the ATM at the time (e.g., loose card reader, odd keypad feel, suspicious person loitering).
-- **Compromised Card Details:** The full card number that was compromised (or last 4 digits if that's all they recall but the bank can link it), and the name of the issuing bank.
-
-**Bank Complaint Email Draft Specifics for ATM Skimming:**
-- **Subject:** "URGENT: ATM Card Skimming & Unauthorized Transactions - Card Ending [Last 4 Digits] - Account [Your Account Number]"
-- **Opening:** "I am writing to urgently report suspected ATM card skimming and subsequent unauthorized transactions on my [Card Type, e.g., Verve Debit] card ending in [Last 4 Digits], linked to my account [Your Account Number]. I believe my card was compromised at the [Bank Name of ATM] ATM located at [Specific ATM Location] on or around [Date of suspected skimming]."
-- **List of Unauthorized Transactions:** Provide a clear, itemized list: Date, Time, Amount, Location/Merchant, Transaction Type.
-- **Request to Bank (Emphasize Urgency):**
-    1. "I request the IMMEDIATE BLOCKING of the compromised card ([Full Card Number if known, or last 4 digits]) to prevent any further fraudulent activity."
-    2. "I formally DISPUTE all the listed unauthorized transactions and request a full investigation and reimbursement as per the Central Bank of Nigeria (CBN) guidelines on card fraud and consumer protection."
-    3. "Please investigate the security of the ATM at [Compromised ATM Location] if it belongs to your bank, or report to the owner bank if it's another bank's ATM."
-    4. "Kindly provide me with your bank's official fraud report forms and a reference number for this complaint."
-    5. "Advise on the process for obtaining a replacement card and any necessary PIN changes."
-
-**Next Steps Checklist Specifics for ATM Skimming:**
-1.  **Contact Your Bank IMMEDIATELY (Phone First, then Email):** This is the absolute top priority. Call your bank's official 24/7 customer service or fraud reporting line (usually on the back of your card or their official website). Report the suspected skimming and unauthorized transactions, and request the card be blocked instantly. Follow up immediately with the drafted written complaint email to have a documented record. Get a reference number for your call and email.
-2.  **Change PINs:** Once you get a replacement card, choose a new, strong PIN. If you used a similar PIN on other cards, change those as well as a precaution.
-3.  **Review Bank Statements Meticulously:** For several weeks/months following the incident, carefully review all your bank statements and online transaction history for ANY further unauthorized transactions. Scammers might test with small amounts first or use details later. Report any new suspicious activity immediately.
-4.  **File a Police Report:** Take the drafted report and copies of your bank statement showing the fraudulent transactions to the nearest Nigerian Police Force (NPF) station. Explain the situation clearly. Obtain an official police report extract or case number, as your bank will likely require this for their investigation and potential reimbursement.
-5.  **Cooperate with Bank Investigation:** Your bank will conduct an investigation. Provide them with all requested information promptly, including the police report.
-6.  **Future ATM Use - Enhanced Caution:**
-    * **Inspect the ATM Thoroughly Before Use:**
-        * **Card Slot:** Look for anything unusual, loose, bulky, or ill-fitting attached to the card reader. Wiggle it gently; if it moves or feels insecure, don't use it. Compare it to other ATMs of the same bank if possible.
-        * **Keypad:** Check if the keypad feels too thick, spongy, or loose – it could be a keypad overlay.
-        * **Hidden Cameras:** Look for tiny pinhole cameras in unusual places above the keypad, on the ATM fascia, or even in nearby brochure holders or light fixtures.
-    * **Always Shield Your PIN:** Use your other hand and your body to cover the keypad completely when entering your PIN, even if no one appears to be around.
-    * **Location Choice:** Prefer ATMs in well-lit, secure locations, ideally inside bank branches during banking hours. Be more cautious with standalone ATMs in remote or poorly lit areas.
-    * **Be Aware of Surroundings:** If anyone is loitering suspiciously near the ATM or trying to "help" you, cancel your transaction and leave. Don't accept help from strangers at an ATM.
-    * **Transaction Issues:** If the ATM malfunctions, cancels your transaction unexpectedly, or retains your card, report it to the bank immediately using their official contact number.
-7.  **Understand Your Rights & Bank's Liability:** Familiarize yourself with the CBN's guidelines on consumer protection regarding electronic payments and card fraud. Banks have responsibilities, but prompt reporting by the customer is also critical.
-8.  **Consider Transaction Alerts:** Ensure you have SMS or email alerts set up for all transactions on your account so you are notified immediately of any activity.
-"""
-
-PICKPOCKETING_SCAM_SYSTEM_PROMPT_DETAILS = """
-This user was a victim of 'Pickpocketing with Distraction'.
-
-**Police Report Draft Specifics for Pickpocketing:**
-- **Incident Details:** Date, exact time (as accurately as possible), and specific location of the incident (e.g., 'Oshodi bus stop, under the bridge, while waiting for a bus to Ikeja,' 'Balogun Market, near X plaza, while shopping for fabrics,' 'Inside a crowded danfo bus on route from Yaba to Obalende, near [Specific Bus Stop/Landmark]').
-- **Method of Operation:** Detailed description of how the distraction occurred (e.g., one person intentionally bumped into me heavily, another person dropped items and I bent to help, someone engaged me in a seemingly innocent conversation, a commotion was created nearby) and how the theft is believed to have happened during or immediately after the distraction.
-- **Stolen Items - Comprehensive List:**
-    * **Wallet/Purse:** Brand, color, material.
-        * Cash: Exact or estimated amount and currency (NGN, USD, etc.).
-        * Bank Cards: For EACH card - Issuing Bank Name (e.g., GTBank, Access Bank), Card Type (Verve, Visa Debit, Mastercard Credit), Card Number (if known, even last 4 digits).
-        * Identification Cards: National ID Card (NIN slip), Driver's License, Voter's Card, Passport (if carried), Student ID, Office ID, any other important membership or access cards.
-    * **Phone:** Make (e.g., iPhone, Samsung, Tecno), Model (e.g., 13 Pro, Galaxy S22, Camon 19), Color, Estimated value, any unique identifiers (IMEI if known, but unlikely at time of report). Note if banking apps or sensitive info were accessible without immediate password/biometrics.
-    * **Bag (if stolen):** Type (handbag, backpack, rucksack), brand, color, material.
-    * **Other Valuables:** Jewelry (describe pieces), keys (house, car, office), important documents, medication, etc.
-- **Suspect(s) Description:** If any details were observed: number of people believed to be involved (often work in teams), approximate age, gender, height, build, clothing, hair, any distinguishing features (scars, tattoos, accents, specific phrases used).
-- **Witnesses:** Note if any other people were present who might have witnessed the incident or the suspects (though obtaining their details might be difficult or unsafe at the time).
-- **Immediate Actions Taken by Victim:** (e.g., "I immediately checked my pockets/bag and realized my wallet was gone," "I shouted for help but the suspects had disappeared into the crowd").
-
-**Bank Complaint Email Draft Specifics for Pickpocketing:**
-- This section is CRUCIAL if bank cards were stolen. If only cash/other items, this part should state "Not Applicable if no bank cards were stolen."
-- **If bank cards (ATM/debit/credit) were stolen:**
-    - Subject: "URGENT ACTION: Report of Stolen Bank Card(s) due to Pickpocketing - IMMEDIATE BLOCK REQUIRED - Account(s) [List relevant account numbers if known]"
-    - "I am writing to urgently report the theft of my bank card(s) through pickpocketing on [Date of incident] at approximately [Time of incident] at [Location of incident]."
-    - "The following card(s) issued by your bank were stolen:
-        1. [Bank Name] [Card Type, e.g., Verve Debit] Card ending in [Last 4 digits, if known, or state 'linked to account X']
-        2. [Bank Name] [Card Type, e.g., Visa Credit] Card ending in [Last 4 digits, if known]" (List all cards from that bank).
-    - Request:
-        1. "I request the IMMEDIATE and PERMANENT BLOCKING of all listed cards to prevent any unauthorized transactions."
-        2. "Please confirm if any transactions have occurred on these cards since [Time of theft, or state 'since I last used them safely on [Date/Time]'] and provide details if so."
-        3. "Advise on your bank's policy regarding liability for fraudulent transactions on stolen cards and the process for disputing any such transactions."
-        4. "Please guide me on the procedure for obtaining replacement cards and new PINs."
-        5. "Provide a reference number for this report."
-
-**Next Steps Checklist Specifics for Pickpocketing:**
-1.  **Ensure Personal Safety First:** If you are in a threatening situation or feel unsafe, get to a secure location.
-2.  **Contact ALL Your Banks IMMEDIATELY (If Cards Stolen):** This is the absolute top priority. Call the official 24/7 customer service/fraud line for EACH bank whose card was stolen. Report the theft and request immediate blocking of the cards. Follow up with the drafted email for a written record.
-3.  **Report to the Police:** Go to the nearest Nigerian Police Force (NPF) station to where the incident occurred. File a detailed report using the drafted information. Obtain an official police report extract or case number. This is essential for insurance claims (if any), replacing official documents, and for bank investigations.
-4.  **Block SIM Card & Phone (If Phone Stolen):** Contact your mobile service provider (MTN, Glo, Airtel, 9mobile) immediately. Report the phone theft, request them to block your SIM card to prevent unauthorized calls, texts, or data usage (which could access OTPs for bank transactions if your banking is linked). Also, ask them to blacklist the phone's IMEI number to make it harder for the thief to use or resell the phone within Nigeria.
-5.  **Report Loss of ID Documents:**
-    * National ID (NIN): Report to the National Identity Management Commission (NIMC) and start the replacement process.
-    * Driver's License: Report to the Federal Road Safety Corps (FRSC).
-    * Voter's Card: Report to the Independent National Electoral Commission (INEC).
-    * Passport: Report to the Nigerian Immigration Service (NIS).
-    * Office/Student ID: Report to your employer/educational institution.
-6.  **Change Online Passwords (If Phone Stolen & Accessible):** If your stolen phone had access to email, social media,.   banking apps without immediate strong authentication, change the passwords for those critical accounts from a secure device as soon as possible. Enable 2FA on all accounts.
-7.  **Mentally Reconstruct the Event:** While details are fresh, write down everything you can remember about the incident, the location, the suspects, and the sequence of events. This will help your police report.
-8.  **Inform Relevant Parties:** If house/car keys were stolen, take steps to secure your property/vehicle (e.g., change locks). If work-related items were stolen, inform your employer.
-9.  **Be Vigilant in Crowded Areas:**
-    * Secure valuables: Use anti-theft bags, money belts, or keep wallets/phones in front pockets that are buttoned or zipped. Avoid displaying cash or expensive items openly.
-    * Be aware of your surroundings, especially in markets, bus stops, crowded buses, and event venues.
-    * Be wary of unusual distractions or people getting unnecessarily close. Pickpocketing teams often create a diversion.
-10. **Consider Remote Security Features:** For smartphones, enable "Find My Device" features (e.g., Google Find My Device, Apple Find My iPhone) beforehand, which allow for remote locking, erasing, and location tracking (if the phone is online).
-"""
-
-REAL_ESTATE_HOSTEL_SCAM_SYSTEM_PROMPT_DETAILS = """
-This user was a victim of a 'Real Estate/Hostel Scam by a Fake Agent' (property doesn't exist, agent disappears after collecting deposit/rent).
-
-**Police Report Draft Specifics for Real Estate Scam:**
-- **Fake Agent Details:** Full name(s) used by the agent, all known phone number(s), email address(es), WhatsApp details. Any company name or affiliation they claimed (e.g., "[Fake Realty Name] Properties," "Agent for [Landlord's Fake Name]"). Describe their appearance if met in person.
-- **Property Details:** Full address of the property supposedly for rent or sale (house number, street, area, LGA, city). Detailed description of the property as advertised or shown (type - apartment, duplex, self-contain, hostel room; number of rooms, condition, amenities promised).
-- **Advertisement Source:** Where the property was advertised (e.g., Jiji.ng, PropertyPro.ng, NigeriaPropertyCentre.com, Facebook group, Instagram, WhatsApp status, newspaper ad, referral from someone – who might also be a victim or unknowingly part of the chain). Keep screenshots/links of the ad.
-- **Interaction Timeline:** Dates of all interactions: when the property ad was first seen, date(s) of communication with the agent, date of property viewing (if any actual viewing occurred, or if it was a fake/rushed viewing, or if only photos/videos were shown). Dates of all payments.
-- **Payment Details:** Total amount paid. Itemize each payment:
-    * Purpose (e.g., "inspection fee," "agent fee/commission," "agreement fee," "caution deposit/security deposit," "first year's rent," "part payment for purchase").
-    * Date of each payment.
-    * Method of each payment (bank transfer, POS, cash).
-    * For bank transfers/POS: Full beneficiary account name, account number, bank name. Transaction references.
-- **Deception & Discovery:** How the scam was discovered (e.g., agent became unreachable after final payment, keys provided didn't work or were for a different property, legitimate owner/occupants appeared, property was found to be already occupied, property was non-existent or in a dilapidated state completely different from what was shown/promised, agent kept demanding more fees for frivolous reasons).
-- **Fake Documents:** Mention any "tenancy agreements," "receipts," "offer letters," or "property documents" provided by the fake agent (these are part of the scam but crucial evidence).
-- **Witnesses:** Anyone who accompanied the victim during viewings or interactions with the agent.
-
-**Bank Complaint Email Draft Specifics for Real Estate Scam:**
-- **If Payments Made via Bank Transfer or POS to Fake Agent:**
-    - Subject: "URGENT: Fraudulent Transactions - Fake Real Estate/Hostel Agent Scam - Account [Your Account Number]"
-    - "I am writing to report payments made from my account for a property rental/purchase that has been identified as fraudulent. I was deceived by an individual posing as a real estate agent named [Agent's Fake Name] for a property at [Property Address]."
-    - "Payments totaling [Total Amount Paid] were made via [Bank Transfer/POS] to [Beneficiary Account Name, Number, Bank] on [Date(s)] for [e.g., 'agent fees, agreement, and rent deposit']."
-    - "The agent has since [e.g., disappeared, the property is unavailable/non-existent], and this is clearly a scam."
-    - Request: "I request an immediate investigation into these fraudulent transactions. Please take all possible actions to trace these funds, place restrictions/lien on the beneficiary account(s), and advise on any possibilities for fund recall. I have reported this matter to the Nigerian Police Force and EFCC."
-
-**Next Steps Checklist Specifics for Real Estate Scam:**
-1.  **Cease ALL Contact & Payments:** Immediately stop all further communication with the fake agent. Do NOT make any more payments, regardless of their threats or new promises. Block their numbers/profiles.
-2.  **Gather and Organize ALL Evidence:** This is critical. Collect:
-    * Screenshots/copies of the property advertisement (online or print).
-    * All communication records (WhatsApp chats – export them, SMS, emails, call logs if possible) with the agent.
-    * Copies of any "agreements," "receipts," "offer letters," or any documents they provided (even if fake).
-    * Proof of ALL payments (bank transfer slips/confirmations, POS receipts, bank statements highlighting the debits).
-    * Photos/videos of the property if you took any during a viewing (or from the ad).
-    * Any known details of the agent (phone numbers, bank accounts they used, photos if you have any).
-3.  **Contact Your Bank Immediately:** As per the drafted email, if payments were made via your bank.
-4.  **File Detailed Reports with Law Enforcement:**
-    * **Nigerian Police Force (NPF):** File a comprehensive report at the police station covering the area where the property is located or where the main interactions/payments happened. Provide all your evidence. Insist on an official report extract or case number.
-    * **Economic and Financial Crimes Commission (EFCC):** Especially if a significant amount of money is involved (typically above a certain threshold, but report anyway if substantial) or if it seems like an organized fraud ring.
-5.  **Report to Property Platforms:** If the scam was advertised on a property website (e.g., PropertyPro, NigeriaPropertyCentre) or social media platform, report the fraudulent listing and the agent's profile to the platform administrators. Provide evidence.
-6.  **Warn Others:** Share your experience (anonymously if preferred, but with key details like agent's fake name, phone numbers, area of operation) in your network, local community groups, or online forums/social media groups dedicated to exposing scams in Nigeria. This can prevent others from falling victim.
-7.  **For Future Property Dealings in Nigeria (Essential Precautions):**
-    * **Verify Agent Legitimacy:** Deal with registered real estate agents/companies if possible. Ask for their office address, CAC registration (for companies), and affiliation with professional bodies like the Nigerian Institution of Estate Surveyors and Valuers (NIESV) or Estate Rent and Commission Agents Association of Nigeria (ERCAAN). Be wary of agents who only operate via phone/WhatsApp and have no physical office.
-    * **Thoroughly Inspect Property:** Always insist on physically inspecting the property you intend to rent or buy. Be suspicious if an agent makes excuses to prevent a full inspection or rushes you.
-    * **Verify Ownership/Authority:** Before making significant payments (especially for rent or purchase deposits):
-        * Ask the agent for proof of the landlord's ownership (e.g., copy of Certificate of Occupancy, Deed of Assignment, Survey Plan) and a letter of authority from the landlord authorizing them to let/sell the property.
-        * If possible, try to meet the actual landlord or a verified representative.
-        * For property purchases, it is highly advisable to engage a lawyer to conduct due diligence, including searches at the relevant Land Registry to confirm ownership and check for encumbrances.
-    * **Avoid Cash Payments for Large Sums:** For rent, deposits, or purchase payments, try to make payments via traceable bank transfers to official company accounts (if dealing with a registered company) or directly to the verified landlord's account. Get proper receipts. Be very wary of requests for large cash payments or payments into multiple individual personal accounts.
-    * **Legal Review of Agreements:** Have any tenancy agreement, lease agreement, or sale agreement reviewed by your own trusted lawyer *before* you sign and make substantial payments. Do not rely solely on the agent's or landlord's lawyer.
-    * **"Too Good To Be True" Red Flag:** Be highly suspicious of properties offered at significantly below market rates or agents pressuring you for immediate payment to "secure" a deal.
-8.  **Seek Legal Advice:** If significant funds were lost, consult a lawyer about potential civil action if the scammer or their assets can be identified, though this is often challenging and costly.
-"""
-
-FAKE_POLICE_OFFICIAL_IMPERSONATION_SCAM_SYSTEM_PROMPT_DETAILS = """
-This user was a victim of 'Fake Police or Official Impersonation' leading to extortion, bribery, or theft.
-
-**Police Report Draft Specifics for Fake Official Impersonation:**
-- **Incident Details:** Date, exact time, and specific location of the encounter (e.g., 'Lekki-Epe Expressway, near X landmark,' 'Allen Avenue junction, Ikeja,' 'Along [Street Name], [Area]'). Be as precise as possible.
-- **Impersonators' Details:**
-    * Number of individuals involved.
-    * What agency they claimed to represent (e.g., Nigerian Police Force - NPF, EFCC, LASTMA, VIO, NDLEA, "Special Task Force," "Federal Operations Unit").
-    * Description of uniforms (if any): color, type, any markings, badges, name tags (note details even if likely fake).
-    * Description of any identification shown: type of ID, what it looked like, any names or numbers visible (again, likely fake but record it).
-    * Physical description of each impersonator if possible: gender, approximate age, height, build, complexion, hair, any distinguishing features (scars, tattoos, accents, specific phrases used).
-    * Vehicle used (if any): type (car, van, motorcycle - keke), make, model, color, and license plate number (crucial if seen, even partially). Note if it had any official-looking markings (often fake or temporary).
-- **Interaction Details:**
-    * How they approached/stopped the victim (e.g., flagged down vehicle, approached on foot, blocked path).
-    * The false accusation, alleged offense, or reason given for the stop/interaction (e.g., "routine stop and search," "vehicle papers violation," "illegal phone use while driving," "suspicious loitering," "expired documents," "dress code violation" - some are absurd).
-    * The specific demands made (e.g., demand for money as a "fine" or "bail," request to search phone/belongings, demand to go to an "office" or ATM).
-- **Extortion/Theft Details:**
-    * Amount of money demanded and amount actually paid (specify if bribe, "settlement," or "bail"). Currency.
-    * Method of payment (cash, forced POS transaction, forced bank transfer, forced mobile money transfer). If electronic, get beneficiary details (account name, number, bank; POS merchant name; recipient phone for mobile money).
-    * Any items stolen under false authority (phone, laptop, wallet, documents, goods from a vehicle). Describe items and estimated value.
-- **Coercion & Threats:** Detail any threats (e.g., of arrest, detention, impounding vehicle, physical harm), intimidation, or coercion used by the impersonators to compel compliance.
-- **Witnesses:** Were there any other people (passersby, other motorists) who witnessed the incident? (May be hard to get details, but note if present).
-- **Victim's Actions:** What the victim said or did during the encounter.
-
-**Bank Complaint Email Draft Specifics for Fake Official Impersonation:**
-- **Applicable if the victim was coerced into making a payment via bank transfer, POS, or forced ATM withdrawal:**
-    - Subject: "URGENT: Coerced Financial Transaction Under Duress - Impersonation of Officials - Account [Your Account Number]"
-    - "I am writing to report a financial transaction made from my account/card on [Date] at approximately [Time] under extreme duress, intimidation, and extortion by individuals impersonating [e.g., 'Nigerian Police officers,' 'LASTMA officials']."
-    - "The incident occurred at [Location]. I was [briefly describe coercion, e.g., 'threatened with arrest and forced to make a POS payment / transfer funds']."
-    - Transaction details: Date, time, amount, currency.
-        * For POS: Merchant name on slip (if any), POS ID if visible.
-        * For Transfer: Beneficiary account name, number, bank.
-        * For Forced ATM Withdrawal: ATM location (if forced to go to one).
-    - Request: "I request an immediate investigation into this fraudulent and coerced transaction. Please advise on any possibility of transaction reversal, placing restrictions on the beneficiary account (for transfers), or disputing the POS charge. I have reported/am reporting this incident to the Nigerian Police Force."
-
-**Next Steps Checklist Specifics for Fake Official Impersonation:**
-1.  **Ensure Your Safety:** If still in the vicinity or feeling threatened, move to a safe, public, well-lit location.
-2.  **Write Down ALL Details IMMEDIATELY:** While the incident is fresh in your memory, write down every single detail you can recall: time, location, descriptions of impersonators, vehicle, uniforms, IDs, what was said, threats made, amounts paid, items stolen. Be as meticulous as possible.
-3.  **Report to the ACTUAL Nigerian Police Force (NPF):** Go to the nearest police station (preferably in the division where the incident occurred) or a specialized police complaints unit (e.g., X-Squad if it's about police misconduct, though these were impersonators). File a detailed formal complaint. Provide all the details you wrote down. Insist on getting an official report extract or case number.
-4.  **Report to the Impersonated Agency (If Known):** If the impersonators claimed to be from a specific agency (e.g., EFCC, LASTMA, NDLEA, VIO, Customs), you should also report the incident directly to that agency's official public complaints, anti-corruption, or provost department. Many agencies have dedicated hotlines or online reporting portals on their official websites. This helps them track impersonation trends.
-5.  **Contact Your Bank (If Financial Transaction Occurred):** As per the drafted email, to report coerced payments and explore options.
-6.  **Preserve Evidence:** Keep any receipts (e.g., POS slip, even if forced), note down bank transaction details, save any photos/videos if you were able to discreetly and safely capture any (e.g., of their vehicle, or if they gave any "document").
-7.  **Seek Medical Attention (If Injured or Traumatized):** If you were physically harmed or are experiencing significant emotional distress/trauma, seek medical attention and consider talking to a counselor.
-8.  **Inform Trusted Contacts:** Let friends or family know what happened, especially if you are feeling shaken.
-9.  **Understand Your Rights When Dealing with Officials in Nigeria:**
-    * Officers should identify themselves clearly with valid ID.
-    * You have the right to know the reason for a stop or arrest.
-    * You generally have the right to contact a lawyer.
-    * Demands for on-the-spot cash "fines" or "bail" paid directly to officers or into personal accounts are almost always illegal and indicative of corruption or impersonation. Official payments are usually made at designated government offices or banks with official receipts.
-10. **Report to Police Oversight Bodies:** The Police Public Complaint Rapid Response Unit (PCRRU) and the Police Service Commission (PSC) are channels for reporting misconduct by *actual* police officers. If there's any doubt whether the officials were fake or real but abusive, you can report to these bodies as well.
-11. **Dashcam/Witnesses:** If your vehicle has a dashcam that captured the incident, preserve the footage. If there were credible witnesses who might be willing to provide a statement to the police (and it's safe to approach them), their input could be valuable.
-"""
-
-POS_MACHINE_TAMPERING_SCAM_SYSTEM_PROMPT_DETAILS = """
-This user was a victim of 'POS Machine Tampering'.
-
-**Police Report Draft Specifics for POS Tampering:**
-- **Vendor Details:** Name and full address of the retail establishment, vendor, or service provider where the suspicious POS transaction occurred (e.g., 'XYZ Supermarket, 15 Awolowo Road, Ikeja,' 'ABC Fuel Station at [Specific Junction], Lagos,' 'Mama Nkechi's Provisions Store, [Market Name/Stall Number]').
-- **Transaction Details:** Date and approximate time of the transaction. The specific goods or services purchased. The original, correct amount agreed upon for the transaction.
-- **Fraudulent Activity:**
-    * **Overcharging:** The actual, higher amount charged to the card.
-    * **Card Cloning/Unauthorized Debits:** List ALL subsequent unauthorized transactions that appeared on the statement after the suspicious POS use: dates, times, exact amounts, currency, and full merchant names/locations for these fraudulent debits. Note if these transactions are unusual for the victim's spending pattern or occurred in distant locations.
-- **Suspicious POS Behavior:** Any suspicious actions noted from the vendor, cashier, or attendant handling the POS machine:
-    * Taking the card out of sight (e.g., under the counter).
-    * Multiple attempts to swipe/insert the card, claiming "network issues" or "card error."
-    * Using multiple different POS machines for one transaction.
-    * The POS machine looking physically tampered with (e.g., bulky attachments, loose keypad, wires visible, different color/texture parts).
-    * Rushing the victim through the transaction or distracting them while they input their PIN.
-    * Asking the victim to input their PIN multiple times.
-    * Refusal to provide a printed receipt or the receipt being unclear/faded.
-- **Card Details:** The specific bank card details (Bank Name, Card Type - Verve, Visa, Mastercard, last 4 digits of the card number) that was used.
-- **Evidence:** Mention availability of transaction receipts (even if showing the wrong amount), bank statements highlighting the fraud, photos of the POS or establishment if safely taken.
-
-**Bank Complaint Email Draft Specifics for POS Tampering:**
-- **Subject:** "URGENT: Fraudulent POS Transactions / Suspected Card Compromise at Merchant - Card Ending [Last 4 Digits] - Account [Your Account Number]"
-- **Opening:** "I am writing to report [an overcharge / a series of unauthorized transactions] on my [Card Type, e.g., Zenith Bank Visa Debit] card ending in [Last 4 Digits], linked to my account [Your Account Number]. I believe my card details were compromised or misused during a POS transaction at '[Vendor Name/Location]' on [Date of suspicious transaction]."
-- **Details of Suspicious Transaction:** Describe the original transaction (what was bought, agreed price).
-- **Details of Fraud:**
-    * If overcharged: "I was charged [Fraudulent Amount] instead of the agreed [Correct Amount]."
-    * If cloned/unauthorized debits: Provide an itemized list of ALL subsequent unauthorized transactions: Date, Time, Amount, Merchant Descriptor (as on statement).
-- **Reason for Suspicion:** "I suspect POS tampering because [e.g., 'the attendant took my card out of sight,' 'multiple attempts were made to process the payment,' 'subsequent unauthorized debits appeared shortly after this transaction']."
-- **Request to Bank (Emphasize Urgency):**
-    1. "I request the IMMEDIATE BLOCKING of the compromised card ([Full Card Number if known, or last 4 digits]) to prevent any further fraudulent activity."
-    2. "I formally DISPUTE [the overcharge of [Overcharge Amount] / all the listed unauthorized transactions totaling [Total Fraudulent Amount]] and request a full investigation and chargeback/reimbursement as per CBN guidelines on card fraud."
-    3. "Please investigate the merchant '[Vendor Name/Location]' and the specific POS terminal if identifiable, for potential compromise."
-    4. "Kindly provide me with your bank's official fraud report forms and a reference number for this complaint."
-    5. "Advise on the process for obtaining a replacement card and new PIN."
-
-**Next Steps Checklist Specifics for POS Tampering:**
-1.  **Contact Your Bank IMMEDIATELY (Phone First, then Email):** This is the top priority. Call your bank's official 24/7 customer service or fraud reporting line. Report the suspicious charges/activity, explain your suspicion of POS tampering, and request the card be blocked instantly. Follow up immediately with the drafted written complaint email. Get a reference number.
-2.  **File a Police Report:** With the Nigerian Police Force (NPF). Provide the drafted report, details of the vendor, and copies of your bank statement showing the fraudulent transactions. The bank will likely require a police report for their investigation.
-3.  **Review Bank Statements Meticulously:** For several weeks/months, carefully check all bank statements and online transaction history for ANY further unauthorized transactions. Cloned card details can be used much later or sold. Report any new suspicious activity immediately.
-4.  **Preserve ALL Evidence:** Keep the original transaction receipt from the suspicious vendor (if you got one), any receipts for subsequent fraudulent transactions, bank statements highlighting the fraud, and any notes you made about the incident or vendor.
-5.  **Future POS Use - Best Practices in Nigeria:**
-    * **Card Always in Sight:** Never let your card be taken out of your sight by a vendor/attendant. If they need to move to a different POS, accompany them or ask them to bring the POS to you.
-    * **Shield Your PIN:** Always cover the keypad with your other hand and your body when entering your PIN, even if no one seems to be looking.
-    * **Check Amount Before PIN:** Double-check the transaction amount displayed on the POS screen *before* you enter your PIN. Ensure it's correct and in Naira (NGN).
-    * **Receipts:** Always ask for a printed receipt. Compare the amount on the receipt with your SMS alert (if enabled) and later with your bank statement. Check the merchant name on the receipt.
-    * **"Network Issues":** Be very wary if a vendor claims "network issues" and tries to swipe/insert your card multiple times, especially on different machines, or asks you to re-enter your PIN repeatedly. This can be a tactic to capture details or make duplicate charges. Consider an alternative payment method or going elsewhere.
-    * **Inspect POS Device:** While difficult for an average user, glance at the POS. If it looks unusually bulky, has loose parts, wires sticking out, or a keypad that feels different or wobbly, be cautious.
-6.  **Report to Consumer Protection/Regulators:**
-    * Report the incident and the vendor (especially if it's a known business) to the Federal Competition and Consumer Protection Commission (FCCPC).
-    * Inform the Central Bank of Nigeria (CBN) through its consumer protection channels, as they regulate POS operations and payment systems.
-7.  **Inform Merchant (If a Reputable Business):** If the incident happened at a seemingly legitimate store or business, you might inform their management or head office. They might be unaware of a rogue employee or compromised terminal and should investigate. However, prioritize bank and police reporting first.
-"""
-
-LOTTERY_OR_YOUVE_WON_SCAM_SYSTEM_PROMPT_DETAILS = """
-This user was a victim of a 'Lottery or "You've Won!" Scam'.
-
-**Police Report Draft Specifics for Lottery/Win Scam:**
-- **Notification Method:** How the "win" was communicated (e.g., SMS, email, phone call, social media message - specify platform like Facebook/WhatsApp, pop-up ad). Include the sender's phone number, email address, or profile name/link. Date and time of notification.
-- **Fake Lottery/Promotion Details:** Name of the supposed lottery, promotion, company, or foundation (e.g., "MTN [Year] Mega Promo," "Dangote Foundation Empowerment Grant," "Coca-Cola Anniversary Draw," "International FIFA World Cup Lottery," "Google User Reward Program").
-- **Prize Details:** The specific prize supposedly won (e.g., NGN 5,000,000 cash, a new car model like Toyota Camry, an iPhone 15 Pro Max, an overseas trip, a scholarship).
-- **Fees Demanded & Paid:** Itemize ALL upfront fees paid by the victim to "claim the prize." For each fee:
-    * The reason given by scammers for the fee (e.g., "processing fee," "tax clearance certificate fee," "delivery charge," "CBN international transfer fee," "account activation fee," "anti-terrorism certificate fee," "customs duty for prize").
-    * Date of payment.
-    * Exact amount and currency.
-    * Payment method (bank transfer, airtime top-up/recharge card PINs, mobile money like Opay/Palmpay, payment to a specific "agent").
-    * ALL beneficiary details (account name, account number, bank name; phone number for airtime/mobile money; agent's name and contact details).
-- **Personal Information Shared:** List any personal or financial information provided to the scammers (e.g., full name, address, phone, email, bank account details for "prize deposit," National Identification Number - NIN, Bank Verification Number - BVN, copy of ID).
-- **Communication Log:** Briefly describe the communication pattern (e.g., "they called me multiple times pressuring for payment," "all communication was via WhatsApp").
-- **Discovery of Scam:** How the victim realized it was a scam (e.g., prize never arrived after paying fees, continuous demands for more fees, scammers became unreachable, research showed the lottery was fake).
-- **Evidence:** Mention availability of screenshots of messages, emails, payment proofs, any fake "winner certificates" or documents sent by scammers.
-
-**Bank Complaint Email Draft Specifics for Lottery/Win Scam:**
-- **If Fees Paid via Bank Transfer or Card:**
-    - Subject: "URGENT: Fraudulent Transactions - Fake Lottery/Prize Scam - Account [Your Account Number]"
-    - "I am writing to report payments made from my account for various fees related to a fraudulent lottery/prize claim. I was deceived by a message/call on [Date] claiming I had won [Prize] in the '[Fake Lottery/Promotion Name]'."
-    - "To claim this non-existent prize, I was tricked into paying fees totaling [Total Amount Paid] via [Bank Transfer/Card Payment] to [Beneficiary Details if one, or state 'various accounts']."
-    - Provide full transaction details for each fee payment: dates, amounts, your account, beneficiary names, account numbers, and recipient banks.
-    - Request: "I request an immediate investigation into these fraudulent transactions. Please take all possible actions to trace these funds, place restrictions on the beneficiary accounts, and advise on any possibilities for fund recall. This was a scam designed to extort money. I am reporting this to the NPF/EFCC."
-
-**Next Steps Checklist Specifics for Lottery/Win Scam:**
-1.  **Cease ALL Communication & Payments:** Immediately stop all contact with the scammers. Do NOT send any more money for any reason. They will often try to get more by claiming the prize is "stuck" and needs one last fee. Block their numbers, emails, and social media profiles.
-2.  **Realize Legitimate Winnings:** Understand that legitimate lotteries, promotions, or giveaways (especially those you didn't explicitly enter) DO NOT require winners to pay any fees, taxes, or charges upfront to receive their prizes. If they ask for money, it is 100% a scam. Taxes on legitimate large winnings are usually handled differently, often deducted by the lottery organizer or paid directly to tax authorities by the winner AFTER receiving the prize, not to the lottery "agent."
-3.  **Gather ALL Evidence:** Collect copies/screenshots of the initial scam message (SMS, email, social media DM, pop-up), all subsequent communication, payment receipts/proofs for every fee paid, contact details used by the scammers (phone numbers, email addresses, bank accounts), any fake "winner certificates" or documents they sent.
-4.  **Contact Your Bank Immediately (If Bank Payments Made):** As per the drafted email, to report the fraudulent transactions.
-5.  **File Detailed Reports with Law Enforcement:**
-    * Nigerian Police Force (NPF): Provide all details and evidence.
-    * Economic and Financial Crimes Commission (EFCC): Especially if significant money was lost or it involves cross-border elements or organized fraud.
-6.  **Report to Relevant Authorities/Companies:**
-    * **Nigerian Communications Commission (NCC):** Report scam SMS messages or phone calls. They have channels for reporting unsolicited and fraudulent communications (e.g., the 195 DND service might have reporting options, or check NCC website for scam reporting).
-    * **Impersonated Company:** If the scammers used the name of a real company (e.g., MTN, Dangote, Coca-Cola, Google), report the scam to that company's official customer service or fraud department. They can issue public warnings.
-    * **Email Provider:** If the scam came via email, report it as phishing or spam to your email provider (e.g., Gmail, Yahoo).
-    * **Social Media Platform:** If the scam was promoted via Facebook, Instagram, etc., report the fraudulent post or profile.
-7.  **Protect Personal Information:** If you shared sensitive PII like NIN, BVN, or bank details, monitor your accounts closely for identity theft. Inform your bank about any compromised details.
-8.  **Warn Others:** Share your experience (anonymously if preferred) with friends, family, and in online communities to raise awareness about this specific lottery/prize scam and the tactics/names used.
-9.  **Be Skeptical:** If you receive an unexpected notification that you've won a large prize for a competition you don't remember entering, it's almost certainly a scam. Do not engage.
-"""
-
-FAKE_PRODUCT_VENDOR_INPERSON_SCAM_SYSTEM_PROMPT_DETAILS = """
-This user was a victim of a 'Fake Product or Fake Vendor Scam' in an in-person transaction.
-
-**Police Report Draft Specifics for Fake Product/Vendor (In-Person):**
-- **Incident Details:** Date, approximate time, and specific location of the purchase (e.g., 'Shop C45, Computer Village, Ikeja,' 'Textile section, Balogun Market, Lagos Island,' 'Street vendor at Oshodi bus stop,' 'Inside a specific plaza at [Market Name]').
-- **Vendor Description:** If possible, a detailed description of the vendor(s): approximate age, gender, height, build, complexion, clothing, tribal marks, accent, any known name, alias, or shop name/number they used. Note if they worked alone or with others.
-- **Product Details (Promised vs. Received):**
-    * **Promised Product:** Full and detailed description of the item the victim intended to purchase (e.g., "original Samsung Galaxy S23 Ultra, brand new, sealed box," "authentic Nike Air Jordan sneakers, size 10," "genuine HP laptop Model Spectre x360, 16GB RAM," "original [Designer Perfume Name] 100ml EDP").
-    * **Received Product:** Detailed description of the item actually received (e.g., "a counterfeit Samsung phone that freezes constantly and has poor camera quality," "fake Nike sneakers with poor stitching and wrong logo," "an old, refurbished, or different model HP laptop in a resealed box," "a diluted or fake perfume with no lasting scent," "an empty box after a distraction switch").
-    * Note any discrepancies in packaging, serial numbers, branding, quality, or functionality.
-- **Transaction Details:** Agreed price and the actual amount paid. Method of payment (cash – specify denominations if recalled; POS transfer – get merchant name from receipt/alert; direct bank transfer to vendor's account).
-- **Deception Tactics:** How the vendor deceived the victim (e.g., high-pressure sales, showed a genuine item then swapped it for a fake one during packaging – "sleight of hand," false claims of originality or warranty, distraction techniques).
-- **Discovery of Fraud:** How and when the product was discovered to be fake, counterfeit, or non-functional (e.g., "tested it thoroughly at home and it wouldn't perform as expected," "took it to an authorized dealer/expert who confirmed it was counterfeit," "compared it to a known genuine item and noticed major differences," "perfume scent disappeared in minutes").
-- **Attempts to Rectify (If Any):** Did the victim attempt to return to the vendor? What was the outcome (e.g., vendor denied sale, became aggressive, shop was closed/non-existent on return)?
-- **Evidence:** Mention availability of the fake product itself, any original (even if fake) packaging, receipts if provided (even informal ones), photos/videos of the vendor or their stall if safely taken.
-
-**Bank Complaint Email Draft Specifics for Fake Product/Vendor (In-Person):**
-- **If Payment via POS or Bank Transfer (and vendor is somewhat identifiable/traceable):**
-    - Subject: "URGENT: Disputed POS/Bank Transfer Transaction - Purchase of Counterfeit/Fake Goods - Account [Your Account Number]"
-    - "I am writing to dispute a POS transaction / bank transfer made on [Date] at [Time] for the purchase of [Product Name] from a vendor at [Location/Shop Name], which has subsequently been confirmed as counterfeit/fake/grossly misrepresented."
-    - "The agreed item was [Description of genuine item], but I received [Description of fake item]. The vendor, [Vendor Name/Description if known], operating at [Location], deceived me."
-    - Transaction details: Date, time, amount, your account, merchant name on POS slip (if available and legible), or beneficiary account details for a transfer.
-    - Request: "I request an investigation into this fraudulent transaction. Please advise on the possibility of a chargeback (for POS card payment) or any action that can be taken regarding the merchant/beneficiary account. I have reported/am reporting this to the NPF and relevant consumer protection agencies."
-- **If Paid in Cash:** This section should state "Not Applicable as payment was made in cash. Bank involvement is not relevant for direct recovery of cash paid."
-
-**Next Steps Checklist Specifics for Fake Product/Vendor (In-Person):**
-1.  **Prioritize Safety:** If you realize the fraud immediately and are still at the location, assess the situation. If the vendor is aggressive or the environment feels unsafe, do NOT attempt a direct confrontation that could lead to harm. Your safety is paramount.
-2.  **Gather/Preserve Evidence:** Keep the fake product, all original packaging (even if it looks genuine, it might have clues), any receipts (no matter how informal), and any photos/videos you might have discreetly and safely taken of the vendor, their stall, or the location. Note down the vendor's description immediately.
-3.  **File a Police Report:** With the Nigerian Police Force (NPF), especially if the item was of significant value or if you believe the vendor is part of a larger counterfeit operation. Provide all details and evidence.
-4.  **Report to Market Associations/Management:** If the purchase was made in a recognized market (e.g., Computer Village, Alaba, Balogun), report the incident to the market's union or management office. They sometimes have internal mechanisms for dealing with fraudulent sellers or can help identify them.
-5.  **Report to Consumer Protection & Standards Bodies:**
-    * **Federal Competition and Consumer Protection Commission (FCCPC):** For issues of fake, substandard, or misrepresented goods. (fccpc.gov.ng)
-    * **Standards Organisation of Nigeria (SON):** If the goods are counterfeit and violate Nigerian quality standards, especially for electronics, building materials, food/drugs (though NAFDAC handles food/drugs primarily). (son.gov.ng)
-    * **National Agency for Food and Drug Administration and Control (NAFDAC):** If the fake product was food, drugs, cosmetics, or medical devices. (nafdac.gov.ng)
-6.  **Contact Your Bank (If Paid Electronically):** As per the drafted email.
-7.  **Document Everything:** Write a detailed account of the incident for your records while it's fresh.
-8.  **Future In-Person Purchases (Especially in Informal Markets):**
-    * **Research & Referrals:** For high-value items (electronics, appliances), try to buy from authorized dealers or highly reputable stores. Ask for recommendations from trusted sources.
-    * **Inspect Thoroughly:** Examine products carefully before paying. For electronics, insist on testing them (power on, check basic functions, look for signs of tampering or previous use if sold as new). Compare with images of genuine products online if unsure.
-    * **Verify Originality:** Learn to spot signs of counterfeit goods for items you frequently buy (e.g., packaging quality, logos, serial numbers, software on phones).
-    * **Be Wary of "Too Good To Be True" Prices:** Significantly lower prices than official retailers often indicate fakes or stolen goods.
-    * **Get Clear Receipts:** Insist on a receipt that includes the seller's name/shop name, address, date, item description, and price. For valuable items, ask about warranty and return policies (though these may not be honored by scammers).
-    * **Consider Going with Someone Knowledgeable:** If buying specialized items (like complex electronics), go with a friend or contact who is knowledgeable about them.
-    * **Trust Your Instincts:** If a vendor seems evasive, overly pushy, or the situation feels off, walk away.
-"""
-
-BUS_TRANSPORT_SCAM_SYSTEM_PROMPT_DETAILS = """
-This user was a victim of a 'Bus/Transport Scam' (e.g., "One Chance" robbery, theft by criminals posing as passengers/drivers, drugging and theft in public transport).
-
-**Police Report Draft Specifics for Bus/Transport Scam:**
-- **Incident Details:** Date, exact time of boarding, and specific route of the vehicle (e.g., 'Boarded at Berger bus stop, heading towards Ikeja,' 'Incident occurred between Mile 2 and Oshodi on the Apapa-Oshodi Expressway'). Note the time the actual crime started and ended, and where the victim was eventually dropped off or managed to escape.
-- **Vehicle Description:** Type of vehicle (e.g., danfo bus - yellow with black stripes, unpainted Siena minivan, keke napep/tricycle, private car acting as taxi/kabu-kabu), color, license plate number (crucial if seen, even partially), any unique markings, stickers, or damage on the vehicle. Name of transport park if boarded there (e.g., "Oshodi Under-Bridge Park," "Mazamaza Park").
-- **Perpetrators:** Number of criminals involved (driver, "conductor," fake passengers). Detailed descriptions if possible for each: gender, approximate age, height, build, complexion, clothing, hairstyles, tribal marks, accents, specific roles they played (e.g., who drove, who collected money, who threatened, who searched bags). Any names or aliases used.
-- **Modus Operandi (How the Scam/Robbery Unfolded):**
-    * Initial interaction (e.g., normal boarding, offered a shared ride).
-    * When and how the situation turned hostile (e.g., vehicle diverted from normal route, doors locked, threats made).
-    * Weapons used or implied (knives, guns, blunt objects).
-    * Specific actions of perpetrators (e.g., demanded phones and PINs, forced victim to reveal online banking passwords, searched bags and pockets, physically assaulted).
-    * If victim was drugged: what substance was suspected (e.g., offered a drink/snack, a substance sprayed in the vehicle), what were the effects.
-    * If forced to withdraw money: locations of ATMs visited, amounts withdrawn from each, time of withdrawals.
-- **Stolen Items - Comprehensive List & Value:**
-    * Cash: Exact amount and currency.
-    * Phones: Make, model, color, estimated current value. List any important apps or data on them.
-    * Bank ATM/Debit/Credit Cards: For EACH card - Issuing Bank Name, Card Type, Card Number (if known).
-    * Financial Losses from Forced Transactions: Amounts, dates, times, beneficiary accounts if transfers were forced.
-    * IDs: NIN, Driver's License, Voter's Card, Passport, Office/Student ID.
-    * Other Valuables: Laptop (make, model), jewelry (describe), watches, bags, documents, keys. Provide estimated replacement value for all items.
-- **Injuries Sustained:** Describe any physical injuries (bruises, cuts, etc.) or psychological trauma.
-- **Witnesses:** Were other passengers also victims or were they part of the gang? Any external witnesses if the incident occurred in a visible area?
-
-**Bank Complaint Email Draft Specifics for Bus/Transport Scam:**
-- **This is URGENT if bank cards were stolen OR if victim was forced to make ATM withdrawals/transfers.**
-- Subject: "URGENT: Stolen Cards & Coerced Transactions During 'One Chance' Robbery - Account(s) [Your Account Numbers]"
-- "I am writing to report the theft of my bank card(s) and/or coerced financial transactions from my account(s) during a violent robbery incident (commonly known as 'One Chance') on [Date] at approximately [Time], while I was a passenger in a [Vehicle Type] on the [Route/Location] route."
-- **If Cards Stolen:** "The following card(s) were forcibly taken: [List each card: Bank Name, Card Type, Last 4 digits if known]."
-- **If Forced Transactions:** "Under duress and threat to my life/safety, I was forced to:
-    * Make ATM withdrawal(s) totaling [Total Amount] from [ATM Location(s) if known] using my [Bank Name] card.
-    * Transfer [Amount] from my [Bank Name] account [Your Account Number] to beneficiary account [Scammer's Account Name, Number, Bank]." (List all such transactions).
-- **Request to Bank:**
-    1. "I request the IMMEDIATE and PERMANENT BLOCKING of all stolen/compromised cards to prevent any further unauthorized use."
-    2. "I formally DISPUTE all transactions made under duress or after my cards were stolen, including [List specific forced transactions with details: date, time, amount, type, location/beneficiary]."
-    3. "Please investigate these fraudulent and coerced activities and advise on your bank's policy for such incidents, including potential liability and reimbursement as per CBN guidelines."
-    4. "Provide guidance on securing my accounts (PIN changes, new cards) and a reference number for this report."
-
-**Next Steps Checklist Specifics for Bus/Transport Scam:**
-1.  **Prioritize Personal Safety & Medical Attention:** If you are in a safe location, assess any injuries. If injured or if you suspect you were drugged (common in some "One Chance" incidents), seek URGENT medical attention at a hospital or clinic. Inform medical staff about potential drugging for appropriate tests/treatment.
-2.  **Report to Nigerian Police Force (NPF) IMMEDIATELY:** Go to the nearest police station (ideally one covering the area of the incident or where you were dropped). Provide a very detailed report. The more details about the vehicle, suspects, and route, the better. Insist on an official police report extract/case number. This is vital.
-3.  **Contact ALL Your Banks IMMEDIATELY (If Cards Stolen/Used):** Call their 24/7 fraud lines to block all compromised cards and report coerced transactions. Follow up with the drafted email. This is extremely time-sensitive to limit financial damage.
-4.  **Block SIM Card & Phone (If Stolen):** Contact your mobile network provider (MTN, Glo, Airtel, 9mobile) to block your SIM card(s) and request the phone's IMEI be blacklisted. This prevents unauthorized use of your line for calls or potentially accessing OTPs for other accounts if SMS forwarding was set up by scammers.
-5.  **Report Loss of ID Documents:** Contact NIMC (NIN), FRSC (Driver's License), INEC (Voter's Card), NIS (Passport), and your employer/school (for work/student IDs) to report the theft and start replacement processes.
-6.  **Change Online Passwords:** If your phone was stolen and had access to sensitive apps (email, banking, social media) without strong, immediate authentication, change the passwords for those accounts from a secure device AS SOON AS POSSIBLE. Enable 2FA on everything.
-7.  **Document Everything:** As soon as you can, write down every detail you remember about the incident, vehicle, suspects, conversations, timeline. This aids your memory for official reports.
-8.  **Inform Transport Union/Park Management:** If you boarded the vehicle at a registered motor park, report the incident to the park's union officials (e.g., NURTW). They may have records of vehicles operating from their park or be able to assist police in identifying rogue operators.
-9.  **Seek Psychological Support:** Being a victim of "One Chance" or a violent transport scam is highly traumatic. Talk to trusted friends, family, or seek professional counseling to deal with the emotional aftermath (fear, anxiety, PTSD).
-10. **Future Travel Safety in Nigeria:**
-    * Be extremely cautious with unpainted/unmarked commercial vehicles ("kabu kabu"), especially at night, in isolated areas, or if they have few passengers or suspicious-looking occupants.
-    * Prefer vehicles from well-known, registered motor parks or use reputable app-based ride-hailing services (Bolt, Uber) where available and if you feel safe with their verification systems.
-    * Avoid boarding vehicles that are already mostly full of only men (a common "One Chance" setup) or if the driver/conductor seem overly aggressive or eager.
-    * Note vehicle license plates before boarding if possible and discreetly send to a trusted contact. Share your live location.
-    * Be wary of accepting food, drinks, or even handkerchiefs from strangers in public transport.
-    * If a vehicle deviates from the known route or if you feel uneasy, try to raise an alarm or alight at the very next busy, safe, and well-lit location.
-    * Limit valuables carried, especially in high-risk areas or times.
-"""
-
-FAKE_BANK_ALERT_SCAM_SYSTEM_PROMPT_DETAILS = """
-This user was a victim of a 'Fake Bank Alert Scam' (typically a seller who released goods/services after being shown a fraudulent SMS credit alert by a buyer).
-
-**Police Report Draft Specifics for Fake Bank Alert Scam:**
-- **Victim Role:** Clearly state the victim was a seller of goods/services.
-- **Transaction Details:** Specific item(s) sold or service(s) rendered. Agreed price and currency.
-- **Incident Details:** Date, exact time, and location where the transaction and presentation of the fake alert occurred (e.g., victim's shop, buyer's location for delivery, online platform meeting point).
-- **"Buyer" (Scammer) Description:** Any details about the scammer: physical appearance (if in person), name given (likely fake), phone number used for communication or from which the fake SMS might have appeared to originate, vehicle used (if any), online profile details if the initial contact was online.
-- **Fake Alert Details:**
-    * How the fake proof of payment was presented (e.g., showed SMS on their phone, claimed to have sent a transfer and that alert would come, showed a doctored screenshot of a transfer).
-    * The exact wording of the fake SMS bank credit alert if recalled or if a screenshot was taken by the victim (e.g., sender name displayed like "[Bank Name]", amount, transaction ID if any, date/time on alert).
-    * The phone number that displayed the fake alert, if different from their communication number.
-- **Discovery of Fraud:** How and when the victim discovered the alert was fake and no funds were actually credited (e.g., checked actual bank account balance or statement via official bank app/USSD/internet banking later and found no corresponding credit, bank confirmed no such transaction).
-- **Loss Incurred:** Total value of goods or services lost due to the scam.
-- **Evidence:** Mention availability of screenshots of the fake alert, communication with the buyer, details of goods sold.
-
-**Bank Complaint Email Draft Specifics for Fake Bank Alert Scam:**
-- **This is primarily for the victim's (seller's) own bank, mainly for notification and confirmation of non-payment, not typically for fund recovery from the victim's bank unless the victim's account itself was somehow compromised in the process (rare for this scam type).**
-- Subject: "Notification of Fraudulent Transaction Attempt & Fake Bank Alert - Account [Your Account Number]"
-- "I am writing to formally notify [Your Bank Name] that I was the target of a fraudulent scheme on [Date] at approximately [Time]. A supposed buyer, [Buyer's Name/Details if known], claimed to have made a payment of [Amount] into my account [Your Account Number] for [Goods/Services Sold] and presented a fake SMS credit alert as proof."
-- "The SMS alert appeared to be from '[Bank Name shown on fake alert, e.g., Your Bank or Another Bank]' and indicated a credit of [Amount]. Based on this deceptive alert, I released the goods/services."
-- "I have since meticulously checked my account [Your Account Number] via [Method of check, e.g., official bank app, internet banking] and can confirm that no such funds were ever credited. This was a deliberate attempt to defraud me using a counterfeit bank alert."
-- Request:
-    1. "Please formally confirm from your records that no such credit of [Amount] from [Buyer's details if they claimed a specific originating bank/account] was received into my account on or around [Date]."
-    2. "I am reporting this incident to the Nigerian Police Force. This notification is for your bank's awareness of this fraud tactic."
-    3. "If the fake alert purported to be from your bank, please be aware of this impersonation."
-    4. "If the scammer provided any (even fake) details of an account they supposedly transferred from, and if that account is with your bank, I request you investigate it for potential fraudulent use." (This is a long shot but worth including if such details exist).
-
-**Next Steps Checklist Specifics for Fake Bank Alert Scam:**
-1.  **Verify ALL Payments Independently:**
-    * **Golden Rule for Sellers:** ALWAYS confirm receipt of funds *directly* in your actual bank account balance by using your official bank app, USSD banking code for balance check, internet banking portal, or by checking a printed bank statement.
-    * **NEVER rely solely on SMS alerts, email confirmations, or screenshots of payment provided by the buyer.** These are extremely easy to fake or manipulate. Wait until you see the money reflected in your *own* available balance.
-2.  **Gather ALL Evidence:**
-    * Any details of the "buyer" (physical description if in person, phone number(s) used for calls/SMS/WhatsApp, online profile if applicable).
-    * Description and value of goods/services sold.
-    * Time and location of the transaction.
-    * A screenshot or exact transcription of the fake SMS alert if possible. Note the sender ID/number it came from.
-    * Any chat messages or communication with the buyer.
-3.  **File a Detailed Police Report:** With the Nigerian Police Force (NPF). Provide all evidence. This is important for documenting the crime and for any (even slim) chance of tracing the scammer if they used traceable details like a real phone number linked to them or were caught on CCTV.
-4.  **Inform Your Bank:** As per the drafted email, to get official confirmation of non-payment and to make them aware of the fraud type.
-5.  **If Scammer's Details Known (Even Potentially Fake):** If the scammer provided any bank account details they claimed to be paying from, or if they were identifiable (e.g., a known local individual, CCTV footage from your shop), include all this in your police report. The police might be able to investigate further.
-6.  **Business Staff Training:** If you run a business with staff handling payments, train them rigorously on verifying payments directly in the company's bank account before releasing goods. Implement clear procedures.
-7.  **Use Reliable Payment Confirmation Methods:**
-    * For in-person sales, encourage POS payments where the transaction success is confirmed on the terminal and you get a merchant receipt.
-    * For transfers, have your banking app or USSD code ready to check your balance in real-time.
-8.  **Report to Online Platform (If Applicable):** If the initial contact or transaction was facilitated through an online marketplace or social media, report the scammer's profile to that platform.
-9.  **Warn Other Sellers:** Share your experience (anonymously if needed) in business groups, market associations, or online forums to alert other sellers to this common scam tactic and any specific details about the scammer you noted.
-10. **Review Security:** If you have a physical store, review CCTV footage if available to get images of the scammer.
-"""
-
-DONATION_INPERSON_SCAM_SYSTEM_PROMPT_DETAILS = """
-This user was a victim of an 'In-Person Donation Scam' (e.g., fake collectors on the street for religious causes, medical emergencies, or non-existent orphanages).
-
-**Police Report Draft Specifics for In-Person Donation Scam:**
-- **Incident Details:** Date, approximate time, and specific location where the donation was solicited (e.g., 'At a major bus stop like Ojota,' 'Street collector near Shoprite, Ikeja City Mall,' 'Door-to-door solicitation in Dolphin Estate, Ikoyi,' 'In traffic at Maryland junction').
-- **Solicitor(s) Description:** Detailed description of the person(s) soliciting donations:
-    * Number of individuals (lone solicitor, group).
-    * Gender, approximate age, height, build, complexion.
-    * Clothing (any specific attire, e.g., religious garments, fake uniforms, t-shirts with a "charity" logo).
-    * Any distinguishing features (scars, tribal marks, accent, specific mannerisms).
-    * Any props used (e.g., collection tins/boxes with labels, laminated ID cards – describe them, fake medical reports or photos of "sick" individuals).
-- **Purported Cause/Organization:** The specific cause or organization for which the donation was being collected (e.g., "for urgent surgery for a child named [Fake Name] with [Fake Illness]," "to support [Fake Name] Orphanage in [Fake Location]," "for a church/mosque building project for [Fake Religious Body Name]," "for victims of [Recent Local/National Incident, but fake collection]").
-- **Solicitation Method:** How they approached and appealed for donation (e.g., highly emotional story, guilt-tripping, showing distressing (often fake) pictures, claiming affiliation with a known (but impersonated) organization).
-- **Donation Details:** Amount of money donated by the victim. Method of payment (almost always cash for this scam type; specify denominations if recalled).
-- **Reasons for Suspecting Fraud:** How the victim later realized or suspected it was a scam (e.g., saw the same person(s) later in a different location with a completely different emergency story, the "organization" or cause is unverifiable upon checking, aggressive or evasive behavior when asked for more details, research showed the appeal was a known scam type).
-- **Evidence:** Mention if any photos of the solicitors were discreetly taken (advise caution), or if any pamphlets/materials they gave were kept (even if rudimentary).
-
-**Bank Complaint Email Draft Specifics for In-Person Donation Scam:**
-- This will almost always be: **"Not Applicable as payment was made in cash."**
-- The AI should state this clearly.
-- If, in an extremely rare and unusual circumstance for this type of street scam, a POS terminal was used by the "collectors" or a direct bank transfer was made to an account they provided *and* this account can be linked to the fraud, then a complaint could be drafted similar to a fake vendor scenario. However, the prompt should emphasize cash is the norm and thus bank involvement is usually nil for recovery.
-
-**Next Steps Checklist Specifics for In-Person Donation Scam:**
-1.  **Prioritize Personal Safety:** If you realize it's a scam immediately after or during the interaction, do NOT confront the scammers if they seem aggressive or if you are in an isolated/unsafe situation. Your safety comes first.
-2.  **Note Details Immediately:** As soon as you can, write down every detail you remember about the solicitor(s) – appearance, clothing, story told, location, time, any props used.
-3.  **Report to Local Security/Authorities (If Safe & Feasible):** If you are in a place with on-site security (e.g., shopping mall, managed estate, event venue) or if police officers are visibly present nearby, you *could* discreetly report the suspicious individuals to them immediately if you feel safe doing so.
-4.  **File a Police Report:** With the Nigerian Police Force (NPF) at the station covering the area where the solicitation occurred. Provide your detailed description of the individuals and their modus operandi. While recovery of small cash donations is unlikely, reporting helps police track patterns, identify organized groups, and potentially warn the public if it's a recurring issue in an area.
-5.  **Verify Before Donating (Future Prevention):**
-    * **Be Wary of Unsolicited Street Collections:** Especially those using high-pressure tactics, overly emotional stories without verifiable proof, or those who cannot provide clear, legitimate identification and information about their organization.
-    * **Ask for ID & Information:** Legitimate fundraisers for registered charities usually carry clear identification, official authorization letters, and can provide information about their organization (registration number, website, physical address, contact for verification).
-    * **Check Charity Registration:** For Nigerian charities, you can try to verify their existence and legitimacy with the Corporate Affairs Commission (CAC) if they claim to be a registered NGO/Incorporated Trustee.
-    * **Donate Through Official Channels:** If you are moved by a cause or wish to support an organization, it's always safer to donate directly through their official website, official bank account (in the organization's name, not a personal account), or at their registered office, rather than to unknown individuals on the street.
-    * **Research the Cause/Organization:** Do a quick online search for the charity or cause, especially if it's an urgent appeal for an individual. Look for news reports, official campaign pages, or warnings from others.
-6.  **Report to Community/Estate Management:** If such solicitations are happening frequently within a private residential estate, market, or business complex, report it to the estate security, residents' association, or market union management. They may be able to restrict access or issue warnings.
-7.  **Warn Others:** Share your experience and descriptions of the scammers (if safe to do so) with friends, family, colleagues, or in local community WhatsApp groups/social media pages to alert others to be cautious.
-"""
-
-OTHER_SCAMS_SYSTEM_PROMPT_DETAILS = """
-This user has experienced a scam not specifically listed, or has chosen 'Other Scams'.
-Your goal is to provide the most helpful general advice possible based on their description.
-The AI should analyze the user's description to identify core elements of the scam (e.g., deception, financial loss, impersonation, online/offline, PII compromise) and tailor the advice accordingly, drawing from principles of other scam types if applicable.
-
-**Police Report Draft Specifics for Other Scams:**
-- **Core Instruction:** "Based on the user's description of this 'Other Scam', construct the most logical and comprehensive police report possible. Focus on clearly documenting:"
-    * **Who:** Victim details (already provided), Scammer details (any names, contacts, descriptions).
-    * **What:** What was promised, what was lost (money, goods, information, time), what was the deceptive act.
-    * **When:** Dates and times of key interactions, payments, discovery of scam.
-    * **Where:** Location of interactions (online platforms, physical addresses, phone calls).
-    * **How:** The method or modus operandi of the scammer(s).
-- **Key Information to Elicit (if not clear from description):** The AI should aim to structure the report to include any known details about the scammer (contact info, online profiles, bank accounts if money was sent), the exact sequence of events, the precise nature of the misrepresentation or fraud, and the total value of the loss.
-- **Evidence:** Advise the user to list and prepare any available evidence (e.g., messages, emails, payment proofs, photos, documents).
-
-**Bank Complaint Email Draft Specifics for Other Scams:**
-- **Applicability:** "Assess if a bank complaint is relevant based on the user's description. If a financial transaction was made via a bank account/card due to the scam, or if bank account details were compromised, then a bank complaint is relevant."
-- **If Relevant:**
-    - "Advise the user to clearly explain the unique situation and the nature of the fraud to their bank."
-    - "Instruct them to list all relevant transaction details (dates, amounts, beneficiaries, your account)."
-    - "The email should request an investigation, advice on fund recall or dispute possibilities, and security measures for their account."
-    - "Example phrasing: 'I am writing to report a fraudulent transaction/account compromise related to a scam that occurred on [Date]. The details are as follows: [User's Description Summary]. I request your urgent assistance in investigating this matter...'"
-- **If Not Directly Bank-Related:** State "A direct bank complaint for fund recovery may not be applicable if the primary loss did not involve a direct transaction from your bank account or compromise of your bank credentials. However, if any of your financial information was shared, it's wise to inform your bank for monitoring purposes."
-
-**Next Steps Checklist Specifics for Other Scams:**
-- **Prioritize Based on Description:** The checklist should be dynamically prioritized based on the nature of the "Other Scam."
-1.  **Secure Yourself/Assets:** If there's ongoing risk (e.g., compromised accounts, physical threat), address that first.
-2.  **Gather ALL Evidence:** Stress the importance of collecting and preserving any messages, emails, screenshots, payment records, names, numbers, websites, etc., related to the scam.
-3.  **Report to Nigerian Police Force (NPF):** This is almost always a primary step. Provide all gathered evidence.
-4.  **Report to Bank(s) (If Applicable):** If financial accounts or transactions were involved, contact the bank(s) immediately.
-5.  **Report to Other Relevant Agencies (Identify based on scam elements):**
-    * **EFCC:** For significant financial fraud, cybercrime elements.
-    * **FCCPC:** If it involves a deceptive business practice, faulty goods/services from a company.
-    * **NCC:** If telecom services (phone numbers, SMS) were heavily used in the scam.
-    * **NIMC/Banks (for BVN):** If PII like NIN or BVN was compromised.
-    * **Platform Reporting:** If the scam occurred on a specific online platform (social media, e-commerce, forum), report the scammer and activity to that platform.
-6.  **Change Passwords & Enhance Security:** If any online accounts, credentials, or devices were involved or compromised. Enable 2FA.
-7.  **Warn Others (If Appropriate):** If the scam could affect others in their community or network, advise cautious sharing of information to prevent further victims.
-8.  **Beware of Recovery Scams:** A general warning that scammers often re-target victims with promises of recovering lost funds for a fee.
-9.  **Seek Support:** Encourage talking to trusted individuals or seeking professional support if the scam has caused significant distress.
-10. **Document Everything:** Keep a log of all actions taken, people contacted, reference numbers received.
-- **Final Advice:** "Since this scam is unique, providing as much detail as possible to the authorities will be key. If you can identify which category your scam most closely resembles from our other listed types, some of the advice there might also be helpful."
-"""
-
-
-# --- Combining the base prompt with each unique prompt details......
-PHISHING_SCAM_SYSTEM_PROMPT = BASE_SYSTEM_PROMPT_STRUCTURE + PHISHING_SCAM_SYSTEM_PROMPT_DETAILS
-ROMANCE_SCAM_SYSTEM_PROMPT = BASE_SYSTEM_PROMPT_STRUCTURE + ROMANCE_SCAM_SYSTEM_PROMPT_DETAILS
-ONLINE_MARKETPLACE_SCAM_SYSTEM_PROMPT = BASE_SYSTEM_PROMPT_STRUCTURE + ONLINE_MARKETPLACE_SCAM_SYSTEM_PROMPT_DETAILS
-INVESTMENT_CRYPTO_SCAM_SYSTEM_PROMPT = BASE_SYSTEM_PROMPT_STRUCTURE + INVESTMENT_CRYPTO_SCAM_SYSTEM_PROMPT_DETAILS
-JOB_OFFER_SCAM_SYSTEM_PROMPT = BASE_SYSTEM_PROMPT_STRUCTURE + JOB_OFFER_SCAM_SYSTEM_PROMPT_DETAILS
-TECH_SUPPORT_SCAM_SYSTEM_PROMPT = BASE_SYSTEM_PROMPT_STRUCTURE + TECH_SUPPORT_SCAM_SYSTEM_PROMPT_DETAILS
-FAKE_LOAN_GRANT_SCAM_SYSTEM_PROMPT = BASE_SYSTEM_PROMPT_STRUCTURE + FAKE_LOAN_GRANT_SCAM_SYSTEM_PROMPT_DETAILS
-SOCIAL_MEDIA_IMPERSONATION_SCAM_SYSTEM_PROMPT = BASE_SYSTEM_PROMPT_STRUCTURE + SOCIAL_MEDIA_IMPERSONATION_SCAM_SYSTEM_PROMPT_DETAILS
-SUBSCRIPTION_TRAP_SCAM_SYSTEM_PROMPT = BASE_SYSTEM_PROMPT_STRUCTURE + SUBSCRIPTION_TRAP_SCAM_SYSTEM_PROMPT_DETAILS
-FAKE_CHARITY_SCAM_SYSTEM_PROMPT = BASE_SYSTEM_PROMPT_STRUCTURE + FAKE_CHARITY_SCAM_SYSTEM_PROMPT_DETAILS
-DELIVERY_LOGISTICS_SCAM_SYSTEM_PROMPT = BASE_SYSTEM_PROMPT_STRUCTURE + DELIVERY_LOGISTICS_SCAM_SYSTEM_PROMPT_DETAILS
-ONLINE_COURSE_CERTIFICATION_SCAM_SYSTEM_PROMPT = BASE_SYSTEM_PROMPT_STRUCTURE + ONLINE_COURSE_CERTIFICATION_SCAM_SYSTEM_PROMPT_DETAILS
-ATM_CARD_SKIMMING_SCAM_SYSTEM_PROMPT = BASE_SYSTEM_PROMPT_STRUCTURE + ATM_CARD_SKIMMING_SCAM_SYSTEM_PROMPT_DETAILS
-PICKPOCKETING_SCAM_SYSTEM_PROMPT = BASE_SYSTEM_PROMPT_STRUCTURE + PICKPOCKETING_SCAM_SYSTEM_PROMPT_DETAILS
-REAL_ESTATE_HOSTEL_SCAM_SYSTEM_PROMPT = BASE_SYSTEM_PROMPT_STRUCTURE + REAL_ESTATE_HOSTEL_SCAM_SYSTEM_PROMPT_DETAILS
-FAKE_POLICE_OFFICIAL_IMPERSONATION_SCAM_SYSTEM_PROMPT = BASE_SYSTEM_PROMPT_STRUCTURE + FAKE_POLICE_OFFICIAL_IMPERSONATION_SCAM_SYSTEM_PROMPT_DETAILS
-POS_MACHINE_TAMPERING_SCAM_SYSTEM_PROMPT = BASE_SYSTEM_PROMPT_STRUCTURE + POS_MACHINE_TAMPERING_SCAM_SYSTEM_PROMPT_DETAILS
-LOTTERY_OR_YOUVE_WON_SCAM_SYSTEM_PROMPT = BASE_SYSTEM_PROMPT_STRUCTURE + LOTTERY_OR_YOUVE_WON_SCAM_SYSTEM_PROMPT_DETAILS
-FAKE_PRODUCT_VENDOR_INPERSON_SCAM_SYSTEM_PROMPT = BASE_SYSTEM_PROMPT_STRUCTURE + FAKE_PRODUCT_VENDOR_INPERSON_SCAM_SYSTEM_PROMPT_DETAILS
-BUS_TRANSPORT_SCAM_SYSTEM_PROMPT = BASE_SYSTEM_PROMPT_STRUCTURE + BUS_TRANSPORT_SCAM_SYSTEM_PROMPT_DETAILS
-FAKE_BANK_ALERT_SCAM_SYSTEM_PROMPT = BASE_SYSTEM_PROMPT_STRUCTURE + FAKE_BANK_ALERT_SCAM_SYSTEM_PROMPT_DETAILS
-DONATION_INPERSON_SCAM_SYSTEM_PROMPT = BASE_SYSTEM_PROMPT_STRUCTURE + DONATION_INPERSON_SCAM_SYSTEM_PROMPT_DETAILS
-OTHER_SCAMS_SYSTEM_PROMPT = BASE_SYSTEM_PROMPT_STRUCTURE + OTHER_SCAMS_SYSTEM_PROMPT_DETAILS
-
-
-#Prompt Mapping Dictionary 
-PROMPT_MAPPING = {
-    "Phishing Scam": PHISHING_SCAM_SYSTEM_PROMPT,
-    "Romance Scam": ROMANCE_SCAM_SYSTEM_PROMPT,
-    "Online Marketplace Scam": ONLINE_MARKETPLACE_SCAM_SYSTEM_PROMPT,
-    "Investment or Cryptocurrency Scam": INVESTMENT_CRYPTO_SCAM_SYSTEM_PROMPT,
-    "Fake Job Offer Scam": JOB_OFFER_SCAM_SYSTEM_PROMPT,
-    "Tech Support Scam": TECH_SUPPORT_SCAM_SYSTEM_PROMPT,
-    "Fake Loan or Grant Scam": FAKE_LOAN_GRANT_SCAM_SYSTEM_PROMPT,
-    "Social Media Impersonation Scam": SOCIAL_MEDIA_IMPERSONATION_SCAM_SYSTEM_PROMPT,
-    "Subscription Trap Scam": SUBSCRIPTION_TRAP_SCAM_SYSTEM_PROMPT,
-    "Fake Charity Scam (Online)": FAKE_CHARITY_SCAM_SYSTEM_PROMPT, 
-    "Delivery/Logistics Scam": DELIVERY_LOGISTICS_SCAM_SYSTEM_PROMPT,
-    "Fake Online Course or Certification Scam": ONLINE_COURSE_CERTIFICATION_SCAM_SYSTEM_PROMPT,
-    "ATM Card Skimming": ATM_CARD_SKIMMING_SCAM_SYSTEM_PROMPT,
-    "Pickpocketing with Distraction": PICKPOCKETING_SCAM_SYSTEM_PROMPT,
-    "Real Estate/Hostel Scam (Fake Agent)": REAL_ESTATE_HOSTEL_SCAM_SYSTEM_PROMPT,
-    "Fake Police or Official Impersonation": FAKE_POLICE_OFFICIAL_IMPERSONATION_SCAM_SYSTEM_PROMPT,
-    "POS Machine Tampering": POS_MACHINE_TAMPERING_SCAM_SYSTEM_PROMPT,
-    "Lottery or You’ve Won! Scam": LOTTERY_OR_YOUVE_WON_SCAM_SYSTEM_PROMPT,
-    "Fake Product or Vendor (In-Person)": FAKE_PRODUCT_VENDOR_INPERSON_SCAM_SYSTEM_PROMPT,
-    "Bus/Transport Scam (One Chance)": BUS_TRANSPORT_SCAM_SYSTEM_PROMPT, 
-    "Fake Bank Alert Scam": FAKE_BANK_ALERT_SCAM_SYSTEM_PROMPT,
-    "Donation Scam (In-Person)": DONATION_INPERSON_SCAM_SYSTEM_PROMPT, 
-    "Other Unspecified Scam": OTHER_SCAMS_SYSTEM_PROMPT 
-}
+# The base prompt and each scam type's details live in prompts/*.md and are read on first use, so a worker
+# only holds the prompts for the scam types it has actually served.....
+PROMPTS_DIR = Path(__file__).parent / "prompts"
+DEFAULT_PROMPT_NAME = "other_scams"
+
+@functools.cache
+def load_prompt(name: str) -> str:
+    return (PROMPTS_DIR / f"{name}.md").read_text(encoding="utf-8")
+
+@functools.cache
+def build_system_prompt(name: str) -> str:
+    # Cached so every request for a scam type gets the same byte-identical str (prefix caching, cache keys)....
+    return load_prompt("base") + load_prompt(name)
+
+#Prompt Mapping Dictionary: scamType -> prompt file in prompts/ (read-only, nothing should edit it at runtime)
+PROMPT_MAPPING = types.MappingProxyType({
+    "Phishing Scam": "phishing_scam",
+    "Romance Scam": "romance_scam",
+    "Online Marketplace Scam": "online_marketplace_scam",
+    "Investment or Cryptocurrency Scam": "investment_crypto_scam",
+    "Fake Job Offer Scam": "job_offer_scam",
+    "Tech Support Scam": "tech_support_scam",
+    "Fake Loan or Grant Scam": "fake_loan_grant_scam",
+    "Social Media Impersonation Scam": "social_media_impersonation_scam",
+    "Subscription Trap Scam": "subscription_trap_scam",
+    "Fake Charity Scam (Online)": "fake_charity_scam",
+    "Delivery/Logistics Scam": "delivery_logistics_scam",
+    "Fake Online Course or Certification Scam": "online_course_certification_scam",
+    "ATM Card Skimming": "atm_card_skimming_scam",
+    "Pickpocketing with Distraction": "pickpocketing_scam",
+    "Real Estate/Hostel Scam (Fake Agent)": "real_estate_hostel_scam",
+    "Fake Police or Official Impersonation": "fake_police_official_impersonation_scam",
+    "POS Machine Tampering": "pos_machine_tampering_scam",
+    "Lottery or You’ve Won! Scam": "lottery_or_youve_won_scam",
+    "Fake Product or Vendor (In-Person)": "fake_product_vendor_inperson_scam",
+    "Bus/Transport Scam (One Chance)": "bus_transport_scam",
+    "Fake Bank Alert Scam": "fake_bank_alert_scam",
+    "Donation Scam (In-Person)": "donation_inperson_scam",
+    "Other Unspecified Scam": DEFAULT_PROMPT_NAME
+})
 
 # --- Endpoint for the docs generation 
-@app.post("/generate-documents/", response_model=GeneratedDocuments, tags=["Scam Document Generation"])
-async def generate_scam_specific_documents(report_data: ScamReportData = Body(...)):
-    # selected_system_prompt IS the template that contains the placeholder
-    selected_system_prompt_template = PROMPT_MAPPING.get(report_data.scamType, OTHER_SCAMS_SYSTEM_PROMPT)
+# Run once per worker on startup so a missing prompt file shows up in the logs at boot, not on a victim's request....
+def check_prompt_files() -> None:
+    for name in {"base", *PROMPT_MAPPING.values()}:
+        if not (PROMPTS_DIR / f"{name}.md").is_file():
+            logger.warning("Prompt file %s.md is missing from %s.", name, PROMPTS_DIR)
 
-    if not isinstance(selected_system_prompt_template, str) or not selected_system_prompt_template.strip():
-        print(f"Warning: System prompt template for scamType '{report_data.scamType}' is empty or invalid. Falling back to OTHER_SCAMS_SYSTEM_PROMPT.")
-        # Ensure OTHER_SCAMS_SYSTEM_PROMPT is correctly defined and also contains the placeholder
-        selected_system_prompt_template = OTHER_SCAMS_SYSTEM_PROMPT
+def select_system_prompt(scam_type: str) -> str:
+    try:
+        return build_system_prompt(PROMPT_MAPPING.get(scam_type, DEFAULT_PROMPT_NAME))
+    except OSError as e:
+        logger.warning("System prompt for scamType '%s' could not be read (%s). Falling back to the %s prompt.", scam_type, e, DEFAULT_PROMPT_NAME)
+        return build_system_prompt(DEFAULT_PROMPT_NAME)
 
-    return await invoke_ai_document_generation(
-        system_prompt_template=selected_system_prompt_template, # Pass it as a template
+@app.post("/generate-documents/", response_model=GeneratedDocuments, tags=["Scam Document Generation"])
+async def generate_scam_specific_documents(request: Request, response: Response, report_data: ScamReportData = Body(...)):
+    system_prompt_template = select_system_prompt(report_data.scamType)
+    cache_key = make_document_cache_key(system_prompt_template, report_data.model_dump_json())
+    etag = make_document_etag(cache_key)
+    # Client already holds the documents for this exact report, so skip the AI call and the body entirely....
+    if holds_cached_documents(request, cache_key, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=document_cache_headers(etag))
+    documents = await invoke_ai_document_generation(
+        system_prompt_template=system_prompt_template, # Pass it as a template
         report_data=report_data,
-        specific_scam_type_for_user_message=report_data.scamType
+        specific_scam_type_for_user_message=report_data.scamType,
+        cache_key=cache_key
     )
+    response.headers.update(document_cache_headers(etag))
+    return documents
+
+@app.post("/generate-documents/stream/", tags=["Scam Document Generation"], summary="Stream the generated documents as NDJSON, or as SSE with Accept: text/event-stream")
+async def stream_scam_specific_documents(request: Request, report_data: ScamReportData = Body(...)):
+    system_prompt_template = select_system_prompt(report_data.scamType)
+    cache_key = make_document_cache_key(system_prompt_template, report_data.model_dump_json())
+    etag = make_document_etag(cache_key)
+    if holds_cached_documents(request, cache_key, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=document_cache_headers(etag))
+    # Stop nginx-style proxies from buffering the stream until it ends
+    headers = {"X-Accel-Buffering": "no"}
+    # Headers go out before generation starts, so they can only vouch for documents that already exist;
+    # a fresh stream may still end in an error record, which must never be cached under the ETag
+    cached_documents = document_cache.get(cache_key)
+    if cached_documents is not None:
+        headers.update(document_cache_headers(etag))
+    media_type = "text/event-stream" if "text/event-stream" in request.headers.get("accept", "") else "application/x-ndjson"
+    return StreamingResponse(
+        stream_ai_document_generation(
+            system_prompt_template=system_prompt_template,
+            report_data=report_data,
+            specific_scam_type_for_user_message=report_data.scamType,
+            cache_key=cache_key,
+            cached_documents=cached_documents,
+            encode_record=STREAM_RECORD_ENCODERS[media_type]
+        ),
+        media_type=media_type,
+        headers=headers
+    )
+
 
+# The root payload never changes, so it is serialised once instead of on every health check....
+ROOT_RESPONSE_BODY = orjson.dumps({
+    "message": "Welcome to the ReclaimMe API! Version 2.2.2",
+    "status": "healthy",
+    "documentation_swagger": "/docs",
+    "documentation_redoc": "/redoc",
+    "note": "Use the /generate-documents/ endpoint for scam assistance, or /generate-documents/stream/ to receive the documents as they are written."
+})
+ROOT_ETAG = f'"{hashlib.blake2b(ROOT_RESPONSE_BODY, digest_size=16).hexdigest()}"'
+# Short and without "immutable": this doubles as a health check, so it shouldn't be cached long enough to hide an outage.....
+ROOT_CACHE_CONTROL = os.getenv("ROOT_CACHE_CONTROL", "public, max-age=60")
 
 @app.get("/", tags=["Root"], summary="Root path for API availability check")
-async def read_root():
-    return {
-        "message": "Welcome to the ReclaimMe API! Version 2.2.2",
-        "status": "healthy",
-        "documentation_swagger": "/docs",
-        "documentation_redoc": "/redoc",
-        "note": "Use the /generate-documents/ endpoint for scam assistance."
-    }
+async def read_root(request: Request):
+    headers = {"ETag": ROOT_ETAG, "Cache-Control": ROOT_CACHE_CONTROL}
+    if etag_matches(request, ROOT_ETAG):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=ROOT_RESPONSE_BODY, media_type="application/json", headers=headers)